@@ -0,0 +1,579 @@
+"""wxPython-Oberfläche des Gruppengenerators.
+
+Start aus dem Projektverzeichnis::
+
+    python -m GroupCalculator.GroupApp
+"""
+import math
+import os
+
+import wx
+import wx.grid
+
+try:
+    from GroupCalculator.GroupCalculator import (GroupCalculator, RosterCache, RoundRandom, SessionStore, group_index,
+                                                 group_label)
+    from GroupCalculator.worker import BackgroundWorker, JobCancelled
+except ImportError:  # Direkter Aufruf aus dem Modulverzeichnis
+    from GroupCalculator import (GroupCalculator, RosterCache, RoundRandom, SessionStore, group_index,
+                                 group_label)
+    from worker import BackgroundWorker, JobCancelled
+
+
+class GroupTable(wx.grid.GridTableBase):
+    """Virtuelle Tabelle für das Gitter in :class:`GroupApp`.
+
+    Die Zellen werden erst formatiert, wenn das Gitter sie für sichtbare Zeilen abfragt.
+    Die Tabelle hält nur den kompakten :class:`Round` der Runde und eine Referenz auf die
+    Namenstabelle des Rundenspeichers; Zeile ``i`` ist die Gruppe mit der Kennung
+    ``group_label(i)``. Ein Seitenwechsel erzeugt daher keine Dictionary-Ansicht.
+    """
+
+    COLUMNS = ("Gruppe", "Teilnehmer")
+
+    def __init__(self):
+        """Initialisiert eine leere Tabelle."""
+        super().__init__()
+        self.record = None
+        self.names = []
+
+    def set_round(self, record, names):
+        """Zeigt eine neue Runde an und meldet geänderte Zeilenzahlen an das Gitter.
+
+        :param record: Die Runde oder None für eine leere Tabelle.
+        :type record: Round
+        :param names: Die Namenstabelle, auf die sich die IDs in ``record`` beziehen.
+        :type names: list
+        """
+        old_rows = self.GetNumberRows()
+        self.record = record
+        self.names = names
+        new_rows = self.GetNumberRows()
+
+        grid = self.GetView()
+        if grid is None:
+            return
+        grid.BeginBatch()
+        if new_rows < old_rows:
+            grid.ProcessTableMessage(wx.grid.GridTableMessage(
+                self, wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED, new_rows, old_rows - new_rows))
+        elif new_rows > old_rows:
+            grid.ProcessTableMessage(wx.grid.GridTableMessage(
+                self, wx.grid.GRIDTABLE_NOTIFY_ROWS_APPENDED, new_rows - old_rows))
+        grid.EndBatch()
+
+    def GetNumberRows(self):
+        """Anzahl der Gruppen."""
+        return len(self.record) if self.record is not None else 0
+
+    def GetNumberCols(self):
+        """Anzahl der Spalten."""
+        return len(self.COLUMNS)
+
+    def IsEmptyCell(self, row, col):
+        """Keine Zelle einer vorhandenen Gruppe ist leer."""
+        return row >= self.GetNumberRows()
+
+    def GetValue(self, row, col):
+        """Formatiert eine Zelle erst bei Bedarf.
+
+        :return: Die Gruppenkennung oder die Schüler als kommagetrennter Text.
+        :rtype: str
+        """
+        if row >= self.GetNumberRows():
+            return ""
+        if col == 0:
+            return group_label(row)
+        # Schüler als Zahlen oder Namen darstellen
+        return ", ".join(map(str, map(self.names.__getitem__, self.record.group(row))))
+
+    def SetValue(self, row, col, value):
+        """Die Tabelle ist schreibgeschützt."""
+
+    def GetColLabelValue(self, col):
+        """Spaltenüberschriften."""
+        return self.COLUMNS[col]
+
+
+class GroupApp(wx.Frame):
+    """Eine wxPython-basierte GUI-Anwendung zur Erstellung und Verwaltung von Schülergruppen.
+
+    Threading: Der GroupCalculator wird ausschließlich in Aufträgen des
+    :class:`BackgroundWorker` verändert (einschließlich der CSV-Einstellungen). Der
+    GUI-Thread liest ihn nur in zugestellten Ergebnissen (dann läuft kein Auftrag) sowie
+    in :meth:`update_grid` und :meth:`on_search`, die während eines Auftrags unter der
+    Sperre des Rundenspeichers lesen, und für die Rundenanzeige (nur Zahlenwerte).
+    """
+
+    #: Wartezeit nach dem letzten Spin-Ereignis, bevor die Gruppen angepasst werden (ms).
+    SPIN_DELAY_MS = 250
+
+    def __init__(self):
+        """Initialisiert die GroupApp-Instanz."""
+        super().__init__(None, title="Gruppengenerator", size=(800, 600))
+        self.panel = wx.Panel(self)
+        self.gc = GroupCalculator(group_size=3, num_students=10)
+        self.roster_cache = RosterCache()
+        self.worker = BackgroundWorker(wx.CallAfter)
+        self._spin_timer = None
+        self._students_dirty = False
+        self._group_size_dirty = False
+        self.current_round = 0
+
+        # Schriftart für die UI
+        font = wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
+
+        # Tabelle
+        self.grid = wx.grid.Grid(self.panel)
+        self.table = GroupTable()
+        self.grid.SetTable(self.table, takeOwnership=True)
+        self.grid.SetRowLabelSize(0)
+        self.grid.SetColSize(0, 150)  # Breite der ersten Spalte
+        self.grid.SetColSize(1, 500)  # Breite der zweiten Spalte
+        self.grid.SetDefaultRowSize(30)  # Zeilenhöhe
+        self.grid.SetLabelFont(font)
+        self.grid.SetDefaultCellFont(font)
+
+        # Buttons
+        self.load_button = wx.Button(self.panel, label="CSV laden", size=(150, 40))
+        self.generate_numbers_button = wx.Button(self.panel, label="Schüler als Zahlen", size=(150, 40))
+        self.next_round_button = wx.Button(self.panel, label="Nächste Runde", size=(150, 40))
+        self.prev_round_button = wx.Button(self.panel, label="Vorherige Runde", size=(150, 40))
+        self.reset_button = wx.Button(self.panel, label="Reset", size=(150, 40))
+
+        # Eingabefelder
+        self.spin_group_size = wx.SpinCtrl(self.panel, min=2, max=10, initial=3, size=(100, 40))
+        self.spin_students = wx.SpinCtrl(self.panel, min=1, max=100, initial=10, size=(100, 40))
+
+        # Einstellungs-Widgets
+        self.delimiter_text_ctrl = wx.TextCtrl(self.panel, value=self.gc.delimiter, size=(50, 40))
+        self.skip_header_checkbox = wx.CheckBox(self.panel, label="Header überspringen")
+        self.skip_header_checkbox.SetValue(self.gc.skip_header)
+        self.first_name_col_input = wx.SpinCtrl(self.panel, min=0, max=10, initial=self.gc.first_name_col, size=(100, 40))
+        self.last_name_col_input = wx.SpinCtrl(self.panel, min=0, max=10, initial=self.gc.last_name_col, size=(100, 40))
+
+        # Rundenanzeige
+        self.round_label = wx.StaticText(self.panel, label=f"Aktuelle Runde: {self.current_round}")
+        self.round_label.SetFont(font)
+
+        # Schülersuche
+        self.search_ctrl = wx.SearchCtrl(self.panel, size=(200, 30), style=wx.TE_PROCESS_ENTER)
+        self.search_ctrl.SetDescriptiveText("Schüler suchen")
+        self.search_result = wx.StaticText(self.panel, label="")
+
+        # Layout mit wx.GridBagSizer für präzise Platzierung
+        sizer = wx.GridBagSizer(10, 10)  # Abstand zwischen den Elementen
+
+        # Tabelle
+        sizer.Add(self.grid, pos=(0, 0), span=(1, 4), flag=wx.EXPAND | wx.ALL, border=10)
+
+        # Buttons
+        sizer.Add(self.load_button, pos=(1, 0), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
+        sizer.Add(self.generate_numbers_button, pos=(1, 1), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
+        sizer.Add(self.prev_round_button, pos=(1, 2), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
+        sizer.Add(self.next_round_button, pos=(1, 3), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
+        sizer.Add(self.reset_button, pos=(1, 4), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
+
+        # Gruppengröße und Anzahl der Studenten
+        sizer.Add(wx.StaticText(self.panel, label="Gruppengröße:"), pos=(2, 0), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+        sizer.Add(self.spin_group_size, pos=(2, 1), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+        sizer.Add(wx.StaticText(self.panel, label="Anzahl der Studenten:"), pos=(2, 2), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+        sizer.Add(self.spin_students, pos=(2, 3), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+
+        # CSV-Einstellungen
+        sizer.Add(wx.StaticText(self.panel, label="CSV Delimiter:"), pos=(3, 0), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+        sizer.Add(self.delimiter_text_ctrl, pos=(3, 1), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+        sizer.Add(self.skip_header_checkbox, pos=(3, 2), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+
+        # Spalten für Vor- und Nachname
+        sizer.Add(wx.StaticText(self.panel, label="Spalte für Vorname:"), pos=(4, 0), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+        sizer.Add(self.first_name_col_input, pos=(4, 1), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+        sizer.Add(wx.StaticText(self.panel, label="Spalte für Nachname:"), pos=(4, 2), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+        sizer.Add(self.last_name_col_input, pos=(4, 3), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+
+        # Rundenanzeige
+        sizer.Add(self.round_label, pos=(5, 0), span=(1, 4), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
+
+        # Schülersuche
+        sizer.Add(self.search_ctrl, pos=(6, 0), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+        sizer.Add(self.search_result, pos=(6, 1), span=(1, 4), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
+
+        # Sizer anpassen
+        self.panel.SetSizer(sizer)
+        sizer.AddGrowableRow(0)  # Tabelle wächst vertikal
+        sizer.AddGrowableCol(0)  # Erste Spalte wächst horizontal
+        sizer.AddGrowableCol(1)
+        sizer.AddGrowableCol(2)
+        sizer.AddGrowableCol(3)
+
+        # Event-Bindings
+        self.load_button.Bind(wx.EVT_BUTTON, self.on_load_csv)
+        self.generate_numbers_button.Bind(wx.EVT_BUTTON, self.on_generate_numbers)
+        self.next_round_button.Bind(wx.EVT_BUTTON, self.on_next_round)
+        self.prev_round_button.Bind(wx.EVT_BUTTON, self.on_prev_round)
+        self.reset_button.Bind(wx.EVT_BUTTON, self.on_reset)
+        self.spin_students.Bind(wx.EVT_SPINCTRL, self.on_students_changed)
+        self.spin_group_size.Bind(wx.EVT_SPINCTRL, self.on_group_size_changed)  # Event-Handler für Gruppengröße
+        self.search_ctrl.Bind(wx.EVT_SEARCH, self.on_search)
+        self.search_ctrl.Bind(wx.EVT_TEXT_ENTER, self.on_search)
+        self.search_ctrl.Bind(wx.EVT_SEARCH_CANCEL, self.on_search_cancel)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+        # Letzte Sitzung fortsetzen bzw. eine neue Sitzung beginnen
+        self.session_path = os.path.join(self.roster_cache.directory, "sitzung.wxgs")
+        self.restore_session()
+
+    def restore_session(self):
+        """Stellt die zuletzt gespeicherte Sitzung wieder her oder beginnt ein neues Protokoll.
+
+        Ein unlesbares Protokoll wird samt Sicherungspunkt nach ``<pfad>.defekt`` verschoben,
+        bevor ein neues angelegt wird, damit es nicht überschrieben wird.
+        """
+        try:
+            self.gc = SessionStore(self.session_path).resume()
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as error:
+            damaged = f"{self.session_path}.defekt"
+            try:
+                for path, target in ((self.session_path, damaged), (f"{self.session_path}.pairs", f"{damaged}.pairs")):
+                    if os.path.exists(path):
+                        os.replace(path, target)
+            except OSError as move_error:
+                wx.MessageBox(f"Die gespeicherte Sitzung konnte nicht gelesen werden ({error}) und nicht "
+                              f"verschoben werden ({move_error}).\nDiese Sitzung wird nicht gespeichert.",
+                              "Sitzung", wx.ICON_ERROR)
+                return
+            wx.MessageBox(f"Die gespeicherte Sitzung konnte nicht gelesen werden ({error}).\n"
+                          f"Sie wurde nach {damaged} verschoben; es beginnt eine neue Sitzung.",
+                          "Sitzung", wx.ICON_WARNING)
+        else:
+            self.current_round = self.gc.get_round_count()
+            self.spin_group_size.SetValue(self.gc.group_size)
+            self.update_grid(self.current_round)
+            if self.current_round <= 1:
+                self.prev_round_button.Disable()
+            self.update_round_label()
+            return
+
+        os.makedirs(os.path.dirname(self.session_path), exist_ok=True)
+        self.gc.start_session(self.session_path)
+
+    def on_prev_round(self, event):
+        """Wechselt zur vorherigen Runde.
+
+        :param event: Das auslösende Ereignis.
+        :type event: wx.Event
+        """
+        if self.current_round > 1:
+            self.current_round -= 1
+            self.update_grid(self.current_round)
+            self.next_round_button.Enable()
+        if self.current_round == 1:
+            self.prev_round_button.Disable()
+
+        # Rundenanzeige aktualisieren
+        self.update_round_label()
+
+    def on_next_round(self, event):
+        """Erstellt eine neue Runde im Hintergrund.
+
+        :param event: Das auslösende Ereignis.
+        :type event: wx.Event
+        """
+        self.next_round_button.Disable()
+        self.worker.submit(lambda cancelled: self.gc.create_groups(), self.on_round_created, self.on_job_failed)
+
+    def on_round_created(self, result=None):
+        """Zeigt eine im Hintergrund erstellte neue Runde an."""
+        self.current_round = self.gc.get_round_count()
+        self.update_grid(self.current_round)
+
+        # Buttons aktivieren/deaktivieren
+        self.prev_round_button.Enable()
+        if self.gc.get_round_count() >= self.gc.can_repeat():
+            self.next_round_button.Disable()
+        else:
+            self.next_round_button.Enable()
+
+        # Rundenanzeige aktualisieren
+        self.update_round_label()
+
+    def on_groups_rebuilt(self, message=None):
+        """Zeigt die erste Runde nach dem Laden oder Ändern der Einstellungen an.
+
+        :param message: Optionale Erfolgsmeldung.
+        :type message: str
+        """
+        self.current_round = self.gc.get_round_count()
+        self.update_grid(self.current_round)
+        self.next_round_button.Enable()
+        self.prev_round_button.Disable()
+
+        # Rundenanzeige aktualisieren
+        self.update_round_label()
+
+        if message:
+            wx.MessageBox(message, "Erfolg")
+
+    def on_job_failed(self, error):
+        """Zeigt einen Fehler einer Hintergrundberechnung an.
+
+        :param error: Die aufgetretene Ausnahme.
+        :type error: Exception
+        """
+        self.next_round_button.Enable()
+        self.update_round_label()
+        wx.MessageBox(str(error), "Fehler", wx.ICON_ERROR)
+
+    def show_progress(self, rows, rows_per_second):
+        """Zeigt den Fortschritt beim Einlesen einer CSV-Datei an."""
+        self.round_label.SetLabel(f"{rows} Zeilen gelesen ({rows_per_second:.0f} Zeilen/s)")
+
+    def on_reset(self, event):
+        """Setzt alle Gruppen, Runden und die Tabelle zurück.
+
+        :param event: Das auslösende Ereignis.
+        :type event: wx.Event
+        """
+        def reset(cancelled):
+            self.gc.rng = RoundRandom()  # Neuer Startwert, sonst wiederholen sich die Runden
+            self.gc.reset_groups()
+
+        self.worker.submit(reset, self.on_reset_done, self.on_job_failed)
+
+    def on_reset_done(self, result=None):
+        """Aktualisiert die Anzeige nach dem Zurücksetzen."""
+        self.current_round = 0
+        self.update_grid(self.current_round)
+        self.next_round_button.Enable()
+        self.prev_round_button.Disable()
+
+        # Rundenanzeige aktualisieren
+        self.update_round_label()
+
+        wx.MessageBox("Alle Gruppen und Runden wurden zurückgesetzt.", "Reset", wx.ICON_INFORMATION)
+
+    def on_load_csv(self, event):
+        """Lädt die CSV-Datei im Hintergrund und zeigt eine Bestätigung an.
+
+        :param event: Das auslösende Ereignis.
+        :type event: wx.Event
+        """
+        with wx.FileDialog(self, "CSV-Datei auswählen", wildcard="CSV files (*.csv)|*.csv",
+                           style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as fileDialog:
+            if fileDialog.ShowModal() == wx.ID_CANCEL:
+                return
+
+            file_path = fileDialog.GetPath()
+        options = {
+            "delimiter": self.delimiter_text_ctrl.GetValue(),
+            "skip_header": self.skip_header_checkbox.GetValue(),
+            "first_name_col": self.first_name_col_input.GetValue(),
+            "last_name_col": self.last_name_col_input.GetValue(),
+        }
+
+        def load(cancelled):
+            for name, value in options.items():
+                setattr(self.gc, name, value)
+
+            def progress(rows, rows_per_second):
+                if cancelled():
+                    raise JobCancelled()
+                wx.CallAfter(self.show_progress, rows, rows_per_second)
+
+            self.gc.select_from_file(file_path, progress=progress, cache=self.roster_cache)
+            if cancelled():
+                raise JobCancelled()
+            self.gc.create_groups()
+            return f"{len(self.gc.student_list)} Namen geladen!"
+
+        self.worker.submit(load, self.on_groups_rebuilt, self.on_job_failed)
+
+    def rebuild_groups(self, num_students, message=None):
+        """Ersetzt die Schülerliste durch Zahlen und erstellt die erste Runde im Hintergrund.
+
+        :param num_students: Die Anzahl der Schüler.
+        :type num_students: int
+        :param message: Erfolgsmeldung nach dem Erstellen.
+        :type message: str
+        """
+        def rebuild(cancelled):
+            self.gc.num_students = num_students
+            self.gc.student_list = list(range(1, num_students + 1))  # Schüler als Zahlen (1, 2, 3, ...)
+            self.gc.reset_groups()  # Gruppen zurücksetzen
+            if cancelled():
+                raise JobCancelled()
+
+            # Gruppen erstellen
+            self.gc.create_groups()
+            return message
+
+        self.worker.submit(rebuild, self.on_groups_rebuilt, self.on_job_failed)
+
+    def on_generate_numbers(self, event):
+        """Generiert Schüler als Zahlen basierend auf der eingegebenen Anzahl.
+
+        :param event: Das auslösende Ereignis.
+        :type event: wx.Event
+        """
+        num_students = self.spin_students.GetValue()
+        self.rebuild_groups(num_students, message=f"{num_students} Schüler als Zahlen generiert.")
+
+    def on_students_changed(self, event):
+        """Merkt eine geänderte Schülerzahl vor; die Anpassung erfolgt entprellt.
+
+        :param event: Das auslösende Ereignis.
+        :type event: wx.Event
+        """
+        self._students_dirty = True
+        self.schedule_spin_update()
+
+    def on_group_size_changed(self, event):
+        """Merkt eine geänderte Gruppengröße vor; die Anpassung erfolgt entprellt.
+
+        :param event: Das auslösende Ereignis.
+        :type event: wx.Event
+        """
+        self._group_size_dirty = True
+        self.schedule_spin_update()
+
+    def schedule_spin_update(self):
+        """Startet die Wartezeit bis zur Anpassung neu, sodass nur der letzte Wert berechnet wird."""
+        if self._spin_timer is not None and self._spin_timer.IsRunning():
+            self._spin_timer.Restart(self.SPIN_DELAY_MS)
+        else:
+            self._spin_timer = wx.CallLater(self.SPIN_DELAY_MS, self.apply_spin_changes)
+
+    def apply_spin_changes(self):
+        """Passt die aktuelle Runde an die Spin-Werte an, ohne alle Schüler neu zu mischen.
+
+        Bei einer Schülerliste aus Zahlen werden nur die hinzugekommenen bzw. entfernten
+        Schüler umgesetzt, bei einer neuen Gruppengröße nur die betroffenen Gruppen. Ist eine
+        CSV-Liste geladen, ersetzt eine geänderte Schülerzahl sie wie bisher durch Zahlen.
+        """
+        num_students = self.spin_students.GetValue() if self._students_dirty else None
+        group_size = self.spin_group_size.GetValue() if self._group_size_dirty else None
+        self._students_dirty = self._group_size_dirty = False
+
+        def update(cancelled):
+            gc = self.gc
+            if num_students is not None:
+                if gc.student_list == list(range(1, len(gc.student_list) + 1)):
+                    gc.set_num_students(num_students)
+                else:
+                    gc.num_students = num_students
+                    gc.student_list = list(range(1, num_students + 1))  # Schüler als Zahlen (1, 2, 3, ...)
+                    gc.reset_groups()
+            if group_size is not None:
+                gc.set_group_size(group_size)
+            if not gc.get_current_groups():
+                gc.create_groups()
+
+        self.worker.submit(update, self.on_groups_adjusted, self.on_job_failed)
+
+    def on_groups_adjusted(self, result=None):
+        """Zeigt die angepasste aktuelle Runde an."""
+        self.current_round = self.gc.get_round_count()
+        self.update_grid(self.current_round)
+        self.next_round_button.Enable()
+        if self.current_round > 1:
+            self.prev_round_button.Enable()
+        else:
+            self.prev_round_button.Disable()
+
+        # Rundenanzeige aktualisieren
+        self.update_round_label()
+
+    def on_close(self, event):
+        """Beendet den Hintergrund-Thread und schließt das Sitzungsprotokoll.
+
+        :param event: Das auslösende Ereignis.
+        :type event: wx.CloseEvent
+        """
+        self.worker.stop()
+        if self.gc.session_store is not None:
+            self.gc.session_store.close()
+        event.Skip()
+
+    def update_grid(self, round_number):
+        """Zeigt eine Runde in der Tabelle an.
+
+        Die Zellen werden von :class:`GroupTable` erst beim Zeichnen formatiert.
+
+        :param round_number: Die Rundennummer; ist die Runde nicht gespeichert (z.B. 0),
+            bleibt die Tabelle leer.
+        :type round_number: int
+        """
+        groups = self.gc.groups
+        with groups.lock:  # Ein Auftrag kann gerade eine Runde speichern
+            record = groups.round(round_number) if round_number in groups else None
+            names = groups.names
+        self.table.set_round(record, names)
+        self.grid.ForceRefresh()
+
+    def update_round_label(self):
+        """Aktualisiert die Rundenanzeige samt Höchstzahl wiederholungsfreier Runden."""
+        bounds = self.gc.feasibility()
+        limit = "" if bounds.upper == math.inf else f" von {'' if bounds.exact else 'höchstens '}{bounds.upper}"
+        if not bounds.exact and bounds.lower > 1:
+            limit += f" (mindestens {bounds.lower} sicher)"  # Untere Schranke aus einer Konstruktion
+        self.round_label.SetLabel(f"Aktuelle Runde: {self.current_round}{limit}")
+
+    def on_search(self, event):
+        """Zeigt die Gruppen und bisherigen Partner eines Schülers und markiert seine Gruppe.
+
+        Die Antwort kommt aus dem umgekehrten Index des GroupCalculator und durchsucht
+        nicht alle Runden.
+
+        :param event: Das auslösende Ereignis.
+        :type event: wx.Event
+        """
+        text = self.search_ctrl.GetValue().strip()
+        if not text:
+            self.on_search_cancel(event)
+            return
+        student = text
+        try:
+            with self.gc.groups.lock:  # Alle drei Abfragen aus demselben Stand
+                if self.gc.groups.name_id(text) is None and text.isdigit():
+                    student = int(text)  # Schüler als Zahlen
+                placements = self.gc.find_student(student)
+                partners = self.gc.partners(student)
+                label = self.gc.group_in_round(student, self.current_round)
+        except ValueError as error:
+            self.search_result.SetLabel(str(error))
+            return
+
+        rounds = ", ".join(f"{number}: {group}" for number, group in placements[-5:])
+        names = sorted(partners, key=partners.get, reverse=True)[:8]
+        more = " …" if len(partners) > len(names) else ""
+        self.search_result.SetLabel(f"Runden {rounds or '–'} | {len(partners)} Partner: "
+                                    f"{', '.join(map(str, names))}{more}")
+        self.grid.ClearSelection()
+        if label is not None:
+            row = group_index(label)
+            self.grid.SelectRow(row)
+            self.grid.MakeCellVisible(row, 0)
+
+    def on_search_cancel(self, event):
+        """Leert die Suche und hebt die Markierung auf.
+
+        :param event: Das auslösende Ereignis.
+        :type event: wx.Event
+        """
+        self.search_ctrl.SetValue("")
+        self.search_result.SetLabel("")
+        self.grid.ClearSelection()
+
+
+def main():
+    """Startet die GUI-Anwendung."""
+    app = wx.App(False)
+    frame = GroupApp()
+    frame.Show()
+    app.MainLoop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,2021 @@
-import wx
-import wx.grid
 import csv
+import hashlib
+import json
+import mmap
+import os
 import random
-from collections import defaultdict
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import defaultdict, namedtuple
+from collections.abc import Mapping
+from itertools import chain
 import math
+import time
+
+
+_LABELS = []
+_LABELS_LOCK = threading.Lock()
+
+
+def group_label(index):
+    """Liefert die Gruppenkennung zu einem nullbasierten Gruppenindex.
+
+    Die Kennungen sind unbegrenzt: A, B, ..., Z, AA, AB, ..., ZZ, AAA, ...
+
+    :param index: Der Index der Gruppe innerhalb der Runde (ab 0).
+    :type index: int
+    :return: Die Gruppenkennung.
+    :rtype: str
+    """
+    label = ""
+    index += 1
+    while index:
+        index, rest = divmod(index - 1, 26)
+        label = chr(ord('A') + rest) + label
+    return label
+
+
+def group_index(label):
+    """Liefert den nullbasierten Gruppenindex zu einer Gruppenkennung (Umkehrung von :func:`group_label`).
+
+    :param label: Die Gruppenkennung (A, B, ..., AA, ...).
+    :type label: str
+    :return: Der Index der Gruppe innerhalb der Runde.
+    :rtype: int
+    :raises ValueError: Bei einer ungültigen Kennung.
+    """
+    if not label or not all("A" <= char <= "Z" for char in label):
+        raise ValueError(f"Ungültige Gruppenkennung: {label}")
+    index = 0
+    for char in label:
+        index = index * 26 + ord(char) - ord('A') + 1
+    return index - 1
+
+
+def group_labels(count):
+    """Gibt die ersten ``count`` Gruppenkennungen zurück (zwischengespeichert).
+
+    Der Zwischenspeicher wird nie verändert, sondern unter einer Sperre durch eine
+    verlängerte Kopie ersetzt; Aufrufe aus mehreren Threads sind daher sicher.
+
+    :param count: Die Anzahl der benötigten Kennungen.
+    :type count: int
+    :return: Liste der Kennungen A, B, C, ...
+    :rtype: list
+    """
+    global _LABELS
+    labels = _LABELS
+    if len(labels) < count:
+        with _LABELS_LOCK:
+            labels = _LABELS
+            if len(labels) < count:
+                labels = labels + [group_label(index) for index in range(len(labels), count)]
+                _LABELS = labels
+    return labels[:count]
+
+
+def partition_round(order, group_size):
+    """Zerlegt eine bereits gemischte Reihenfolge in Gruppen.
+
+    Es werden zusammenhängende Abschnitte der Länge ``group_size`` gebildet.
+    Übrige Schüler werden reihum auf die Gruppen A, B, ... verteilt.
+
+    :param order: Die gemischte Schülerreihenfolge.
+    :type order: list
+    :param group_size: Die gewünschte Gruppengröße.
+    :type group_size: int
+    :return: Ein Dictionary Kennung -> Liste der Schüler.
+    :rtype: dict
+    """
+    num_groups = len(order) // group_size
+    if num_groups == 0:
+        return {group_label(0): list(order)} if order else {}
+
+    labels = group_labels(num_groups)
+    current_groups = {label: order[i * group_size:(i + 1) * group_size] for i, label in enumerate(labels)}
+
+    # Übrige Schüler reihum auf die Gruppen verteilen
+    for i, student in enumerate(order[num_groups * group_size:]):
+        current_groups[labels[i % num_groups]].append(student)
+    return current_groups
+
+
+class RoundRandom:
+    """Zählerbasierter Zufallsgenerator mit einem eigenen Strom pro Runde.
+
+    Der Strom einer Runde wird aus ``(seed, runde)`` abgeleitet (BLAKE2b als
+    Mischfunktion, daraus ein ``random.Random``). Jede Runde lässt sich daher direkt in
+    O(1) ansteuern, ohne die Zufallszahlen früherer Runden zu verbrauchen, und wie viele
+    Zahlen eine Runde verbraucht (z.B. die zeitbegrenzte Optimierung), verschiebt keine
+    andere Runde.
+
+    :param seed: Der Startwert (Zahl oder Text), standardmäßig zufällig.
+    :type seed: int
+    """
+
+    def __init__(self, seed=None):
+        """Initialisiert den Generator."""
+        self.seed = seed if seed is not None else int.from_bytes(os.urandom(8), "little")
+
+    def for_round(self, round_number):
+        """Gibt den Zufallsstrom einer Runde zurück (bei jedem Aufruf neu ab Anfang).
+
+        :param round_number: Die Rundennummer.
+        :type round_number: int
+        :rtype: random.Random
+        """
+        digest = hashlib.blake2b(f"{self.seed}:{round_number}".encode("utf-8"), digest_size=16).digest()
+        return random.Random(int.from_bytes(digest, "little"))
+
+    def permutation(self, round_number, size):
+        """Berechnet die gemischte Reihenfolge der Schülerindizes einer Runde.
+
+        :param round_number: Die Rundennummer.
+        :type round_number: int
+        :param size: Die Anzahl der Schüler.
+        :type size: int
+        :rtype: list
+        """
+        order = list(range(size))
+        self.for_round(round_number).shuffle(order)
+        return order
+
+
+class PairHistory:
+    """Speichert, welche Schülerpaare bereits in einer gemeinsamen Gruppe waren.
+
+    Die Paare werden als Dreiecks-Bitset über die Schülerindizes abgelegt, d.h. pro
+    möglichem Paar wird genau ein Bit benötigt (etwa n²/2 Bits). Abfragen und Markieren
+    kosten O(1).
+
+    :param size: Die Anzahl der Schüler (Indizes 0 bis size - 1).
+    :type size: int
+    """
+
+    def __init__(self, size):
+        """Initialisiert ein leeres Bitset für ``size`` Schüler."""
+        self.size = size
+        self.pair_count = 0
+        self.bits = bytearray((size * (size - 1) // 2 + 7) // 8)
+
+    @staticmethod
+    def pair_index(i, j):
+        """Berechnet die Position des Paares (i, j) im Dreiecks-Bitset.
+
+        :param i: Index des ersten Schülers.
+        :type i: int
+        :param j: Index des zweiten Schülers.
+        :type j: int
+        :return: Die laufende Nummer des Paares.
+        :rtype: int
+        """
+        if i > j:
+            i, j = j, i
+        return j * (j - 1) // 2 + i
+
+    def has_met(self, i, j):
+        """Prüft, ob die Schüler i und j bereits zusammen in einer Gruppe waren.
+
+        :return: True, wenn sich die beiden schon begegnet sind.
+        :rtype: bool
+        """
+        if i > j:
+            i, j = j, i
+        index = j * (j - 1) // 2 + i
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def mark(self, i, j):
+        """Markiert das Paar (i, j) als begegnet.
+
+        :return: True, wenn das Paar bereits markiert war (Wiederholung).
+        :rtype: bool
+        """
+        if i > j:
+            i, j = j, i
+        index = j * (j - 1) // 2 + i
+        mask = 1 << (index & 7)
+        if self.bits[index >> 3] & mask:
+            return True
+        self.bits[index >> 3] |= mask
+        self.pair_count += 1
+        return False
+
+    def unmark(self, i, j):
+        """Entfernt die Markierung des Paares (i, j)."""
+        if i > j:
+            i, j = j, i
+        index = j * (j - 1) // 2 + i
+        mask = 1 << (index & 7)
+        if self.bits[index >> 3] & mask:
+            self.bits[index >> 3] &= ~mask
+            self.pair_count -= 1
+
+    def resize(self, size):
+        """Passt die Historie an eine neue Schülerzahl an.
+
+        Da die Paare nach dem größeren Index geordnet sind, liegen alle Paare der Indizes
+        ab ``size`` am Ende des Bitsets. Verkleinern schneidet sie ab, Vergrößern hängt
+        leere Bits an; die übrigen Paare bleiben unverändert.
+
+        :param size: Die neue Anzahl der Schüler.
+        :type size: int
+        """
+        limit = size * (size - 1) // 2
+        length = (limit + 7) // 8
+        if size < self.size:
+            tail = self.bits[limit >> 3:]
+            if tail:
+                tail[0] >>= limit & 7
+                self.pair_count -= int.from_bytes(tail, "little").bit_count()
+                if limit & 7:
+                    self.bits[limit >> 3] &= (1 << (limit & 7)) - 1
+            del self.bits[length:]
+        else:
+            self.bits.extend(bytes(length - len(self.bits)))
+        self.size = size
+
+    def move(self, source, target):
+        """Überträgt alle Begegnungen von Schüler ``source`` auf den Index ``target``.
+
+        Wird beim Entfernen eines Schülers genutzt, wenn der letzte Schüler auf den frei
+        gewordenen Index nachrückt. Kostet O(n).
+
+        :param source: Bisheriger Index.
+        :type source: int
+        :param target: Neuer Index.
+        :type target: int
+        """
+        for other in range(self.size):
+            if other in (source, target):
+                continue
+            if self.has_met(source, other):
+                self.mark(target, other)
+            else:
+                self.unmark(target, other)
+
+    def conflicts(self, student, members):
+        """Zählt, wie viele der ``members`` dem Schüler bereits begegnet sind.
+
+        :param student: Index des Schülers.
+        :type student: int
+        :param members: Indizes der Gruppenmitglieder.
+        :type members: list
+        :return: Anzahl der wiederholten Paarungen.
+        :rtype: int
+        """
+        return sum(1 for member in members if self.has_met(student, member))
+
+    def mark_group(self, members):
+        """Markiert alle Paare einer Gruppe.
+
+        :param members: Indizes der Gruppenmitglieder.
+        :type members: list
+        :return: Anzahl der Paare, die bereits markiert waren.
+        :rtype: int
+        """
+        repeats = 0
+        for pos, i in enumerate(members):
+            for j in members[pos + 1:]:
+                repeats += self.mark(i, j)
+        return repeats
+
+    def clear(self):
+        """Entfernt alle markierten Paare."""
+        self.bits = bytearray(len(self.bits))
+        self.pair_count = 0
+
+    def __contains__(self, pair):
+        """Erlaubt ``(i, j) in history`` wie bei einem Set von Paaren."""
+        return self.has_met(*pair)
+
+    def __len__(self):
+        """Gibt die Anzahl der markierten Paare zurück."""
+        return self.pair_count
+
+
+class SparsePairHistory(PairHistory):
+    """Variante von :class:`PairHistory` für sehr große Jahrgänge.
+
+    Statt eines Bitsets über alle n²/2 Paare werden nur die tatsächlich markierten
+    Paarnummern in einem Set gehalten. Der Speicher wächst so mit Runden × Schülern
+    statt quadratisch mit der Jahrgangsgröße.
+    """
+
+    def __init__(self, size):
+        """Initialisiert eine leere Paarmenge für ``size`` Schüler."""
+        self.size = size
+        self.pairs = set()
+
+    @property
+    def pair_count(self):
+        """Anzahl der markierten Paare."""
+        return len(self.pairs)
+
+    def has_met(self, i, j):
+        """Prüft, ob die Schüler i und j bereits zusammen in einer Gruppe waren."""
+        return self.pair_index(i, j) in self.pairs
+
+    def mark(self, i, j):
+        """Markiert das Paar (i, j) und meldet, ob es bereits markiert war."""
+        index = self.pair_index(i, j)
+        if index in self.pairs:
+            return True
+        self.pairs.add(index)
+        return False
+
+    def unmark(self, i, j):
+        """Entfernt die Markierung des Paares (i, j)."""
+        self.pairs.discard(self.pair_index(i, j))
+
+    def resize(self, size):
+        """Passt die Historie an eine neue Schülerzahl an (siehe :meth:`PairHistory.resize`)."""
+        if size < self.size:
+            limit = size * (size - 1) // 2
+            self.pairs = {index for index in self.pairs if index < limit}
+        self.size = size
+
+    def clear(self):
+        """Entfernt alle markierten Paare."""
+        self.pairs.clear()
+
+
+#: Bis zu dieser Schülerzahl wird das dichte Bitset verwendet (ca. 156 MB bei 50.000).
+DENSE_HISTORY_LIMIT = 50_000
+
+
+def make_pair_history(size):
+    """Erzeugt die passende Paar-Historie für ``size`` Schüler.
+
+    :param size: Die Anzahl der Schüler.
+    :type size: int
+    :return: Ein dichtes Bitset oder bei sehr großen Jahrgängen eine dünn besetzte Variante.
+    :rtype: PairHistory
+    """
+    if size <= DENSE_HISTORY_LIMIT:
+        return PairHistory(size)
+    return SparsePairHistory(size)
+
+
+# Lösung des Kirkman-Schulmädchenproblems: 15 Schüler, 7 Runden à 5 Dreiergruppen
+_KIRKMAN_15 = [
+    [(0, 1, 2), (3, 4, 5), (6, 7, 8), (9, 10, 11), (12, 13, 14)],
+    [(0, 3, 6), (1, 4, 7), (2, 9, 12), (5, 10, 13), (8, 11, 14)],
+    [(0, 4, 9), (1, 5, 11), (2, 7, 14), (3, 8, 13), (6, 10, 12)],
+    [(0, 5, 14), (1, 3, 12), (2, 6, 11), (4, 8, 10), (7, 9, 13)],
+    [(0, 7, 10), (1, 6, 13), (2, 5, 8), (3, 9, 14), (4, 11, 12)],
+    [(0, 8, 12), (1, 10, 14), (2, 4, 13), (3, 7, 11), (5, 6, 9)],
+    [(0, 11, 13), (1, 8, 9), (2, 3, 10), (4, 6, 14), (5, 7, 12)],
+]
+
+
+def _prime_power(q):
+    """Zerlegt ``q`` in Primzahl und Exponent, falls ``q`` eine Primzahlpotenz ist.
+
+    :return: Das Tupel (p, m) mit q = p**m oder None.
+    :rtype: tuple
+    """
+    if q < 2:
+        return None
+    p = next(d for d in range(2, q + 1) if q % d == 0)
+    m = 0
+    while q % p == 0:
+        q //= p
+        m += 1
+    return (p, m) if q == 1 else None
+
+
+def _galois_field(q):
+    """Erzeugt Additions- und Multiplikationstabellen des endlichen Körpers GF(q).
+
+    Elemente sind die Zahlen 0 bis q - 1, aufgefasst als Polynome über GF(p) in
+    Basis-p-Darstellung. Die Multiplikation wird über ein primitives Polynom gebildet,
+    das per Suche bestimmt wird.
+
+    :param q: Eine Primzahlpotenz.
+    :type q: int
+    :return: Das Tupel (add, mul) mit Tabellen als Listen von Listen.
+    :rtype: tuple
+    """
+    p, m = _prime_power(q)
+    digits = [[(x // p ** i) % p for i in range(m)] for x in range(q)]
+
+    def from_digits(values):
+        return sum((v % p) * p ** i for i, v in enumerate(values))
+
+    add = [[from_digits([a + b for a, b in zip(digits[x], digits[y])]) for y in range(q)] for x in range(q)]
+    if m == 1:
+        return add, [[x * y % p for y in range(q)] for x in range(q)]
+
+    # Primitives Polynom x^m + f(x) suchen: die Potenzen von x müssen alle q - 1 Elemente erreichen
+    for low in range(q):
+        powers = [1]
+        for _ in range(q - 2):
+            current = [0] + digits[powers[-1]]
+            top = current.pop()
+            powers.append(from_digits([c - top * f for c, f in zip(current, digits[low])]))
+        if len(set(powers)) == q - 1 and 0 not in powers:
+            break
+    log = {value: exponent for exponent, value in enumerate(powers)}
+    mul = [[0 if x == 0 or y == 0 else powers[(log[x] + log[y]) % (q - 1)] for y in range(q)] for x in range(q)]
+    return add, mul
+
+
+def _affine_resolution(q, k):
+    """Erzeugt die Parallelklassen der affinen Geometrie AG(k, q).
+
+    Die q**k Punkte werden je Richtung in parallele Geraden mit q Punkten zerlegt.
+    Jede Richtung liefert eine Runde, insgesamt (q**k - 1) / (q - 1) Runden, in denen
+    jedes Paar genau einmal zusammentrifft.
+
+    :return: Liste der Runden, jede Runde als Liste von Gruppen (Punktindizes).
+    :rtype: list
+    """
+    add, mul = _galois_field(q)
+    weights = [q ** i for i in range(k)]
+    coords = [[(x // weight) % q for weight in weights] for x in range(q ** k)]
+    directions = [d for d in coords if any(d) and d[next(i for i, c in enumerate(d) if c)] == 1]
+
+    rounds = []
+    for direction in directions:
+        steps = [[mul[t][c] for c in direction] for t in range(q)]
+        assigned = [False] * (q ** k)
+        current_round = []
+        for point, base in enumerate(coords):
+            if assigned[point]:
+                continue
+            line = [sum(add[b][s] * weight for b, s, weight in zip(base, step, weights)) for step in steps]
+            for member in line:
+                assigned[member] = True
+            current_round.append(line)
+        rounds.append(current_round)
+    return rounds
+
+
+def _round_robin(num_students):
+    """Erzeugt einen Rundenplan für Paare nach der Kreismethode (gerade Schülerzahl).
+
+    :return: num_students - 1 Runden, in denen jedes Paar genau einmal vorkommt.
+    :rtype: list
+    """
+    others = list(range(1, num_students))
+    size = len(others)
+    rounds = []
+    for r in range(size):
+        current_round = [[0, others[r]]]
+        for i in range(1, num_students // 2):
+            current_round.append([others[(r + i) % size], others[(r - i) % size]])
+        rounds.append(current_round)
+    return rounds
+
+
+def resolvable_design(num_students, group_size):
+    """Sucht eine bekannte auflösbare Blockplan-Konstruktion für die gegebenen Größen.
+
+    Unterstützt werden die Kreismethode für Paare (gerade Schülerzahl), affine
+    Geometrien AG(k, q) für Primzahlpotenzen q = Gruppengröße und q**k Schüler sowie
+    das Kirkman-Schulmädchenproblem (15 Schüler in Dreiergruppen).
+
+    :param num_students: Die Anzahl der Schüler.
+    :type num_students: int
+    :param group_size: Die Gruppengröße.
+    :type group_size: int
+    :return: Das Tupel (Name, Runden) oder None, falls keine Konstruktion bekannt ist.
+    :rtype: tuple
+    """
+    design = _design_kind(num_students, group_size)
+    if design is None:
+        return None
+    name, rounds = design
+    if name == "trivial":
+        return name, [[list(range(num_students))]]
+    if name == "round-robin":
+        return name, _round_robin(num_students)
+    if name == "kirkman":
+        return name, [[list(group) for group in current_round] for current_round in _KIRKMAN_15]
+    return name, _affine_resolution(group_size, round(math.log(num_students, group_size)))
+
+
+def _design_kind(num_students, group_size):
+    """Bestimmt die passende Konstruktion für :func:`resolvable_design`, ohne sie aufzubauen.
+
+    :return: Das Tupel (Name, Rundenzahl) oder None, falls keine Konstruktion bekannt ist.
+    :rtype: tuple
+    """
+    if group_size < 2 or num_students % group_size:
+        return None
+    if num_students == group_size:
+        return "trivial", 1
+    if group_size == 2:
+        return "round-robin", num_students - 1
+    if group_size == 3 and num_students == 15:
+        return "kirkman", len(_KIRKMAN_15)
+    if _prime_power(group_size):
+        rest = num_students
+        while rest % group_size == 0:
+            rest //= group_size
+        if rest == 1:
+            return "affine", (num_students - 1) // (group_size - 1)
+    return None
+
+
+def _cyclic_round_count(num_students, group_size):
+    """Anzahl wiederholungsfreier Runden einer zyklischen Verschiebungskonstruktion.
+
+    Die Schüler stehen zeilenweise in einem Raster mit ``m = n // group_size`` Spalten;
+    Schüler ``s`` steht in Zeile ``i = s // m`` und Spalte ``c = s % m``. In Runde ``r``
+    kommt er in Gruppe ``(c + i * r) % m``. Ist ``p`` der kleinste Primteiler von ``m``
+    und hat das Raster höchstens ``p`` Zeilen, treffen sich zwei Schüler in höchstens
+    einer der Runden ``0 .. p - 1``. Die Gruppengrößen entsprechen :func:`partition_round`.
+
+    :return: Die Rundenzahl ``p`` oder 1, wenn die Konstruktion nicht anwendbar ist.
+    :rtype: int
+    """
+    num_groups = num_students // group_size
+    if num_groups < 2:
+        return 1
+    p = next(d for d in range(2, num_groups + 1) if num_groups % d == 0)
+    rows = -(-num_students // num_groups)
+    return p if rows <= p else 1
+
+
+#: Schranken für die Anzahl wiederholungsfreier Runden (siehe :func:`round_bounds`).
+RoundBounds = namedtuple("RoundBounds", "lower upper design exact")
+
+#: Bekannte Maxima, die unter der Zählschranke liegen (per Vollsuche bestätigt).
+_KNOWN_MAXIMA = {
+    (12, 3): 4,  # Es gibt kein NKTS(12): höchstens 4 disjunkte Parallelklassen
+}
+
+_ROUND_BOUNDS = {}
+
+
+def round_bounds(num_students, group_size):
+    """Gibt an, wie viele Runden ohne wiederholte Paare höchstens möglich sind.
+
+    Die Runden werden wie bei :func:`partition_round` gebildet: ``n // group_size``
+    Gruppen, die übrigen Schüler reihum verteilt. Die obere Schranke berücksichtigt
+
+    * dass jeder Schüler pro Runde mindestens ``kleinste Gruppe - 1`` neue Partner
+      braucht, insgesamt aber nur ``n - 1`` hat,
+    * dass die Plätze in den größeren Gruppen (Rest) über alle Runden hinweg
+      mindestens einen Schüler überdurchschnittlich oft treffen (Schubfachprinzip),
+    * dass schon eine zweite Runde unmöglich ist, wenn die kleinste Gruppe mehr
+      Mitglieder als die Runde Gruppen hat,
+    * bekannte Ausnahmen aus :data:`_KNOWN_MAXIMA`.
+
+    Die untere Schranke ist durch eine Konstruktion garantiert: eine bekannte aus
+    :func:`resolvable_design` oder die zyklische aus :func:`_cyclic_round_count`, sonst 1.
+    Ohne mögliche Paare (Gruppengröße 1 oder ein Schüler) ist die Rundenzahl
+    unbegrenzt (``math.inf``). Ergebnisse werden pro (n, group_size) zwischengespeichert.
+
+    :param num_students: Die Anzahl der Schüler.
+    :type num_students: int
+    :param group_size: Die Gruppengröße.
+    :type group_size: int
+    :return: Untere und obere Schranke, Name der Konstruktion (oder None) und ob beide
+        Schranken übereinstimmen, das Maximum also bekannt und erreichbar ist.
+    :rtype: RoundBounds
+    """
+    key = (num_students, group_size)
+    bounds = _ROUND_BOUNDS.get(key)
+    if bounds is None:
+        bounds = _ROUND_BOUNDS[key] = _compute_round_bounds(num_students, group_size)
+    return bounds
+
+
+def _compute_round_bounds(num_students, group_size):
+    """Berechnet die Schranken für :func:`round_bounds` (ohne Zwischenspeicher).
+
+    :rtype: RoundBounds
+    """
+    if group_size < 2 or num_students < 2:
+        return RoundBounds(math.inf, math.inf, "trivial", True)
+
+    num_groups = max(1, num_students // group_size)
+    rest = max(0, num_students - num_groups * group_size)
+    smallest = min(num_students, group_size + rest // num_groups)
+    big_groups = rest % num_groups
+
+    if smallest > num_groups:
+        upper = 1
+    else:
+        # Jeder Schüler braucht (smallest - 1) neue Partner pro Runde, in einer großen
+        # Gruppe einen mehr; die Plätze in großen Gruppen treffen jemanden mindestens
+        # ceil(Runden * Plätze / n) Mal.
+        big_seats = big_groups * (smallest + 1)
+        upper = (num_students - 1) // (smallest - 1)
+        while upper > 1 and upper * (smallest - 1) + -(-upper * big_seats // num_students) > num_students - 1:
+            upper -= 1
+    upper = min(upper, _KNOWN_MAXIMA.get((num_students, group_size), upper))
+
+    design = _design_kind(num_students, group_size)
+    name, lower = design if design else (None, 1)
+    lower = max(lower, _cyclic_round_count(num_students, group_size))
+    return RoundBounds(lower, upper, name, lower == upper)
+
+
+class Roster:
+    """Eine eingelesene Schülerliste mit internierter Namenstabelle.
+
+    Jeder Name kommt in :attr:`names` genau einmal vor, :attr:`ids` enthält für jede
+    gültige Zeile den Index ihres Namens. :attr:`extra` enthält die Werte zusätzlich
+    angeforderter Spalten, ebenfalls eine Liste pro Spalte parallel zu :attr:`ids`.
+
+    :param names: Die Namenstabelle.
+    :type names: list
+    :param ids: Die Namens-IDs der Zeilen in Dateireihenfolge.
+    :type ids: array.array
+    """
+
+    #: Maximale Anzahl gespeicherter Fehlermeldungen (gezählt werden alle).
+    max_errors = 1000
+
+    def __init__(self, names=None, ids=None):
+        """Initialisiert eine leere oder vorgegebene Schülerliste."""
+        self.names = names if names is not None else []
+        self.ids = ids if ids is not None else array('i')
+        self.extra = {}
+        self.errors = []
+        self.error_count = 0
+        self.rows = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self):
+        """Gelesene Zeilen pro Sekunde beim Laden."""
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def add_error(self, line_number, message):
+        """Merkt sich eine fehlerhafte Zeile, ohne das Einlesen abzubrechen.
+
+        :param line_number: Die Zeilennummer in der Datei.
+        :type line_number: int
+        :param message: Die Fehlerbeschreibung.
+        :type message: str
+        """
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((line_number, message))
+
+    def students(self):
+        """Erzeugt die Schülerliste (ein Eintrag pro Zeile, Namen geteilt).
+
+        :rtype: list
+        """
+        return list(map(self.names.__getitem__, self.ids))
+
+    def __len__(self):
+        """Gibt die Anzahl der Schüler zurück."""
+        return len(self.ids)
+
+
+def stream_roster(file_path, delimiter=",", skip_header=False, first_name_col=0, last_name_col=1,
+                  chunk_size=65536, progress=None, extra_cols=()):
+    """Liest eine CSV-Datei zeilenweise und übernimmt nur die Namensspalten.
+
+    Die Datei wird nie vollständig in den Speicher geladen; gehalten werden nur die
+    Namenstabelle und ein ``array('i')`` mit einer ID pro Zeile. Leere Zeilen werden
+    übersprungen, zu kurze oder nicht lesbare Zeilen werden in :attr:`Roster.errors`
+    vermerkt und das Einlesen wird fortgesetzt. Ungültige UTF-8-Bytes werden durch
+    U+FFFD ersetzt; der Schüler bleibt erhalten, die Zeile wird ebenfalls vermerkt.
+
+    :param file_path: Der Pfad zur CSV-Datei.
+    :type file_path: str
+    :param delimiter: Das Trennzeichen.
+    :type delimiter: str
+    :param skip_header: Ob die erste Zeile übersprungen wird.
+    :type skip_header: bool
+    :param first_name_col: Spalte des Vornamens.
+    :type first_name_col: int
+    :param last_name_col: Spalte des Nachnamens.
+    :type last_name_col: int
+    :param chunk_size: Nach wie vielen Zeilen ``progress`` aufgerufen wird.
+    :type chunk_size: int
+    :param progress: Optionaler Rückruf ``progress(zeilen, zeilen_pro_sekunde)``.
+    :type progress: callable
+    :param extra_cols: Weitere Spalten, die in :attr:`Roster.extra` übernommen werden
+        (fehlende Zellen werden als leerer Text gespeichert).
+    :type extra_cols: list
+    :return: Die eingelesene Schülerliste.
+    :rtype: Roster
+    """
+    roster = Roster()
+    interned = {}
+    names, ids = roster.names, roster.ids
+    extra = [(col, roster.extra.setdefault(col, [])) for col in extra_cols]
+    required = max(first_name_col, last_name_col)
+    start = time.perf_counter()
+
+    with open(file_path, newline='', encoding='utf-8', errors='replace') as csvfile:
+        reader = csv.reader(csvfile, delimiter=delimiter)
+        if skip_header:
+            next(reader, None)  # Überspringt die Kopfzeile, falls eingestellt
+
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                break
+            except csv.Error as error:
+                roster.add_error(reader.line_num, str(error))
+                continue
+
+            roster.rows += 1
+            if roster.rows % chunk_size == 0 and progress is not None:
+                elapsed = time.perf_counter() - start
+                progress(roster.rows, roster.rows / elapsed if elapsed > 0 else 0.0)
+            if not row:
+                continue
+            if len(row) <= required:
+                roster.add_error(reader.line_num, f"Zu wenige Spalten ({len(row)})")
+                continue
+
+            name = f"{row[first_name_col]} {row[last_name_col]}"
+            if "\ufffd" in name:
+                roster.add_error(reader.line_num, "Ungültige Zeichen (kein UTF-8) ersetzt")
+            name_id = interned.get(name)
+            if name_id is None:
+                name_id = interned[name] = len(names)
+                names.append(name)
+            ids.append(name_id)
+            for col, values in extra:
+                values.append(row[col].strip() if col < len(row) else "")
+
+    roster.elapsed = time.perf_counter() - start
+    if progress is not None:
+        progress(roster.rows, roster.rows_per_second)
+    return roster
+
+
+class RosterCache:
+    """Zwischenspeicher für eingelesene Schülerlisten in einem kompakten Binärformat.
+
+    Pro Quelldatei und Einleseoptionen wird eine Datei mit der Namenstabelle und dem
+    ID-Array abgelegt. Der Schlüssel enthält Pfad, Änderungszeit, Dateigröße,
+    Trennzeichen, ``skip_header`` und die Namensspalten; ändert sich eines davon, wird
+    die Datei neu eingelesen. Beim Laden wird die Cache-Datei per ``mmap`` eingeblendet,
+    das ID-Array wird dabei nicht kopiert.
+
+    Aufbau einer Cache-Datei::
+
+        "WXGR" | Version (u32) | Länge Kopf (u32) | Kopf (JSON) | Länge Namen (u64) |
+        Anzahl IDs (u64) | Namen (UTF-8, durch NUL getrennt) | Auffüllung | IDs (int32)
+
+    :param directory: Verzeichnis der Cache-Dateien, standardmäßig ``~/.cache/wxcreategroups``.
+    :type directory: str
+    """
+
+    MAGIC = b"WXGR"
+    VERSION = 1
+
+    def __init__(self, directory=None):
+        """Initialisiert den Zwischenspeicher (das Verzeichnis wird beim Schreiben angelegt)."""
+        self.directory = directory or os.path.join(os.path.expanduser("~"), ".cache", "wxcreategroups")
+
+    @staticmethod
+    def make_key(file_path, delimiter, skip_header, first_name_col, last_name_col):
+        """Bildet den Schlüssel aus Quelldatei und Einleseoptionen.
+
+        :return: Dictionary mit Pfad, Änderungszeit, Größe und Optionen.
+        :rtype: dict
+        """
+        stat = os.stat(file_path)
+        return {
+            "path": os.path.abspath(file_path),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "delimiter": delimiter,
+            "skip_header": bool(skip_header),
+            "first_name_col": first_name_col,
+            "last_name_col": last_name_col,
+        }
+
+    def path_for(self, key):
+        """Gibt den Pfad der Cache-Datei für Quelldatei und Optionen zurück.
+
+        Änderungszeit und Größe gehen nicht in den Dateinamen ein, eine veraltete Datei
+        wird also überschrieben statt liegen zu bleiben.
+
+        :param key: Der Schlüssel aus :meth:`make_key`.
+        :type key: dict
+        :rtype: str
+        """
+        options = [key[name] for name in ("path", "delimiter", "skip_header", "first_name_col", "last_name_col")]
+        digest = hashlib.sha1(json.dumps(options).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.roster")
+
+    def load(self, key):
+        """Blendet eine passende Cache-Datei ein.
+
+        :param key: Der Schlüssel aus :meth:`make_key`.
+        :type key: dict
+        :return: Die Schülerliste oder None, wenn keine gültige Cache-Datei existiert.
+        :rtype: Roster
+        """
+        try:
+            with open(self.path_for(key), "rb") as cache_file:
+                mapped = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            magic, version, header_length = struct.unpack_from("<4sII", mapped, 0)
+            if magic != self.MAGIC or version != self.VERSION:
+                return None
+            offset = 12 + header_length
+            header = json.loads(mapped[12:offset].decode("utf-8"))
+            if header.get("key") != key:
+                return None
+
+            names_length, num_ids = struct.unpack_from("<QQ", mapped, offset)
+            offset += 16
+            names = mapped[offset:offset + names_length].decode("utf-8").split("\0") if names_length else []
+            offset += names_length + (-names_length % 4)
+            if offset + 4 * num_ids > len(mapped):
+                return None
+        except (struct.error, ValueError):
+            return None  # Beschädigte oder abgeschnittene Cache-Datei
+
+        roster = Roster(names, memoryview(mapped)[offset:offset + 4 * num_ids].cast("i"))
+        roster.rows = header["rows"]
+        roster.error_count = header["error_count"]
+        roster.errors = [tuple(error) for error in header["errors"]]
+        return roster
+
+    def store(self, key, roster):
+        """Schreibt eine Schülerliste atomar in den Zwischenspeicher.
+
+        Namen mit NUL-Zeichen können nicht abgelegt werden; dann wird nichts geschrieben.
+
+        :param key: Der Schlüssel aus :meth:`make_key`.
+        :type key: dict
+        :param roster: Die eingelesene Schülerliste.
+        :type roster: Roster
+        :return: True, wenn die Cache-Datei geschrieben wurde.
+        :rtype: bool
+        """
+        if any("\0" in name for name in roster.names):
+            return False
+
+        header = json.dumps({"key": key, "rows": roster.rows, "error_count": roster.error_count,
+                             "errors": roster.errors}).encode("utf-8")
+        names = "\0".join(roster.names).encode("utf-8")
+        ids = roster.ids if isinstance(roster.ids, array) else array("i", roster.ids)
+
+        path = self.path_for(key)
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as cache_file:
+            cache_file.write(struct.pack("<4sII", self.MAGIC, self.VERSION, len(header)))
+            cache_file.write(header)
+            cache_file.write(struct.pack("<QQ", len(names), len(ids)))
+            cache_file.write(names)
+            cache_file.write(b"\0" * (-len(names) % 4))
+            ids.tofile(cache_file)
+        os.replace(temp_path, path)
+        return True
+
+    def get(self, file_path, delimiter=",", skip_header=False, first_name_col=0, last_name_col=1, progress=None):
+        """Lädt eine Schülerliste aus dem Zwischenspeicher oder liest die CSV-Datei ein.
+
+        Parameter wie bei :func:`stream_roster`.
+
+        :return: Die Schülerliste.
+        :rtype: Roster
+        """
+        key = self.make_key(file_path, delimiter, skip_header, first_name_col, last_name_col)
+        roster = self.load(key)
+        if roster is None:
+            roster = stream_roster(file_path, delimiter, skip_header, first_name_col, last_name_col,
+                                   progress=progress)
+            try:
+                self.store(key, roster)
+            except OSError:
+                pass  # Ohne beschreibbares Cache-Verzeichnis wird einfach jedes Mal eingelesen
+        return roster
+
+
+class Round:
+    """Eine gespeicherte Runde in kompakter Form.
+
+    :attr:`members` enthält die Namens-IDs aller Gruppen hintereinander (4 Byte pro
+    Schüler), :attr:`offsets` die Startposition jeder Gruppe und am Ende die Gesamtlänge.
+
+    :param members: Die Namens-IDs in Gruppenreihenfolge.
+    :type members: array.array
+    :param offsets: Die Gruppengrenzen (Anzahl der Gruppen + 1 Einträge).
+    :type offsets: array.array
+    """
+
+    __slots__ = ("members", "offsets")
+
+    def __init__(self, members, offsets):
+        """Initialisiert die Runde."""
+        self.members = members
+        self.offsets = offsets
+
+    def group(self, position):
+        """Gibt die Namens-IDs einer Gruppe zurück.
+
+        :param position: Die Position der Gruppe (0 = A).
+        :type position: int
+        :rtype: array.array
+        """
+        return self.members[self.offsets[position]:self.offsets[position + 1]]
+
+    def __len__(self):
+        """Gibt die Anzahl der Gruppen zurück."""
+        return len(self.offsets) - 1
+
+
+class StudentIndex:
+    """Umgekehrter Index über alle Runden: Namens-ID → (Runde, Gruppe) und Partner.
+
+    Pro Schüler werden die Rundennummern und Gruppenpositionen in zwei parallelen
+    ``array('i')`` gehalten (aufsteigend nach Runde) sowie ein Dictionary
+    Partner-ID → Anzahl gemeinsamer Runden. Wird eine Runde ersetzt (z.B. nach
+    :meth:`GroupCalculator.add_students`), werden ihre alten Einträge zuerst entfernt.
+    """
+
+    def __init__(self):
+        """Initialisiert einen leeren Index."""
+        self.rounds = {}
+        self.positions = {}
+        self.partners = {}
+
+    def add_round(self, number, record):
+        """Trägt eine Runde ein.
+
+        :param number: Die Rundennummer.
+        :type number: int
+        :param record: Die Runde.
+        :type record: Round
+        """
+        for position in range(len(record)):
+            members = record.group(position)
+            for member in members:
+                rounds = self.rounds.get(member)
+                if rounds is None:
+                    rounds = self.rounds[member] = array('i')
+                    self.positions[member] = array('i')
+                    self.partners[member] = {}
+                at = len(rounds) if not rounds or rounds[-1] < number else bisect_left(rounds, number)
+                rounds.insert(at, number)
+                self.positions[member].insert(at, position)
+                partners = self.partners[member]
+                for other in members:
+                    if other != member:
+                        partners[other] = partners.get(other, 0) + 1
+
+    def remove_round(self, number, record):
+        """Entfernt die Einträge einer Runde.
+
+        :param number: Die Rundennummer.
+        :type number: int
+        :param record: Die bisher gespeicherte Runde.
+        :type record: Round
+        """
+        for position in range(len(record)):
+            members = record.group(position)
+            for member in members:
+                rounds = self.rounds[member]
+                at = bisect_left(rounds, number)
+                del rounds[at]
+                del self.positions[member][at]
+                partners = self.partners[member]
+                for other in members:
+                    if other != member:
+                        if partners[other] == 1:
+                            del partners[other]
+                        else:
+                            partners[other] -= 1
+
+    def placement(self, name_id, number):
+        """Gibt die Gruppenposition eines Schülers in einer Runde zurück (O(log Runden)).
+
+        :param name_id: Die Namens-ID.
+        :type name_id: int
+        :param number: Die Rundennummer.
+        :type number: int
+        :return: Die Gruppenposition oder None, wenn der Schüler nicht teilgenommen hat.
+        :rtype: int
+        """
+        rounds = self.rounds.get(name_id, ())
+        at = bisect_left(rounds, number)
+        if at < len(rounds) and rounds[at] == number:
+            return self.positions[name_id][at]
+        return None
+
+    def placements(self, name_id):
+        """Gibt alle (Runde, Gruppenposition)-Paare eines Schülers zurück.
+
+        :param name_id: Die Namens-ID.
+        :type name_id: int
+        :rtype: list
+        """
+        return list(zip(self.rounds.get(name_id, ()), self.positions.get(name_id, ())))
+
+
+class RoundStore(Mapping):
+    """Speicher aller Runden einer Sitzung mit internierter Namenstabelle.
+
+    Verhält sich wie ein schreibgeschütztes Dictionary Rundennummer → ``{Gruppe: [Namen]}``;
+    die Dictionary-Ansicht einer Runde wird erst beim Zugriff aus dem :class:`Round`
+    erzeugt. Jeder Name steht genau einmal in :attr:`names`, auch wenn er in vielen
+    Runden vorkommt; Schüler, die später entfernt werden, bleiben für ältere Runden erhalten.
+
+    Der umgekehrte Index :attr:`index` wird bei der ersten Abfrage aus allen Runden
+    aufgebaut und danach mit jeder neuen Runde fortgeschrieben. Aufbau und Fortschreiben
+    laufen unter :attr:`lock`, da Runden im Hintergrund gespeichert werden, während die
+    Oberfläche oder der Dienst Abfragen stellt; Abfragen über mehrere Zugriffe auf den
+    Index halten die Sperre ebenfalls.
+    """
+
+    def __init__(self):
+        """Initialisiert einen leeren Speicher."""
+        self.names = []
+        self._name_ids = {}
+        self._rounds = {}
+        self._index = None
+        self.lock = threading.RLock()
+
+    @property
+    def index(self):
+        """Der umgekehrte Index (wird beim ersten Zugriff aufgebaut).
+
+        :rtype: StudentIndex
+        """
+        with self.lock:
+            if self._index is None:
+                index = StudentIndex()
+                for number, record in self._rounds.items():
+                    index.add_round(number, record)
+                self._index = index
+            return self._index
+
+    def name_id(self, name):
+        """Gibt die ID eines bekannten Namens zurück.
+
+        :param name: Der Name (oder die Schülernummer).
+        :type name: str
+        :return: Die ID oder None, wenn der Name nie vorkam.
+        :rtype: int
+        """
+        return self._lookup().get(name)
+
+    def intern(self, name):
+        """Gibt die ID eines Namens zurück und legt ihn bei Bedarf an.
+
+        :param name: Der Name (oder die Schülernummer).
+        :type name: str
+        :rtype: int
+        """
+        name_ids = self._name_ids if self._name_ids is not None else self._lookup()
+        name_id = name_ids.get(name)
+        if name_id is None:
+            name_id = name_ids[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    def _lookup(self):
+        """Gibt das Dictionary Name → ID zurück und baut es bei Bedarf aus :attr:`names` auf."""
+        if self._name_ids is None:
+            self._name_ids = dict(zip(self.names, range(len(self.names))))
+        return self._name_ids
+
+    def intern_roster(self, roster):
+        """Übernimmt die Namenstabelle einer eingelesenen Schülerliste auf einmal.
+
+        Solange keine Runde gespeichert ist, werden :attr:`Roster.names` und
+        :attr:`Roster.ids` direkt übernommen; das Dictionary Name → ID entsteht erst bei
+        der nächsten Suche. Sonst werden nur die neuen Namen der Tabelle (nicht jede
+        Zeile) angehängt und die IDs der Zeilen umgeschlüsselt.
+
+        :param roster: Die Schülerliste.
+        :type roster: Roster
+        :return: Die Namens-ID je Zeile der Schülerliste.
+        :rtype: array.array
+        """
+        if not self._rounds:
+            # Die alte Tabelle gehört nur zur bisherigen Schülerliste, die hiermit ersetzt wird
+            self.names = list(roster.names)
+            self._name_ids = None
+            return array('i', roster.ids)
+        known = self._lookup()
+        start = len(self.names)
+        new = [name for name in roster.names if name not in known]
+        self.names.extend(new)
+        known.update(zip(new, range(start, start + len(new))))
+        mapping = array('i', map(known.__getitem__, roster.names))
+        return array('i', map(mapping.__getitem__, roster.ids))
+
+    def add(self, number, index_groups, name_ids):
+        """Speichert eine Runde aus Schülerindizes.
+
+        :param number: Die Rundennummer.
+        :type number: int
+        :param index_groups: Die Gruppen als Listen von Schülerindizes (in Reihenfolge A, B, ...).
+        :type index_groups: list
+        :param name_ids: Die Namens-ID je Schülerindex.
+        :type name_ids: array.array
+        """
+        members = array('i', map(name_ids.__getitem__, chain.from_iterable(index_groups)))
+        self._store(number, Round(members, self._offsets(index_groups)))
+
+    def __setitem__(self, number, groups):
+        """Speichert eine Runde aus ihrer Dictionary-Ansicht.
+
+        :param number: Die Rundennummer.
+        :type number: int
+        :param groups: Die Gruppen ``{Gruppe: [Namen]}`` in Reihenfolge A, B, ...
+        :type groups: dict
+        """
+        members = array('i', map(self.intern, chain.from_iterable(groups.values())))
+        self._store(number, Round(members, self._offsets(groups.values())))
+
+    def _store(self, number, record):
+        """Legt eine Runde ab und schreibt den umgekehrten Index fort.
+
+        :param number: Die Rundennummer.
+        :type number: int
+        :param record: Die Runde.
+        :type record: Round
+        """
+        with self.lock:
+            if self._index is not None:
+                previous = self._rounds.get(number)
+                if previous is not None:
+                    self._index.remove_round(number, previous)
+                self._index.add_round(number, record)
+            self._rounds[number] = record
+
+    @staticmethod
+    def _offsets(groups):
+        """Berechnet die Gruppengrenzen für :class:`Round`.
+
+        :param groups: Die Gruppen in Reihenfolge A, B, ...
+        :type groups: list
+        :rtype: array.array
+        """
+        offsets = array('i', [0])
+        for members in groups:
+            offsets.append(offsets[-1] + len(members))
+        return offsets
+
+    def round(self, number):
+        """Gibt den kompakten Datensatz einer Runde zurück.
+
+        :param number: Die Rundennummer.
+        :type number: int
+        :rtype: Round
+        """
+        return self._rounds[number]
+
+    def nbytes(self):
+        """Schätzt den Speicherbedarf aller Runden (ohne Namenstabelle) in Byte.
+
+        :rtype: int
+        """
+        return sum(sys.getsizeof(record) + sys.getsizeof(record.members) + sys.getsizeof(record.offsets)
+                   for record in self._rounds.values())
+
+    def clear(self):
+        """Entfernt alle Runden; die Namenstabelle bleibt erhalten."""
+        with self.lock:
+            self._rounds.clear()
+            self._index = None
+
+    def __getitem__(self, number):
+        """Erzeugt die Dictionary-Ansicht einer Runde."""
+        record = self._rounds[number]
+        names = self.names
+        return {label: [names[name_id] for name_id in record.group(position)]
+                for position, label in enumerate(group_labels(len(record)))}
+
+    def __contains__(self, number):
+        """Gibt an, ob die Runde gespeichert ist (ohne die Ansicht zu erzeugen)."""
+        return number in self._rounds
+
+    def __iter__(self):
+        """Iteriert über die Rundennummern in der Reihenfolge ihres Entstehens."""
+        return iter(self._rounds)
+
+    def __len__(self):
+        """Gibt die Anzahl der gespeicherten Runden zurück."""
+        return len(self._rounds)
+
+
+class SessionStore:
+    """Anhängendes Protokoll aller Runden einer Sitzung auf der Festplatte.
+
+    Jede von :meth:`GroupCalculator.create_groups` oder
+    :meth:`GroupCalculator.create_schedule` erzeugte Runde wird als kompakter
+    Binärdatensatz angehängt (Kosten O(Rundengröße)). In regelmäßigen Abständen wird die
+    Paar-Historie als Sicherungspunkt in ``<path>.pairs`` abgelegt; beim Fortsetzen
+    müssen dann nur die Runden danach erneut in die Historie eingetragen werden.
+    Änderungen der Schülerliste oder der Gruppengröße während der Sitzung werden als
+    eigene Datensätze protokolliert und beim Fortsetzen in derselben Reihenfolge
+    nachvollzogen, da sich die Schülerindizes der folgenden Runden darauf beziehen.
+
+    Aufbau der Protokolldatei::
+
+        "WXGS" | Version (u32) | Länge Kopf (u32) | Kopf (JSON: group_size, seed, students)
+        je Runde: Rundennummer (u32) | Gruppen (u32) | Schüler (u32) |
+                  Gruppengrößen (u16 je Gruppe) | Schülerindizes (int32) | CRC32 (u32)
+        je Änderung: 0xFFFFFFFF (u32) | 0 (u32) | Länge (u32) |
+                     JSON (add, remove oder group_size) | CRC32 (u32)
+
+    :param path: Der Pfad der Protokolldatei.
+    :type path: str
+    """
+
+    MAGIC = b"WXGS"
+    CHECKPOINT_MAGIC = b"WXGP"
+    VERSION = 2
+    #: Ältere Versionen, die weiterhin gelesen werden (ohne Änderungsdatensätze).
+    COMPATIBLE_VERSIONS = (1, 2)
+    #: Kennung eines Änderungsdatensatzes anstelle der Rundennummer.
+    CHANGE_RECORD = 0xFFFFFFFF
+
+    #: Nach wie vielen Runden automatisch ein Sicherungspunkt geschrieben wird.
+    checkpoint_interval = 100
+
+    def __init__(self, path):
+        """Initialisiert den Speicher, ohne die Datei zu öffnen."""
+        self.path = path
+        self.checkpoint_path = f"{path}.pairs"
+        self._file = None
+        self._rounds_since_checkpoint = 0
+
+    def begin(self, calculator):
+        """Beginnt ein neues Protokoll mit der aktuellen Schülerliste (eine vorhandene Datei wird ersetzt).
+
+        :param calculator: Die Sitzung, deren Schülerliste und Gruppengröße abgelegt werden.
+        :type calculator: GroupCalculator
+        """
+        self.close()
+        header = json.dumps({"group_size": calculator.group_size, "seed": calculator.rng.seed,
+                             "students": list(calculator.student_list)}, ensure_ascii=False).encode("utf-8")
+        self._file = open(self.path, "wb")
+        self._file.write(struct.pack("<4sII", self.MAGIC, self.VERSION, len(header)))
+        self._file.write(header)
+        self._file.flush()
+        self._rounds_since_checkpoint = 0
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def append_round(self, calculator, index_groups):
+        """Hängt die gerade gespeicherte Runde an das Protokoll an.
+
+        :param calculator: Die Sitzung (liefert Rundennummer und Paar-Historie).
+        :type calculator: GroupCalculator
+        :param index_groups: Die Gruppen der Runde als Listen von Schülerindizes.
+        :type index_groups: list
+        """
+        sizes = array("H", map(len, index_groups))
+        members = array("i")
+        for group in index_groups:
+            members.extend(group)
+        record = struct.pack("<III", calculator.round_counter, len(sizes), len(members)) \
+            + sizes.tobytes() + members.tobytes()
+        self._file.write(record + struct.pack("<I", zlib.crc32(record)))
+        self._file.flush()
+
+        self._rounds_since_checkpoint += 1
+        if self._rounds_since_checkpoint >= self.checkpoint_interval:
+            self.checkpoint(calculator.previous_combinations)
+
+    def append_change(self, change):
+        """Hängt eine Änderung der Schülerliste oder Gruppengröße an das Protokoll an.
+
+        :param change: {"add": [...]}, {"remove": [...]} oder {"group_size": n}.
+        :type change: dict
+        """
+        payload = json.dumps(change, ensure_ascii=False).encode("utf-8")
+        record = struct.pack("<III", self.CHANGE_RECORD, 0, len(payload)) + payload
+        self._file.write(record + struct.pack("<I", zlib.crc32(record)))
+        self._file.flush()
+
+    def checkpoint(self, history):
+        """Legt die Paar-Historie mit der aktuellen Protokolllänge als Sicherungspunkt ab.
+
+        Nur das dichte Bitset wird gesichert; bei sehr großen Jahrgängen wird die
+        Historie beim Fortsetzen vollständig aus dem Protokoll aufgebaut.
+
+        :param history: Die Paar-Historie der Sitzung.
+        :type history: PairHistory
+        """
+        self._rounds_since_checkpoint = 0
+        if not isinstance(getattr(history, "bits", None), bytearray):
+            return
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "wb") as checkpoint_file:
+            checkpoint_file.write(struct.pack("<4sQQQ", self.CHECKPOINT_MAGIC, self._file.tell(),
+                                              history.size, history.pair_count))
+            checkpoint_file.write(history.bits)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def _read_checkpoint(self, log_length):
+        """Liest den Sicherungspunkt, ohne ihn schon in die Historie zu übernehmen.
+
+        :return: Tupel aus Protokollposition, Schülerzahl, Paaranzahl und Bitset oder None.
+        :rtype: tuple
+        """
+        try:
+            with open(self.checkpoint_path, "rb") as checkpoint_file:
+                magic, offset, size, pair_count = struct.unpack("<4sQQQ", checkpoint_file.read(28))
+                bits = checkpoint_file.read()
+        except (OSError, struct.error):
+            return None
+        if magic != self.CHECKPOINT_MAGIC or offset > log_length:
+            return None
+        return offset, size, pair_count, bits
+
+    def resume(self):
+        """Setzt eine gespeicherte Sitzung fort.
+
+        Alle Runden werden aus dem Protokoll gelesen (nicht neu erzeugt). Die Paar-Historie
+        wird aus dem letzten Sicherungspunkt übernommen und nur um die Runden danach
+        ergänzt. Ein unvollständiger letzter Datensatz (z.B. nach einem Absturz) wird
+        abgeschnitten. Weitere Runden werden anschließend wieder angehängt.
+
+        :return: Die wiederhergestellte Sitzung.
+        :rtype: GroupCalculator
+        :raises ValueError: Wenn die Datei kein gültiges Protokoll ist.
+        """
+        self.close()
+        with open(self.path, "rb") as log_file:
+            data = log_file.read()
+        if len(data) < 12 or data[:4] != self.MAGIC:
+            raise ValueError(f"Keine gültige Sitzungsdatei: {self.path}")
+        version, header_length = struct.unpack_from("<II", data, 4)
+        if version not in self.COMPATIBLE_VERSIONS:
+            raise ValueError(f"Nicht unterstützte Version der Sitzungsdatei: {version}")
+        try:
+            checkpoint = self._read_checkpoint(len(data))
+            calculator, offset = self._replay(data, 12 + header_length, checkpoint)
+            if calculator is None:  # Sicherungspunkt passt nicht: Historie vollständig aufbauen
+                calculator, offset = self._replay(data, 12 + header_length, None)
+        except (KeyError, IndexError, TypeError, struct.error) as error:
+            raise ValueError(f"Beschädigte Sitzungsdatei: {self.path} ({error!r})") from error
+
+        self._file = open(self.path, "r+b")
+        self._file.truncate(offset)
+        self._file.seek(offset)
+        calculator.session_store = self
+        return calculator
+
+    def _replay(self, data, offset, checkpoint):
+        """Baut die Sitzung aus Kopf, Runden- und Änderungsdatensätzen auf.
+
+        Der Sicherungspunkt wird erst an seiner Protokollposition übernommen, damit
+        vorher protokollierte Änderungen der Schülerliste die Historie nicht verfälschen.
+
+        :param data: Der Inhalt der Protokolldatei.
+        :type data: bytes
+        :param offset: Das Ende des Kopfes.
+        :type offset: int
+        :param checkpoint: Der Sicherungspunkt aus :meth:`_read_checkpoint` oder None.
+        :type checkpoint: tuple
+        :return: Tupel aus Sitzung und Ende des letzten gültigen Datensatzes; (None, None),
+            wenn der Sicherungspunkt nicht zum Protokoll passt.
+        :rtype: tuple
+        :raises ValueError: Bei Schülerindizes außerhalb der Schülerliste.
+        """
+        header = json.loads(data[12:offset].decode("utf-8"))
+        students = header["students"]
+        group_size = header["group_size"]
+        calculator = GroupCalculator(max(len(students), group_size), group_size, seed=header.get("seed"))
+        calculator.student_list = students
+        calculator.num_students = len(students)
+        calculator.round_counter = 0
+        history = calculator.previous_combinations
+        replay_from = checkpoint[0] if checkpoint is not None and isinstance(getattr(history, "bits", None),
+                                                                              bytearray) else 0
+
+        def restore_checkpoint():
+            _, size, pair_count, bits = checkpoint
+            if size != history.size or len(bits) != len(history.bits):
+                return False
+            history.bits = bytearray(bits)
+            history.pair_count = pair_count
+            return True
+
+        while offset + 16 <= len(data):
+            if replay_from and offset == replay_from and not restore_checkpoint():
+                return None, None
+            number, num_groups, num_members = struct.unpack_from("<III", data, offset)
+            if number == self.CHANGE_RECORD:
+                end = offset + 12 + num_members
+                if end + 4 > len(data) or struct.unpack_from("<I", data, end)[0] != zlib.crc32(data[offset:end]):
+                    break
+                calculator._apply_change(json.loads(data[offset + 12:end].decode("utf-8")))
+                offset = end + 4
+                continue
+
+            end = offset + 12 + 2 * num_groups + 4 * num_members
+            if end + 4 > len(data) or struct.unpack_from("<I", data, end)[0] != zlib.crc32(data[offset:end]):
+                break
+            sizes = array("H", data[offset + 12:offset + 12 + 2 * num_groups])
+            members = array("i", data[offset + 12 + 2 * num_groups:end])
+            if members and (min(members) < 0 or max(members) >= len(calculator.student_list)):
+                raise ValueError(f"Schülerindex außerhalb der Liste in Runde {number}: {self.path}")
+
+            if offset >= replay_from and number in calculator.groups:
+                calculator._release_round_pairs(number)  # Angepasste Fassung der Runde (siehe add_students)
+            index_groups = []
+            start = 0
+            for size in sizes:
+                group = members[start:start + size].tolist()
+                start += size
+                if offset >= replay_from:
+                    history.mark_group(group)
+                index_groups.append(group)
+            calculator.groups.add(number, index_groups, calculator._name_ids)
+            calculator._current_index_groups = index_groups
+            calculator.round_counter = number
+            offset = end + 4
+
+        if replay_from and (offset < replay_from or (offset == replay_from and not restore_checkpoint())):
+            return None, None
+        return calculator, offset
+
+    def close(self):
+        """Schließt die Protokolldatei."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Constraints:
+    """Regeln für die Gruppenbildung: getrennt halten, zusammen halten, Merkmale verteilen.
+
+    Die Regeln beziehen sich auf Schüler (Zahlen oder Namen, verglichen als Text) und
+    nicht auf Indizes; sie überstehen daher Änderungen der Schülerliste. Für die
+    Gruppenbildung werden sie mit :meth:`index` in einen :class:`ConstraintIndex`
+    übersetzt. Regeln für Schüler, die nicht in der Liste stehen, werden ignoriert.
+    """
+
+    #: Schlüsselwörter der Regelarten in Regeldateien.
+    KEEP_APART = ("getrennt", "apart")
+    KEEP_TOGETHER = ("zusammen", "together")
+    BALANCE = ("merkmal", "attribute")
+
+    def __init__(self):
+        """Initialisiert einen leeren Regelsatz."""
+        self.apart = defaultdict(set)
+        self.together = []
+        self.attributes = {}
+        self.version = 0
+
+    def keep_apart(self, *students):
+        """Verbietet, dass zwei der angegebenen Schüler in dieselbe Gruppe kommen.
+
+        :param students: Die Schüler, die paarweise getrennt werden.
+        :type students: str
+        """
+        keys = list(dict.fromkeys(map(str, students)))
+        for pos, student in enumerate(keys):
+            for other in keys[pos + 1:]:
+                self.apart[student].add(other)
+                self.apart[other].add(student)
+        self.version += 1
+
+    def keep_together(self, *students):
+        """Legt fest, dass die angegebenen Schüler immer in derselben Gruppe landen.
+
+        :param students: Die Schüler, die zusammenbleiben.
+        :type students: str
+        """
+        keys = list(dict.fromkeys(map(str, students)))
+        if len(keys) > 1:
+            self.together.append(keys)
+            self.version += 1
+
+    def balance(self, attribute, values):
+        """Verteilt die Ausprägungen eines Merkmals möglichst gleichmäßig auf die Gruppen.
+
+        Jede Gruppe erhält von jeder Ausprägung höchstens ``ceil(anzahl / gruppen)`` Schüler.
+
+        :param attribute: Der Name des Merkmals (z.B. "Klasse").
+        :type attribute: str
+        :param values: Die Ausprägung je Schüler.
+        :type values: dict
+        """
+        target = self.attributes.setdefault(attribute, {})
+        for student, value in values.items():
+            if value != "":
+                target[str(student)] = value
+        self.version += 1
+
+    def add_columns(self, students, together=None, apart=None, attributes=None):
+        """Übernimmt Regeln aus zusätzlichen CSV-Spalten.
+
+        Schüler mit derselben nichtleeren Markierung in ``together`` bleiben zusammen,
+        Schüler mit derselben Markierung in ``apart`` werden getrennt.
+
+        :param students: Die Schüler in Dateireihenfolge.
+        :type students: list
+        :param together: Die Markierungen der Spalte "zusammen", parallel zu ``students``.
+        :type together: list
+        :param apart: Die Markierungen der Spalte "getrennt", parallel zu ``students``.
+        :type apart: list
+        :param attributes: Merkmalsspalten ``{name: werte}``, parallel zu ``students``.
+        :type attributes: dict
+        """
+        for column, rule in ((together, self.keep_together), (apart, self.keep_apart)):
+            if column is None:
+                continue
+            tags = defaultdict(list)
+            for student, tag in zip(students, column):
+                if tag:
+                    tags[tag].append(student)
+            for members in tags.values():
+                rule(*members)
+        for attribute, column in (attributes or {}).items():
+            self.balance(attribute, dict(zip(students, column)))
+
+    @classmethod
+    def from_file(cls, file_path, delimiter=","):
+        """Liest eine Regeldatei.
+
+        Jede Zeile beginnt mit der Art der Regel, gefolgt von den Schülern::
+
+            getrennt,Anna Muster,Ben Beispiel
+            zusammen,Clara Test,Dora Probe,Emil Demo
+            merkmal,Klasse,Anna Muster,5a
+
+        Leere Zeilen und Zeilen, die mit ``#`` beginnen, werden übersprungen.
+
+        :param file_path: Der Pfad zur Regeldatei.
+        :type file_path: str
+        :param delimiter: Das Trennzeichen.
+        :type delimiter: str
+        :return: Die eingelesenen Regeln.
+        :rtype: Constraints
+        :raises ValueError: Bei einer unbekannten oder unvollständigen Regel.
+        """
+        constraints = cls()
+        with open(file_path, newline='', encoding='utf-8') as rule_file:
+            reader = csv.reader(rule_file, delimiter=delimiter)
+            for row in reader:
+                row = [cell.strip() for cell in row]
+                if not row or not row[0] or row[0].startswith("#"):
+                    continue
+                kind, args = row[0].lower(), [cell for cell in row[1:] if cell]
+                if kind in cls.KEEP_APART and len(args) >= 2:
+                    constraints.keep_apart(*args)
+                elif kind in cls.KEEP_TOGETHER and len(args) >= 2:
+                    constraints.keep_together(*args)
+                elif kind in cls.BALANCE and len(args) == 3:
+                    constraints.balance(args[0], {args[1]: args[2]})
+                else:
+                    raise ValueError(f"{file_path}:{reader.line_num}: Ungültige Regel: {row[0]}")
+        return constraints
+
+    def index(self, students, num_groups, max_group_size):
+        """Übersetzt die Regeln in Indexform für eine Schülerliste.
+
+        :param students: Die aktuelle Schülerliste.
+        :type students: list
+        :param num_groups: Die Anzahl der Gruppen pro Runde.
+        :type num_groups: int
+        :param max_group_size: Die größte Gruppengröße einer Runde.
+        :type max_group_size: int
+        :rtype: ConstraintIndex
+        :raises ValueError: Wenn sich die Regeln grundsätzlich nicht erfüllen lassen.
+        """
+        return ConstraintIndex(self, students, num_groups, max_group_size)
+
+    def __bool__(self):
+        """Gibt an, ob mindestens eine Regel vorhanden ist."""
+        return bool(self.apart or self.together or self.attributes)
+
+
+class ConstraintIndex:
+    """Die Regeln eines :class:`Constraints`-Satzes, bezogen auf Schülerindizes.
+
+    Getrennt-Regeln bilden einen Konfliktgraphen (Adjazenzlisten), Zusammen-Regeln
+    werden per Union-Find zu Blöcken verschmolzen, Merkmale werden als Kategorie-Codes
+    mit einer Obergrenze pro Gruppe abgelegt. Während der Gruppenbildung hält der
+    Aufrufer ``group_of`` (Gruppe je Index, -1 = frei) und die Merkmalszähler aus
+    :meth:`new_counts`; damit kostet jede Prüfung nur O(Grad + Merkmale).
+
+    :param constraints: Die Regeln.
+    :type constraints: Constraints
+    :param students: Die aktuelle Schülerliste.
+    :type students: list
+    :param num_groups: Die Anzahl der Gruppen pro Runde.
+    :type num_groups: int
+    :param max_group_size: Die größte Gruppengröße einer Runde.
+    :type max_group_size: int
+    :raises ValueError: Wenn ein Block größer als eine Gruppe ist oder Regeln sich widersprechen.
+    """
+
+    def __init__(self, constraints, students, num_groups, max_group_size):
+        """Baut Konfliktgraph, Blöcke und Merkmalscodes auf."""
+        self.size = len(students)
+        self.num_groups = num_groups
+        positions = defaultdict(list)
+        for index, student in enumerate(students):
+            positions[str(student)].append(index)
+
+        self.apart = {}
+        for student, enemies in constraints.apart.items():
+            targets = [j for enemy in enemies for j in positions.get(enemy, ())]
+            if targets:
+                for index in positions.get(student, ()):
+                    self.apart[index] = targets
+
+        # Zusammen-Regeln mit gemeinsamen Schülern zu einem Block verschmelzen
+        parent = {}
+
+        def find(index):
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        for rule in constraints.together:
+            members = [j for student in rule for j in positions.get(student, ())]
+            for member in members:
+                parent.setdefault(member, member)
+            for member in members[1:]:
+                root, other = find(members[0]), find(member)
+                if root != other:
+                    parent[other] = root
+        blocks = defaultdict(list)
+        for index in parent:
+            blocks[find(index)].append(index)
+        self.blocks = [sorted(block) for block in blocks.values() if len(block) > 1]
+        self.block_of = {}
+        for number, block in enumerate(self.blocks):
+            if len(block) > max_group_size:
+                names = ", ".join(str(students[j]) for j in block)
+                raise ValueError(f"Zu viele Schüler für eine Gruppe ({max_group_size}): {names}")
+            for index in block:
+                self.block_of[index] = number
+        for index, enemies in self.apart.items():
+            block = self.block_of.get(index)
+            if block is not None and any(self.block_of.get(enemy) == block for enemy in enemies):
+                raise ValueError(f"Widersprüchliche Regeln: {students[index]} soll zusammen und getrennt sein.")
+
+        self.attribute_names = []
+        self.codes = []
+        self.caps = []
+        for attribute, values in constraints.attributes.items():
+            codes = array('i', [-1]) * self.size
+            categories = {}
+            tallies = []
+            for student, value in values.items():
+                for index in positions.get(student, ()):
+                    code = categories.get(value)
+                    if code is None:
+                        code = categories[value] = len(tallies)
+                        tallies.append(0)
+                    codes[index] = code
+                    tallies[code] += 1
+            if tallies:
+                self.attribute_names.append(attribute)
+                self.codes.append(codes)
+                self.caps.append([-(-tally // num_groups) for tally in tallies])
+
+    def new_counts(self):
+        """Erzeugt leere Merkmalszähler (pro Merkmal ein Feld Gruppen × Kategorien).
+
+        :rtype: list
+        """
+        return [array('i', [0]) * (self.num_groups * len(caps)) for caps in self.caps]
+
+    def units(self, order):
+        """Fasst eine Schülerreihenfolge zu Platzierungseinheiten zusammen.
+
+        Blöcke erscheinen an der Stelle ihres ersten Mitglieds, alle anderen Schüler einzeln.
+
+        :param order: Die Schülerindizes.
+        :type order: list
+        :rtype: list
+        """
+        block_of = self.block_of
+        seen = set()
+        units = []
+        for student in order:
+            block = block_of.get(student)
+            if block is None:
+                units.append((student,))
+            elif block not in seen:
+                seen.add(block)
+                units.append(self.blocks[block])
+        return units
+
+    def fits(self, unit, group, group_of, counts):
+        """Prüft, ob eine Einheit in eine Gruppe passt, ohne eine Regel zu verletzen.
+
+        :param unit: Die Schülerindizes der Einheit.
+        :type unit: tuple
+        :param group: Die Nummer der Zielgruppe.
+        :type group: int
+        :param group_of: Die Gruppe je Schülerindex (-1 = noch nicht zugeteilt).
+        :type group_of: array.array
+        :param counts: Die Merkmalszähler aus :meth:`new_counts`.
+        :type counts: list
+        :rtype: bool
+        """
+        apart = self.apart
+        for student in unit:
+            for enemy in apart.get(student, ()):
+                if group_of[enemy] == group:
+                    return False
+        for codes, caps, tally in zip(self.codes, self.caps, counts):
+            base = group * len(caps)
+            if len(unit) == 1:
+                code = codes[unit[0]]
+                if code >= 0 and tally[base + code] >= caps[code]:
+                    return False
+                continue
+            extra = defaultdict(int)
+            for student in unit:
+                code = codes[student]
+                if code >= 0:
+                    extra[code] += 1
+                    if tally[base + code] + extra[code] > caps[code]:
+                        return False
+        return True
+
+    def place(self, unit, group, group_of, counts):
+        """Trägt eine Einheit in ``group_of`` und die Merkmalszähler ein.
+
+        :param unit: Die Schülerindizes der Einheit.
+        :type unit: tuple
+        :param group: Die Nummer der Zielgruppe.
+        :type group: int
+        :param group_of: Die Gruppe je Schülerindex.
+        :type group_of: array.array
+        :param counts: Die Merkmalszähler.
+        :type counts: list
+        """
+        for student in unit:
+            group_of[student] = group
+        for codes, caps, tally in zip(self.codes, self.caps, counts):
+            base = group * len(caps)
+            for student in unit:
+                code = codes[student]
+                if code >= 0:
+                    tally[base + code] += 1
+
+    def assign(self, index_groups):
+        """Baut ``group_of`` und die Merkmalszähler für eine fertige Runde auf.
+
+        :param index_groups: Die Gruppen als Listen von Schülerindizes.
+        :type index_groups: list
+        :return: Tupel aus ``group_of`` und Merkmalszählern.
+        :rtype: tuple
+        """
+        group_of = array('i', [-1]) * self.size
+        counts = self.new_counts()
+        for group, members in enumerate(index_groups):
+            self.place(members, group, group_of, counts)
+        return group_of, counts
+
+    def swap_allowed(self, a, b, group_of, counts):
+        """Prüft, ob zwei Schüler aus verschiedenen Gruppen regelkonform getauscht werden können.
+
+        Mitglieder von Zusammen-Blöcken werden nie einzeln getauscht.
+
+        :param a: Schülerindex in der ersten Gruppe.
+        :type a: int
+        :param b: Schülerindex in der zweiten Gruppe.
+        :type b: int
+        :param group_of: Die Gruppe je Schülerindex.
+        :type group_of: array.array
+        :param counts: Die Merkmalszähler.
+        :type counts: list
+        :rtype: bool
+        """
+        if a in self.block_of or b in self.block_of:
+            return False
+        g, h = group_of[a], group_of[b]
+        apart = self.apart
+        for enemy in apart.get(a, ()):
+            if enemy != b and group_of[enemy] == h:
+                return False
+        for enemy in apart.get(b, ()):
+            if enemy != a and group_of[enemy] == g:
+                return False
+        for codes, caps, tally in zip(self.codes, self.caps, counts):
+            code_a, code_b = codes[a], codes[b]
+            if code_a == code_b:
+                continue
+            width = len(caps)
+            if code_a >= 0 and tally[h * width + code_a] >= caps[code_a]:
+                return False
+            if code_b >= 0 and tally[g * width + code_b] >= caps[code_b]:
+                return False
+        return True
+
+    def swap(self, a, b, group_of, counts):
+        """Vollzieht einen Tausch in ``group_of`` und den Merkmalszählern nach.
+
+        :param a: Schülerindex in der ersten Gruppe.
+        :type a: int
+        :param b: Schülerindex in der zweiten Gruppe.
+        :type b: int
+        :param group_of: Die Gruppe je Schülerindex.
+        :type group_of: array.array
+        :param counts: Die Merkmalszähler.
+        :type counts: list
+        """
+        g, h = group_of[a], group_of[b]
+        group_of[a], group_of[b] = h, g
+        for codes, caps, tally in zip(self.codes, self.caps, counts):
+            code_a, code_b = codes[a], codes[b]
+            width = len(caps)
+            if code_a >= 0:
+                tally[g * width + code_a] -= 1
+                tally[h * width + code_a] += 1
+            if code_b >= 0:
+                tally[h * width + code_b] -= 1
+                tally[g * width + code_b] += 1
+
+    def violations(self, index_groups):
+        """Zählt die Regelverletzungen einer fertigen Runde.
+
+        Gezählt werden getrennte Paare in derselben Gruppe, auseinandergerissene Blöcke
+        und Schüler über der Merkmalsobergrenze ihrer Gruppe.
+
+        :param index_groups: Die Gruppen als Listen von Schülerindizes.
+        :type index_groups: list
+        :rtype: int
+        """
+        group_of, counts = self.assign(index_groups)
+        count = sum(1 for student, enemies in self.apart.items() for enemy in enemies
+                    if student < enemy and group_of[student] == group_of[enemy])
+        count += sum(1 for block in self.blocks if len({group_of[j] for j in block}) > 1)
+        for caps, tally in zip(self.caps, counts):
+            width = len(caps)
+            count += sum(max(0, value - caps[pos % width]) for pos, value in enumerate(tally))
+        return count
+
+
+class Instrumentation:
+    """Optionale Messung der Hot-Path-Methoden eines :class:`GroupCalculator`.
+
+    Mit :meth:`GroupCalculator.enable_instrumentation` werden die Methoden aus
+    :attr:`METHODS` nur für diese eine Instanz durch messende Hüllen ersetzt. Ist die
+    Messung aus, existieren keine Hüllen und die Methoden laufen ohne jeden Mehraufwand.
+
+    Erfasst werden Aufrufe, Gesamt- und Höchstdauer pro Methode sowie Zähler (Runden,
+    Wiederholungen, platzierte Schüler). Optional zeichnet ``cProfile`` die äußersten
+    Aufrufe auf und ``tracemalloc`` den zusätzlichen Speicher-Spitzenwert pro Methode.
+
+    :param profile: Ob ``cProfile`` mitläuft.
+    :type profile: bool
+    :param memory: Ob ``tracemalloc`` den Speicher-Spitzenwert misst.
+    :type memory: bool
+    """
+
+    #: Die gemessenen Methoden.
+    METHODS = ("create_groups", "create_schedule", "select_from_file", "can_repeat", "feasibility",
+               "add_students", "remove_students", "_avoid_repeats", "_repair_repeats", "_optimize_round",
+               "_build_constrained", "_store_round")
+
+    def __init__(self, profile=False, memory=False):
+        """Initialisiert leere Messwerte."""
+        self.timings = {}
+        self.counters = defaultdict(int)
+        self.memory_peaks = {}
+        self.memory = memory
+        self.profiler = None
+        if profile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+        self._depth = 0
+        self._memory_base = 0
+        self._started_tracing = False
+
+    def wrap(self, name, method, after=None):
+        """Erzeugt die messende Hülle für eine Methode.
+
+        :param name: Der Name für die Messwerte.
+        :type name: str
+        :param method: Die gebundene Methode.
+        :type method: callable
+        :param after: Optionaler Rückruf nach einem erfolgreichen Aufruf (z.B. für Zähler).
+        :type after: callable
+        :rtype: callable
+        """
+        timings = self.timings
+        perf_counter = time.perf_counter
+
+        def measured(*args, **kwargs):
+            outer = self._depth == 0
+            if outer:
+                self._begin()
+            self._depth += 1
+            start = perf_counter()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                self._depth -= 1
+                entry = timings.get(name)
+                if entry is None:
+                    entry = timings[name] = [0, 0.0, 0.0]
+                entry[0] += 1
+                entry[1] += elapsed
+                if elapsed > entry[2]:
+                    entry[2] = elapsed
+                if outer:
+                    self._end(name)
+            if after is not None:
+                after()
+            return result
+
+        measured.__wrapped__ = method
+        return measured
+
+    def count(self, name, value=1):
+        """Erhöht einen Zähler.
+
+        :param name: Der Name des Zählers.
+        :type name: str
+        :param value: Der Zuwachs.
+        :type value: int
+        """
+        self.counters[name] += value
+
+    def start(self):
+        """Startet ``tracemalloc``, falls Speichermessung gewünscht und noch nicht aktiv ist."""
+        if self.memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+
+    def stop(self):
+        """Beendet ein von :meth:`start` gestartetes ``tracemalloc``."""
+        if self._started_tracing:
+            import tracemalloc
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _begin(self):
+        """Beginnt einen äußersten Aufruf (Profiler an, Speicher-Spitzenwert zurücksetzen)."""
+        if self.memory:
+            import tracemalloc
+            tracemalloc.reset_peak()
+            self._memory_base = tracemalloc.get_traced_memory()[0]
+        if self.profiler is not None:
+            self.profiler.enable()
+
+    def _end(self, name):
+        """Beendet einen äußersten Aufruf.
+
+        :param name: Der Name der Methode.
+        :type name: str
+        """
+        if self.profiler is not None:
+            self.profiler.disable()
+        if self.memory:
+            import tracemalloc
+            peak = tracemalloc.get_traced_memory()[1] - self._memory_base
+            self.memory_peaks[name] = max(peak, self.memory_peaks.get(name, 0))
+
+    def report(self):
+        """Fasst die Messwerte zusammen.
+
+        :return: Dictionary mit "timings" (calls, total, mean, max in Sekunden pro Methode),
+            "counters" und "memory_peaks" (Byte).
+        :rtype: dict
+        """
+        return {
+            "timings": {name: {"calls": calls, "total": total, "mean": total / calls, "max": longest}
+                        for name, (calls, total, longest) in self.timings.items()},
+            "counters": dict(self.counters),
+            "memory_peaks": dict(self.memory_peaks),
+        }
+
+    def profile_stats(self, sort="cumulative", limit=25):
+        """Gibt die ``cProfile``-Auswertung als Text zurück.
+
+        :param sort: Sortierschlüssel für ``pstats``.
+        :type sort: str
+        :param limit: Anzahl der ausgegebenen Zeilen.
+        :type limit: int
+        :rtype: str
+        :raises ValueError: Wenn ohne ``profile=True`` gemessen wurde.
+        """
+        if self.profiler is None:
+            raise ValueError("Die Messung läuft ohne cProfile.")
+        import io
+        import pstats
+        output = io.StringIO()
+        pstats.Stats(self.profiler, stream=output).sort_stats(sort).print_stats(limit)
+        return output.getvalue()
 
 
 class GroupCalculator:
@@ -13,384 +2025,898 @@ class GroupCalculator:
     :type num_students: int
     :param group_size: Die gewünschte Gruppengröße.
     :type group_size: int
+    :param seed: Startwert für :attr:`rng`, standardmäßig zufällig.
+    :type seed: int
     :raises ValueError: Wenn die Anzahl der Schüler kleiner als die Gruppengröße ist.
     """
 
-    def __init__(self, num_students, group_size):
+    #: Wie viele Kandidaten pro Gruppenplatz auf bereits begegnete Partner geprüft werden.
+    search_window = 64
+
+    def __init__(self, num_students, group_size, seed=None):
         """Initialisiert die GroupCalculator-Instanz."""
         if num_students < group_size:
             raise ValueError("Die Anzahl der Schüler muss größer oder gleich der Gruppengröße sein.")
 
         self.num_students = num_students
         self.group_size = group_size
-        self.groups = defaultdict(dict)
-        self.previous_combinations = set()
+        self.groups = RoundStore()
         self.round_counter = 1
+        self.last_repeat_count = 0
+        self.optimizer_stats = {}
+        self.rng = RoundRandom(seed)
+        self.roster = None
+        self.session_store = None
+        self.instrumentation = None
+        self.constraints = Constraints()
+        self._constraint_key = (None, None)  # Zwischengespeicherte Regeln (Objekt, Version)
+        self.last_constraint_violations = 0
         self.student_list = list(range(1, num_students + 1))  # Schüler als Zahlen (1, 2, 3, ...)
         self.delimiter = ","
         self.skip_header = False
         self.first_name_col = 0
         self.last_name_col = 1
+        # Regeln beim Laden einer CSV-Datei: Regeldatei und zusätzliche Spalten
+        self.constraint_file = None
+        self.together_col = None
+        self.apart_col = None
+        self.balance_cols = {}
+
+    @property
+    def student_list(self):
+        """Die aktuelle Schülerliste (Zahlen oder Namen).
+
+        Beim Zuweisen einer neuen Liste wird die Paar-Historie neu angelegt, da sich die
+        Schülerindizes ändern.
+        """
+        return self._student_list
+
+    @student_list.setter
+    def student_list(self, students):
+        self._assign_students(students, array('i', map(self.groups.intern, students)))
+
+    def _assign_students(self, students, name_ids):
+        """Setzt die Schülerliste mit bereits bekannten Namens-IDs (siehe :attr:`student_list`).
+
+        :param students: Die neue Schülerliste.
+        :type students: list
+        :param name_ids: Die Namens-ID je Schüler in :attr:`groups`.
+        :type name_ids: array.array
+        """
+        self._student_list = students
+        self._name_ids = name_ids
+        self.previous_combinations = make_pair_history(len(students))
+        self._current_index_groups = None
+        self._constraint_index = None
+        if self.session_store is not None:
+            self.session_store.begin(self)
 
     def reset_groups(self):
         """Setzt alle Gruppen und Runden zurück."""
         self.groups.clear()
         self.round_counter = 0
-
-    def create_groups(self):
-        """Erstellt Gruppen für die aktuelle Runde."""
+        self.previous_combinations.clear()
+        self._current_index_groups = None
+        if self.session_store is not None:
+            self.session_store.begin(self)
+
+    def enable_instrumentation(self, profile=False, memory=False):
+        """Schaltet die Messung der Hot-Path-Methoden ein (siehe :class:`Instrumentation`).
+
+        :param profile: Ob ``cProfile`` mitläuft.
+        :type profile: bool
+        :param memory: Ob ``tracemalloc`` den Speicher-Spitzenwert misst.
+        :type memory: bool
+        :return: Die neue Messung.
+        :rtype: Instrumentation
+        """
+        self.disable_instrumentation()
+        instrumentation = Instrumentation(profile, memory)
+
+        def count_round():
+            instrumentation.count("rounds")
+            instrumentation.count("repeats", self.last_repeat_count)
+            instrumentation.count("students_placed", len(self._student_list))
+
+        for name in Instrumentation.METHODS:
+            after = count_round if name == "_store_round" else None
+            setattr(self, name, instrumentation.wrap(name, getattr(self, name), after))
+        instrumentation.start()
+        self.instrumentation = instrumentation
+        return instrumentation
+
+    def disable_instrumentation(self):
+        """Schaltet die Messung aus und entfernt alle Hüllen.
+
+        :return: Die beendete Messung (mit ihren Messwerten) oder None.
+        :rtype: Instrumentation
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            for name in Instrumentation.METHODS:
+                self.__dict__.pop(name, None)
+            instrumentation.stop()
+            self.instrumentation = None
+        return instrumentation
+
+    def start_session(self, path):
+        """Speichert ab jetzt jede neue Runde in einem Sitzungsprotokoll.
+
+        Das Protokoll beginnt mit der aktuellen Schülerliste; bereits vorhandene Runden
+        werden nicht übernommen. Fortsetzen mit ``SessionStore(path).resume()``.
+
+        :param path: Der Pfad der Protokolldatei.
+        :type path: str
+        :return: Der verwendete Speicher.
+        :rtype: SessionStore
+        """
+        self.session_store = SessionStore(path)
+        self.session_store.begin(self)
+        return self.session_store
+
+    def create_groups(self, strategy="greedy", time_budget=0.05):
+        """Erstellt Gruppen für die aktuelle Runde.
+
+        Die Schülerindizes werden einmal gemischt und anschließend in zusammenhängende
+        Abschnitte der Gruppengröße zerlegt. Dabei wird jeder Gruppenplatz mit dem ersten
+        Kandidaten aus einem begrenzten Suchfenster besetzt, der noch keinem Mitglied der
+        Gruppe begegnet ist. Alle Paare der Runde werden danach in
+        :attr:`previous_combinations` eingetragen, sodass eine Runde nahezu linear bleibt.
+
+        Mit ``strategy="optimize"`` wird die Runde anschließend per Simulated Annealing
+        weiter verbessert (siehe :meth:`_optimize_round`). Das Ergebnis steht in
+        :attr:`optimizer_stats`.
+
+        Enthält :attr:`constraints` Regeln, baut :meth:`_build_constrained` die Runde auf;
+        die Anzahl nicht erfüllbarer Regeln steht danach in :attr:`last_constraint_violations`.
+
+        :param strategy: "greedy" (Standard) oder "optimize".
+        :type strategy: str
+        :param time_budget: Maximale Laufzeit der Optimierung in Sekunden.
+        :type time_budget: float
+        :raises ValueError: Bei einer unbekannten Strategie oder unerfüllbaren Regeln.
+        """
+        if strategy not in ("greedy", "optimize"):
+            raise ValueError(f"Unbekannte Strategie: {strategy}")
         if not self.student_list:
             return
 
-        # Schülerliste neu mischen
-        random.shuffle(self.student_list)
-        current_groups = {}
-        available_students = set(self.student_list)
-        group_id = 'A'
-
-        while len(available_students) >= self.group_size:
-            group = set()
-            for student in list(available_students):
-                if len(group) < self.group_size:
-                    group.add(student)
-                    available_students.remove(student)
-            current_groups[group_id] = list(group)
-            group_id = chr(ord(group_id) + 1)
-
-        remaining_students = list(available_students)
-        if remaining_students:
-            group_keys = list(current_groups.keys())
-            for i, student in enumerate(remaining_students):
-                current_groups[group_keys[i % len(group_keys)]].append(student)
+        # Schülerindizes mit dem Strom der neuen Runde mischen (siehe round_order)
+        rng = self.rng.for_round(self.round_counter + 1)
+        order = list(range(len(self.student_list)))
+        rng.shuffle(order)
+        constraint_index = self._indexed_constraints()
+        if constraint_index is not None:
+            index_groups = self._build_constrained(order, constraint_index)
+            if strategy == "optimize":
+                self.optimizer_stats = self._optimize_round(index_groups, time_budget, constraint_index, rng)
+            self.last_constraint_violations = constraint_index.violations(index_groups)
+            self._store_round(index_groups)
+            return
+
+        clean = self._avoid_repeats(order)
+        index_groups = partition_round(order, self.group_size)
+        if not clean:
+            self._repair_repeats(list(index_groups.values()))
+        if strategy == "optimize":
+            self.optimizer_stats = self._optimize_round(list(index_groups.values()), time_budget, rng=rng)
+
+        self._store_round(list(index_groups.values()))
+
+    def _store_round(self, index_groups):
+        """Übernimmt eine fertige Runde: Paar-Historie, Rundenspeicher und Sitzungsprotokoll.
+
+        :param index_groups: Die Gruppen als Listen von Schülerindizes (in Reihenfolge A, B, ...).
+        :type index_groups: list
+        """
+        repeats = 0
+        for members in index_groups:
+            repeats += self.previous_combinations.mark_group(members)
+        self.last_repeat_count = repeats
 
         self.round_counter += 1
-        self.groups[self.round_counter] = current_groups
+        self._publish_round(index_groups)
 
-    def get_current_groups(self):
-        """Gibt die Gruppen der aktuellen Runde zurück.
+    def _publish_round(self, index_groups):
+        """Speichert die aktuelle Runde in :attr:`groups` und hängt sie an das Sitzungsprotokoll an.
 
-        :return: Ein Dictionary mit den Gruppen der aktuellen Runde.
-        :rtype: dict
+        :param index_groups: Die Gruppen als Listen von Schülerindizes (in Reihenfolge A, B, ...).
+        :type index_groups: list
         """
-        return self.groups.get(self.round_counter, {})
+        self._current_index_groups = index_groups
+        self.groups.add(self.round_counter, index_groups, self._name_ids)
+        if self.session_store is not None:
+            self.session_store.append_round(self, index_groups)
 
-    def get_round_count(self):
-        """Gibt die Anzahl der erstellten Runden zurück.
+    def add_students(self, students):
+        """Fügt Schüler hinzu, ohne die aktuelle Runde neu zu mischen.
 
-        :return: Die Anzahl der Runden.
-        :rtype: int
+        Die neuen Schüler werden in Gruppen mit freien Plätzen eingeordnet (bevorzugt
+        ohne bekannte Partner); reicht der Platz nicht, entstehen neue Gruppen am Ende.
+        Die Paar-Historie wird nur um die neuen Indizes erweitert.
+
+        :param students: Die neuen Schüler (Zahlen oder Namen).
+        :type students: list
         """
-        return self.round_counter
+        first = len(self._student_list)
+        self._extend_students(students)
+        self._log_change({"add": list(students)})
+        self._rebalance_current_round(list(range(first, self.num_students)))
+
+    def _extend_students(self, students):
+        """Hängt Schüler an Liste, Namens-IDs und Paar-Historie an."""
+        self._student_list.extend(students)
+        self._name_ids.extend(map(self.groups.intern, students))
+        self.num_students = len(self._student_list)
+        self.previous_combinations.resize(self.num_students)
+        self._constraint_index = None
+
+    def remove_students(self, students):
+        """Entfernt Schüler, ohne die aktuelle Runde neu zu mischen.
+
+        Der letzte Schüler der Liste rückt jeweils auf den frei gewordenen Index nach.
+        Nur Gruppen, die dadurch zu klein werden, erhalten Mitglieder aus anderen Gruppen.
+
+        :param students: Die zu entfernenden Schüler (Zahlen oder Namen).
+        :type students: list
+        :raises ValueError: Wenn ein Schüler nicht in der Liste ist.
+        """
+        self._drop_students(students)
+        self._log_change({"remove": list(students)})
+        self._rebalance_current_round([])
 
-    def select_from_file(self, file_path):
-        """Lädt Namen aus einer CSV-Datei mit den konfigurierten Optionen für Delimiter und Header.
+    def _drop_students(self, students):
+        """Entfernt Schüler aus Liste, Namens-IDs, Paar-Historie und aktueller Runde.
 
-        :param file_path: Der Pfad zur CSV-Datei.
-        :type file_path: str
+        :raises ValueError: Wenn ein Schüler nicht (oder mehrfach) angegeben ist; die
+            Liste bleibt dann unverändert.
         """
-        with open(file_path, newline='', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile, delimiter=self.delimiter)
-            if self.skip_header:
-                next(reader, None)  # Überspringt die Kopfzeile, falls eingestellt
+        positions = {student: index for index, student in enumerate(self._student_list)}
+        missing = [student for student in students if student not in positions]
+        if missing or len(set(students)) != len(students):
+            raise ValueError(f"Schüler nicht gefunden: {(missing or students)[0]}")
+        history = self.previous_combinations
+        current = self._current_index_groups
+        location = {member: group for group in current for member in group} if current else {}
+
+        for student in students:
+            index = positions.pop(student)
+            last = len(self._student_list) - 1
+            if index in location:
+                location.pop(index).remove(index)
+            if index != last:
+                moved = self._student_list[last]
+                self._student_list[index] = moved
+                self._name_ids[index] = self._name_ids[last]
+                positions[moved] = index
+                history.move(last, index)
+                if last in location:
+                    group = location.pop(last)
+                    group[group.index(last)] = index
+                    location[index] = group
+            self._student_list.pop()
+            self._name_ids.pop()
+            history.resize(last)
+
+        self.num_students = len(self._student_list)
+        self._constraint_index = None
+
+    def _log_change(self, change):
+        """Protokolliert eine Änderung im Sitzungsprotokoll (siehe :meth:`SessionStore.append_change`)."""
+        if self.session_store is not None:
+            self.session_store.append_change(change)
+
+    def _apply_change(self, change):
+        """Vollzieht eine protokollierte Änderung beim Fortsetzen nach.
+
+        Die Gruppen der aktuellen Runde werden dabei nicht angepasst; die angepasste
+        Runde folgt im Protokoll als eigener Datensatz.
+
+        :param change: Die Änderung aus :meth:`SessionStore.append_change`.
+        :type change: dict
+        """
+        self._current_index_groups = None
+        if "add" in change:
+            self._extend_students(change["add"])
+        if "remove" in change:
+            self._drop_students(change["remove"])
+        if "group_size" in change:
+            self.group_size = change["group_size"]
+            self._constraint_index = None
+
+    def set_num_students(self, num_students):
+        """Passt eine Schülerliste aus Zahlen (1, 2, 3, ...) an eine neue Anzahl an.
+
+        :param num_students: Die neue Anzahl der Schüler.
+        :type num_students: int
+        """
+        current = len(self._student_list)
+        if num_students > current:
+            self.add_students(list(range(current + 1, num_students + 1)))
+        elif num_students < current:
+            self.remove_students(list(range(current, num_students, -1)))
 
-            self.student_list = [f"{row[self.first_name_col]} {row[self.last_name_col]}" for row in reader
-                                 if len(row) > max(self.first_name_col, self.last_name_col)]
+    def set_group_size(self, group_size):
+        """Ändert die Gruppengröße und passt nur die betroffenen Gruppen der aktuellen Runde an.
 
-    def visualize_groups(self):
-        """Gibt die aktuellen Gruppen aus."""
-        for round_num, groups in self.groups.items():
-            print(f"Runde {round_num}:")
-            for group_name, students in groups.items():
-                print(f"  Gruppe {round_num}{group_name}: {students}")
-            print()
+        :param group_size: Die neue Gruppengröße.
+        :type group_size: int
+        """
+        self.group_size = group_size
+        self._constraint_index = None
+        self._log_change({"group_size": group_size})
+        self._rebalance_current_round([])
 
-    def can_repeat(self):
-        """Berechnet die maximale Anzahl an möglichen Gruppierungen ohne Wiederholung gleicher Paarungen.
+    def _release_round_pairs(self, number):
+        """Entfernt die Paare einer Runde aus der Paar-Historie, die in keiner anderen Runde vorkommen.
 
-        :return: Die maximale Anzahl der möglichen Runden ohne Wiederholungen.
-        :rtype: int
+        Wird aufgerufen, bevor eine gespeicherte Runde durch eine angepasste Fassung
+        ersetzt wird; deren Paare werden danach neu eingetragen. Die Anzahl gemeinsamer
+        Runden stammt aus dem umgekehrten Index (:attr:`RoundStore.index`).
+
+        :param number: Die Rundennummer.
+        :type number: int
         """
-        num_pairs_per_round = (self.num_students // self.group_size) * (self.group_size * (self.group_size - 1) // 2)
-        total_unique_pairs = math.comb(self.num_students, 2)
-        return total_unique_pairs // num_pairs_per_round if num_pairs_per_round > 0 else 1
+        history = self.previous_combinations
+        with self.groups.lock:
+            record = self.groups.round(number)
+            partners = self.groups.index.partners
+            position = {name_id: index for index, name_id in enumerate(self._name_ids)}
+            for group in range(len(record)):
+                members = [name_id for name_id in record.group(group) if name_id in position]
+                for offset, name_id in enumerate(members):
+                    shared = partners.get(name_id, {})
+                    for other in members[offset + 1:]:
+                        if shared.get(other, 0) <= 1:
+                            history.unmark(position[name_id], position[other])
+
+    def _rebalance_current_round(self, pool):
+        """Bringt die Gruppen der aktuellen Runde mit möglichst wenigen Umsetzungen auf Sollgröße.
+
+        Überzählige Gruppen werden vom Ende her aufgelöst, zu große Gruppen geben
+        Mitglieder ab, zu kleine Gruppen werden zuerst aus ``pool`` und dann aus den
+        größten Gruppen aufgefüllt. Alle übrigen Schüler bleiben, wo sie sind. Die Paare
+        der bisherigen Fassung werden vorher aus der Paar-Historie genommen (sofern sie
+        nicht auch in einer früheren Runde vorkommen), die der neuen danach eingetragen;
+        gesetzte Regeln werden beim Einordnen beachtet, soweit es die Gruppengrößen erlauben.
+
+        :param pool: Indizes von Schülern ohne Gruppe (z.B. neu hinzugekommene).
+        :type pool: list
+        """
+        groups = self._current_index_groups
+        if groups is None or self.round_counter not in self.groups:
+            return
+        self._release_round_pairs(self.round_counter)
+
+        total = len(self._student_list)
+        group_size = self.group_size
+        target = max(1, total // group_size) if total else 0
+        min_size = min(group_size, total)
+        extra = total - target * group_size
+        max_size = group_size + (-(-extra // target) if extra > 0 else 0)
+
+        while len(groups) > target:
+            pool.extend(groups.pop())
+        while len(groups) < target:
+            groups.append([])
+        for group in groups:
+            while len(group) > max_size:
+                pool.append(group.pop())
+
+        history = self.previous_combinations
+        constraint_index = self._indexed_constraints()
+        if constraint_index is not None:
+            group_of, counts = constraint_index.assign(groups)
+
+        def blocked(student, number):
+            if constraint_index is None:
+                return False
+            return not constraint_index.fits((student,), number, group_of, counts)
+
+        def place(student, candidates):
+            number = min(candidates, key=lambda g: (blocked(student, g), history.conflicts(student, groups[g]),
+                                                    len(groups[g])))
+            groups[number].append(student)
+            if constraint_index is not None:
+                constraint_index.place((student,), number, group_of, counts)
+
+        for number, group in enumerate(groups):
+            while len(group) < min_size:
+                if pool:
+                    student = min(pool, key=lambda s: (blocked(s, number), history.conflicts(s, group)))
+                    pool.remove(student)
+                else:
+                    donor = max(groups, key=len)
+                    student = donor.pop()
+                    if constraint_index is not None:
+                        group_of, counts = constraint_index.assign(groups)
+                place(student, [number])
+        for student in pool:
+            place(student, [number for number, group in enumerate(groups) if len(group) < max_size]
+                  or range(len(groups)))
+
+        self.last_repeat_count = sum(history.mark_group(group) for group in groups)
+        if constraint_index is not None:
+            self.last_constraint_violations = constraint_index.violations(groups)
+        self._publish_round(groups)
+
+    def _indexed_constraints(self):
+        """Gibt die Regeln in Indexform zurück und baut sie nur bei Änderungen neu auf.
+
+        :return: Der Index oder None, wenn keine Regeln gesetzt sind.
+        :rtype: ConstraintIndex
+        """
+        constraints = self.constraints
+        if not constraints:
+            return None
+        cached, version = self._constraint_key
+        if self._constraint_index is None or cached is not constraints or version != constraints.version:
+            total = len(self._student_list)
+            num_groups = max(1, total // self.group_size)
+            max_size = self.group_size + -(-(total - num_groups * self.group_size) // num_groups)
+            self._constraint_index = constraints.index(self._student_list, num_groups, max(max_size, 1))
+            self._constraint_key = (constraints, constraints.version)
+        return self._constraint_index
+
+    def _build_constrained(self, order, constraint_index):
+        """Baut eine Runde unter Beachtung der Regeln auf.
+
+        Blöcke und Einzelschüler werden in gemischter Reihenfolge (größte Blöcke zuerst)
+        platziert. Für jede Einheit werden die Gruppen ab einem umlaufenden Zeiger geprüft:
+        zuerst die Regeln über :meth:`ConstraintIndex.fits`, dann die bereits begegneten
+        Partner. Nach :attr:`search_window` Gruppen wird die beste regelkonforme Gruppe
+        genommen. Passt eine Einheit nirgends, kommt sie in die freie Gruppe mit den
+        wenigsten Konflikten; einzelne Schüler werden danach per regelkonformem Tausch
+        umgesetzt, sonst enthält die Runde eine Regelverletzung.
+
+        :param order: Die gemischten Schülerindizes.
+        :type order: list
+        :param constraint_index: Die Regeln in Indexform.
+        :type constraint_index: ConstraintIndex
+        :return: Die Gruppen als Listen von Schülerindizes (in Reihenfolge A, B, ...).
+        :rtype: list
+        """
+        history = self.previous_combinations
+        total = len(order)
+        num_groups = constraint_index.num_groups
+        sizes = [self.group_size] * num_groups if total >= self.group_size else [total]
+        for extra in range(total - sum(sizes)):
+            sizes[extra % num_groups] += 1
+
+        units = constraint_index.units(order)
+        units.sort(key=len, reverse=True)  # stabil: innerhalb gleicher Größe bleibt die Mischung
+        index_groups = [[] for _ in range(num_groups)]
+        group_of = array('i', [-1]) * len(self._student_list)
+        counts = constraint_index.new_counts()
+        window = self.search_window
+        pointer = 0
+        stuck = []
+
+        for unit in units:
+            best = best_score = None
+            for step in range(num_groups):
+                g = (pointer + step) % num_groups
+                members = index_groups[g]
+                if len(members) + len(unit) > sizes[g] or not constraint_index.fits(unit, g, group_of, counts):
+                    continue
+                score = sum(history.conflicts(student, members) for student in unit) if history.pair_count else 0
+                if best is None or score < best_score:
+                    best, best_score = g, score
+                if best_score == 0 or step >= window:
+                    break
+            if best is None:
+                # Keine regelkonforme Gruppe: Platz geht vor, danach wenigste Konflikte
+                best = min(range(num_groups), key=lambda g: (
+                    len(index_groups[g]) + len(unit) > sizes[g],
+                    sum(group_of[enemy] == g for student in unit
+                        for enemy in constraint_index.apart.get(student, ())),
+                    len(index_groups[g])))
+                if len(unit) == 1:
+                    stuck.append(unit[0])
+            index_groups[best].extend(unit)
+            constraint_index.place(unit, best, group_of, counts)
+            pointer = best + 1
+
+        for student in stuck:
+            self._swap_into_place(student, index_groups, constraint_index, group_of, counts)
+        return index_groups
+
+    @staticmethod
+    def _swap_into_place(student, index_groups, constraint_index, group_of, counts):
+        """Tauscht einen regelwidrig platzierten Schüler mit einem Schüler einer anderen Gruppe.
+
+        :param student: Der Schülerindex.
+        :type student: int
+        :param index_groups: Die Gruppen als Listen von Schülerindizes, werden direkt verändert.
+        :type index_groups: list
+        :param constraint_index: Die Regeln in Indexform.
+        :type constraint_index: ConstraintIndex
+        :param group_of: Die Gruppe je Schülerindex.
+        :type group_of: array.array
+        :param counts: Die Merkmalszähler.
+        :type counts: list
+        :return: True, wenn ein Tausch gefunden wurde.
+        :rtype: bool
+        """
+        g = group_of[student]
+        for h, other in enumerate(index_groups):
+            if h == g:
+                continue
+            for pos, partner in enumerate(other):
+                if constraint_index.swap_allowed(student, partner, group_of, counts):
+                    group = index_groups[g]
+                    group[group.index(student)], other[pos] = partner, student
+                    constraint_index.swap(student, partner, group_of, counts)
+                    return True
+        return False
+
+    def _avoid_repeats(self, order):
+        """Ordnet die gemischten Indizes so um, dass bereits begegnete Paare vermieden werden.
+
+        Für jeden Platz einer Gruppe werden höchstens :attr:`search_window` nachfolgende
+        Kandidaten geprüft und der erste passende nach vorne getauscht. Übrige Schüler
+        werden anschließend durch Tauschen ganzer Gruppenblöcke einer passenden Gruppe
+        zugeordnet. Findet sich kein passender Kandidat, bleibt die Wiederholung bestehen.
+
+        :param order: Die gemischten Schülerindizes, wird direkt verändert.
+        :type order: list
+        :return: True, wenn jeder Platz ohne Wiederholung besetzt werden konnte.
+        :rtype: bool
+        """
+        history = self.previous_combinations
+        if not history.pair_count:
+            return True
+
+        has_met = history.has_met
+        group_size = self.group_size
+        window = self.search_window
+        total = len(order)
+        num_groups = total // group_size
+        clean = True
+
+        for start in range(0, num_groups * group_size, group_size):
+            for pos in range(start + 1, start + group_size):
+                members = order[start:pos]
+                for candidate in range(pos, min(total, pos + window)):
+                    student = order[candidate]
+                    if not any(has_met(student, member) for member in members):
+                        order[pos], order[candidate] = student, order[pos]
+                        break
+                else:
+                    clean = False
+
+        # Übrige Schüler werden reihum den Gruppen A, B, ... zugeteilt (siehe partition_round)
+        for i, student in enumerate(order[num_groups * group_size:]):
+            for block in range(i, min(num_groups, i + window)):
+                begin = block * group_size
+                if not any(has_met(student, member) for member in order[begin:begin + group_size]):
+                    if block != i:
+                        target = i * group_size
+                        order[target:target + group_size], order[begin:begin + group_size] = \
+                            order[begin:begin + group_size], order[target:target + group_size]
+                    break
+            else:
+                clean = False
+        return clean
+
+    def _repair_repeats(self, index_groups):
+        """Beseitigt verbliebene Wiederholungen durch Tauschen einzelner Schüler.
+
+        Ein Schüler, der einem Gruppenmitglied schon begegnet ist, wird mit einem Schüler
+        aus einer der nächsten :attr:`search_window` Gruppen getauscht, sofern danach beide
+        in ihrer neuen Gruppe niemandem mehr begegnet sind. Jeder Tausch verringert also
+        die Anzahl der Wiederholungen.
+
+        :param index_groups: Die Gruppen als Listen von Schülerindizes, werden direkt verändert.
+        :type index_groups: list
+        """
+        history = self.previous_combinations
+        if not history.pair_count:
+            return
 
+        has_met = history.has_met
+        count = len(index_groups)
+        for g, members in enumerate(index_groups):
+            for pos in range(len(members)):
+                student = members[pos]
+                others = members[:pos] + members[pos + 1:]
+                if not any(has_met(student, member) for member in others):
+                    continue
+                for offset in range(1, min(count, self.search_window + 1)):
+                    target = index_groups[(g + offset) % count]
+                    for target_pos, partner in enumerate(target):
+                        if any(has_met(partner, member) for member in others):
+                            continue
+                        rest = target[:target_pos] + target[target_pos + 1:]
+                        if not any(has_met(student, member) for member in rest):
+                            members[pos], target[target_pos] = partner, student
+                            break
+                    else:
+                        continue
+                    break
+
+    def _optimize_round(self, index_groups, time_budget, constraint_index=None, rng=random):
+        """Minimiert die Wiederholungen einer Runde durch Tauschsuche (Simulated Annealing).
+
+        Es werden zufällig zwei Schüler aus verschiedenen Gruppen getauscht. Die Änderung
+        der Wiederholungen wird nur für die beiden betroffenen Gruppen berechnet, eine
+        Bewertung kostet also O(group_size). Verschlechterungen werden mit sinkender
+        Temperatur immer seltener angenommen; die beste gefundene Runde wird übernommen.
+        Mit ``constraint_index`` werden nur Tausche versucht, die keine Regel verletzen.
+
+        :param index_groups: Die Gruppen als Listen von Schülerindizes, werden direkt verändert.
+        :type index_groups: list
+        :param time_budget: Maximale Laufzeit in Sekunden.
+        :type time_budget: float
+        :param constraint_index: Optionale Regeln in Indexform.
+        :type constraint_index: ConstraintIndex
+        :param rng: Der Zufallsstrom der Runde.
+        :type rng: random.Random
+        :return: Dictionary mit "repeats", "iterations" und "iterations_per_second".
+        :rtype: dict
+        """
+        history = self.previous_combinations
+        has_met = history.has_met
+        costs = [sum(history.conflicts(member, group[pos + 1:]) for pos, member in enumerate(group))
+                 for group in index_groups]
+        cost = best_cost = sum(costs)
+        best = [list(group) for group in index_groups]
+        count = len(index_groups)
+        if constraint_index is not None:
+            group_of, counts = constraint_index.assign(index_groups)
+
+        start = time.perf_counter()
+        deadline = start + time_budget
+        temperature = 1.0
+        iterations = 0
+        while best_cost and count > 1:
+            if iterations % 256 == 0:
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+                temperature = max(0.05, (deadline - now) / time_budget)
+            iterations += 1
+
+            # Bevorzugt eine Gruppe mit Wiederholungen wählen
+            g = rng.randrange(count)
+            for _ in range(8):
+                if costs[g]:
+                    break
+                g = rng.randrange(count)
+            h = rng.randrange(count - 1)
+            h += h >= g
+            group, other = index_groups[g], index_groups[h]
+            i, j = rng.randrange(len(group)), rng.randrange(len(other))
+            a, b = group[i], other[j]
+            if constraint_index is not None and not constraint_index.swap_allowed(a, b, group_of, counts):
+                continue
+
+            delta_g = sum(has_met(b, x) - has_met(a, x) for x in group if x != a)
+            delta_h = sum(has_met(a, y) - has_met(b, y) for y in other if y != b)
+            delta = delta_g + delta_h
+            if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+                group[i], other[j] = b, a
+                if constraint_index is not None:
+                    constraint_index.swap(a, b, group_of, counts)
+                costs[g] += delta_g
+                costs[h] += delta_h
+                cost += delta
+                if cost < best_cost:
+                    best_cost = cost
+                    best = [list(group) for group in index_groups]
+
+        for group, best_group in zip(index_groups, best):
+            group[:] = best_group
+        elapsed = time.perf_counter() - start
+        return {
+            "repeats": best_cost,
+            "iterations": iterations,
+            "iterations_per_second": iterations / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def create_schedule(self, rounds=None):
+        """Erstellt alle Runden eines Rundenplans in einem Aufruf.
+
+        Existiert für die Schülerzahl und Gruppengröße eine bekannte Konstruktion
+        (siehe :func:`resolvable_design`), werden die Runden direkt daraus abgeleitet und
+        sind garantiert wiederholungsfrei. Andernfalls oder für zusätzliche Runden wird
+        :meth:`create_groups` verwendet. Die Zuordnung der Schüler zu den Punkten der
+        Konstruktion wird zufällig gemischt. Sind Regeln gesetzt, werden die Konstruktionen
+        nicht verwendet, da sie die Regeln nicht kennen.
+
+        :param rounds: Die Anzahl der Runden, standardmäßig so viele wie die Konstruktion
+            liefert bzw. :meth:`can_repeat` erlaubt.
+        :type rounds: int
+        :return: Der Name der verwendeten Konstruktion oder "heuristic".
+        :rtype: str
+        """
+        if not self.student_list:
+            return "heuristic"
 
-class GroupApp(wx.Frame):
-    """Eine wxPython-basierte GUI-Anwendung zur Erstellung und Verwaltung von Schülergruppen."""
+        design = None if self.constraints else resolvable_design(len(self.student_list), self.group_size)
+        name, design_rounds = design if design else ("heuristic", [])
+        if rounds is None:
+            rounds = len(design_rounds) if design_rounds else self.can_repeat()
+            if rounds == math.inf:
+                rounds = 1
 
-    def __init__(self):
-        """Initialisiert die GroupApp-Instanz."""
-        super().__init__(None, title="Gruppengenerator", size=(800, 600))
-        self.panel = wx.Panel(self)
-        self.gc = GroupCalculator(group_size=3, num_students=10)
-        self.current_round = 0
-
-        # Schriftart für die UI
-        font = wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_NORMAL)
-
-        # Tabelle
-        self.grid = wx.grid.Grid(self.panel)
-        self.grid.CreateGrid(5, 2)
-        self.grid.SetColLabelValue(0, "Gruppe")
-        self.grid.SetColLabelValue(1, "Teilnehmer")
-        self.grid.SetColSize(0, 150)  # Breite der ersten Spalte
-        self.grid.SetColSize(1, 500)  # Breite der zweiten Spalte
-        self.grid.SetDefaultRowSize(30)  # Zeilenhöhe
-        self.grid.SetLabelFont(font)
-        self.grid.SetDefaultCellFont(font)
-
-        # Buttons
-        self.load_button = wx.Button(self.panel, label="CSV laden", size=(150, 40))
-        self.generate_numbers_button = wx.Button(self.panel, label="Schüler als Zahlen", size=(150, 40))
-        self.next_round_button = wx.Button(self.panel, label="Nächste Runde", size=(150, 40))
-        self.prev_round_button = wx.Button(self.panel, label="Vorherige Runde", size=(150, 40))
-        self.reset_button = wx.Button(self.panel, label="Reset", size=(150, 40))
-
-        # Eingabefelder
-        self.spin_group_size = wx.SpinCtrl(self.panel, min=2, max=10, initial=3, size=(100, 40))
-        self.spin_students = wx.SpinCtrl(self.panel, min=1, max=100, initial=10, size=(100, 40))
-
-        # Einstellungs-Widgets
-        self.delimiter_text_ctrl = wx.TextCtrl(self.panel, value=self.gc.delimiter, size=(50, 40))
-        self.skip_header_checkbox = wx.CheckBox(self.panel, label="Header überspringen")
-        self.skip_header_checkbox.SetValue(self.gc.skip_header)
-        self.first_name_col_input = wx.SpinCtrl(self.panel, min=0, max=10, initial=self.gc.first_name_col, size=(100, 40))
-        self.last_name_col_input = wx.SpinCtrl(self.panel, min=0, max=10, initial=self.gc.last_name_col, size=(100, 40))
-
-        # Rundenanzeige
-        self.round_label = wx.StaticText(self.panel, label=f"Aktuelle Runde: {self.current_round}")
-        self.round_label.SetFont(font)
-
-        # Layout mit wx.GridBagSizer für präzise Platzierung
-        sizer = wx.GridBagSizer(10, 10)  # Abstand zwischen den Elementen
-
-        # Tabelle
-        sizer.Add(self.grid, pos=(0, 0), span=(1, 4), flag=wx.EXPAND | wx.ALL, border=10)
-
-        # Buttons
-        sizer.Add(self.load_button, pos=(1, 0), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
-        sizer.Add(self.generate_numbers_button, pos=(1, 1), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
-        sizer.Add(self.prev_round_button, pos=(1, 2), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
-        sizer.Add(self.next_round_button, pos=(1, 3), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
-        sizer.Add(self.reset_button, pos=(1, 4), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
-
-        # Gruppengröße und Anzahl der Studenten
-        sizer.Add(wx.StaticText(self.panel, label="Gruppengröße:"), pos=(2, 0), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
-        sizer.Add(self.spin_group_size, pos=(2, 1), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
-        sizer.Add(wx.StaticText(self.panel, label="Anzahl der Studenten:"), pos=(2, 2), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
-        sizer.Add(self.spin_students, pos=(2, 3), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
-
-        # CSV-Einstellungen
-        sizer.Add(wx.StaticText(self.panel, label="CSV Delimiter:"), pos=(3, 0), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
-        sizer.Add(self.delimiter_text_ctrl, pos=(3, 1), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
-        sizer.Add(self.skip_header_checkbox, pos=(3, 2), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
-
-        # Spalten für Vor- und Nachname
-        sizer.Add(wx.StaticText(self.panel, label="Spalte für Vorname:"), pos=(4, 0), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
-        sizer.Add(self.first_name_col_input, pos=(4, 1), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
-        sizer.Add(wx.StaticText(self.panel, label="Spalte für Nachname:"), pos=(4, 2), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
-        sizer.Add(self.last_name_col_input, pos=(4, 3), flag=wx.ALL | wx.ALIGN_CENTER_VERTICAL, border=5)
-
-        # Rundenanzeige
-        sizer.Add(self.round_label, pos=(5, 0), span=(1, 4), flag=wx.ALL | wx.ALIGN_CENTER, border=5)
-
-        # Sizer anpassen
-        self.panel.SetSizer(sizer)
-        sizer.AddGrowableRow(0)  # Tabelle wächst vertikal
-        sizer.AddGrowableCol(0)  # Erste Spalte wächst horizontal
-        sizer.AddGrowableCol(1)
-        sizer.AddGrowableCol(2)
-        sizer.AddGrowableCol(3)
-
-        # Event-Bindings
-        self.load_button.Bind(wx.EVT_BUTTON, self.on_load_csv)
-        self.generate_numbers_button.Bind(wx.EVT_BUTTON, self.on_generate_numbers)
-        self.next_round_button.Bind(wx.EVT_BUTTON, self.on_next_round)
-        self.prev_round_button.Bind(wx.EVT_BUTTON, self.on_prev_round)
-        self.reset_button.Bind(wx.EVT_BUTTON, self.on_reset)
-        self.skip_header_checkbox.Bind(wx.EVT_CHECKBOX, self.on_toggle_header_skip)
-        self.spin_students.Bind(wx.EVT_SPINCTRL, self.on_students_changed)
-        self.spin_group_size.Bind(wx.EVT_SPINCTRL, self.on_group_size_changed)  # Event-Handler für Gruppengröße
-
-    def on_prev_round(self, event):
-        """Wechselt zur vorherigen Runde.
-
-        :param event: Das auslösende Ereignis.
-        :type event: wx.Event
-        """
-        if self.current_round > 1:
-            self.current_round -= 1
-            self.update_grid(self.gc.groups[self.current_round])
-            self.next_round_button.Enable()
-        if self.current_round == 1:
-            self.prev_round_button.Disable()
-
-        # Rundenanzeige aktualisieren
-        self.update_round_label()
-
-    def on_next_round(self, event):
-        """Erstellt eine neue Runde oder wechselt zur nächsten Runde.
-
-        :param event: Das auslösende Ereignis.
-        :type event: wx.Event
-        """
-        # Gruppen erstellen
-        self.gc.create_groups()
-        self.current_round = self.gc.get_round_count()
-        self.update_grid(self.gc.get_current_groups())
-
-        # Buttons aktivieren/deaktivieren
-        self.prev_round_button.Enable()
-        if self.gc.get_round_count() >= self.gc.can_repeat():
-            self.next_round_button.Disable()
-
-        # Rundenanzeige aktualisieren
-        self.update_round_label()
-
-    def on_reset(self, event):
-        """Setzt alle Gruppen, Runden und die Tabelle zurück.
-
-        :param event: Das auslösende Ereignis.
-        :type event: wx.Event
-        """
-        self.gc.reset_groups()
-        self.current_round = 0
-        self.update_grid({})
-        self.next_round_button.Enable()
-        self.prev_round_button.Disable()
-
-        # Rundenanzeige aktualisieren
-        self.update_round_label()
-
-        wx.MessageBox("Alle Gruppen und Runden wurden zurückgesetzt.", "Reset", wx.ICON_INFORMATION)
-
-    def on_load_csv(self, event):
-        """Lädt die CSV-Datei und zeigt eine Bestätigung an.
-
-        :param event: Das auslösende Ereignis.
-        :type event: wx.Event
-        """
-        with wx.FileDialog(self, "CSV-Datei auswählen", wildcard="CSV files (*.csv)|*.csv",
-                           style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as fileDialog:
-            if fileDialog.ShowModal() == wx.ID_CANCEL:
-                return
-
-            file_path = fileDialog.GetPath()
-            self.gc.delimiter = self.delimiter_text_ctrl.GetValue()
-            self.gc.skip_header = self.skip_header_checkbox.GetValue()
-            self.gc.first_name_col = self.first_name_col_input.GetValue()
-            self.gc.last_name_col = self.last_name_col_input.GetValue()
-
-            self.gc.select_from_file(file_path)
-            wx.MessageBox(f"{len(self.gc.student_list)} Namen geladen!", "Erfolg")
-
-            # Gruppen erstellen
-            self.gc.create_groups()
-            self.current_round = self.gc.get_round_count()
-            self.update_grid(self.gc.get_current_groups())
-            self.next_round_button.Enable()
-            self.prev_round_button.Disable()
-
-            # Rundenanzeige aktualisieren
-            self.update_round_label()
-
-    def on_generate_numbers(self, event):
-        """Generiert Schüler als Zahlen basierend auf der eingegebenen Anzahl.
-
-        :param event: Das auslösende Ereignis.
-        :type event: wx.Event
+        rng = self.rng.for_round(self.round_counter + 1)
+        mapping = list(range(len(self.student_list)))
+        rng.shuffle(mapping)
+        rng.shuffle(design_rounds)
+
+        for design_round in design_rounds[:rounds]:
+            self._store_round([[mapping[point] for point in group] for group in design_round])
+
+        for _ in range(rounds - len(design_rounds)):
+            self.create_groups()
+        return name
+
+    def get_current_groups(self):
+        """Gibt die Gruppen der aktuellen Runde zurück.
+
+        Das Dictionary wird bei jedem Aufruf aus dem kompakten :class:`Round` erzeugt.
+
+        :return: Ein Dictionary mit den Gruppen der aktuellen Runde.
+        :rtype: dict
         """
-        num_students = self.spin_students.GetValue()
-        self.gc.num_students = num_students
-        self.gc.student_list = list(range(1, num_students + 1))  # Schüler als Zahlen (1, 2, 3, ...)
-        self.gc.reset_groups()  # Gruppen zurücksetzen
+        return self.groups.get(self.round_counter, {})
 
-        # Gruppen erstellen
-        self.gc.create_groups()
-        self.current_round = self.gc.get_round_count()
-        self.update_grid(self.gc.get_current_groups())
-        self.next_round_button.Enable()
-        self.prev_round_button.Disable()
+    def get_round_count(self):
+        """Gibt die Anzahl der erstellten Runden zurück.
 
-        # Rundenanzeige aktualisieren
-        self.update_round_label()
+        :return: Die Anzahl der Runden.
+        :rtype: int
+        """
+        return self.round_counter
 
-        wx.MessageBox(f"{num_students} Schüler als Zahlen generiert.", "Erfolg")
+    def find_student(self, student):
+        """Gibt an, in welcher Gruppe ein Schüler in jeder bisherigen Runde war.
 
-    def on_students_changed(self, event):
-        """Aktualisiert die Schülerliste, wenn die Anzahl der Schüler geändert wird.
+        Beantwortet aus dem umgekehrten Index in O(Runden des Schülers), ohne alle
+        Runden zu durchsuchen.
 
-        :param event: Das auslösende Ereignis.
-        :type event: wx.Event
+        :param student: Der Schüler (Zahl oder Name).
+        :type student: str
+        :return: Liste von (Runde, Gruppe), aufsteigend nach Runde.
+        :rtype: list
+        :raises ValueError: Wenn der Schüler nie vorkam.
         """
-        num_students = self.spin_students.GetValue()
-        self.gc.num_students = num_students
-        self.gc.student_list = list(range(1, num_students + 1))  # Schüler als Zahlen (1, 2, 3, ...)
-        self.gc.reset_groups()  # Gruppen zurücksetzen
+        with self.groups.lock:
+            return [(number, group_label(position))
+                    for number, position in self.groups.index.placements(self._lookup_name(student))]
+
+    def group_in_round(self, student, round_number=None):
+        """Gibt die Gruppe eines Schülers in einer Runde zurück (O(log Runden)).
+
+        :param student: Der Schüler (Zahl oder Name).
+        :type student: str
+        :param round_number: Die Rundennummer, standardmäßig die aktuelle Runde.
+        :type round_number: int
+        :return: Die Gruppenbezeichnung oder None, wenn der Schüler nicht teilgenommen hat.
+        :rtype: str
+        :raises ValueError: Wenn der Schüler nie vorkam.
+        """
+        number = self.round_counter if round_number is None else round_number
+        with self.groups.lock:
+            position = self.groups.index.placement(self._lookup_name(student), number)
+        return None if position is None else group_label(position)
 
-        # Gruppen erstellen
-        self.gc.create_groups()
-        self.current_round = self.gc.get_round_count()
-        self.update_grid(self.gc.get_current_groups())
-        self.next_round_button.Enable()
-        self.prev_round_button.Disable()
+    def partners(self, student):
+        """Gibt alle Schüler zurück, mit denen ``student`` schon in einer Gruppe war (O(Partner)).
 
-        # Rundenanzeige aktualisieren
-        self.update_round_label()
+        :param student: Der Schüler (Zahl oder Name).
+        :type student: str
+        :return: Dictionary Partner → Anzahl gemeinsamer Runden.
+        :rtype: dict
+        :raises ValueError: Wenn der Schüler nie vorkam.
+        """
+        names = self.groups.names
+        with self.groups.lock:
+            partners = self.groups.index.partners.get(self._lookup_name(student), {})
+            return {names[name_id]: count for name_id, count in partners.items()}
 
-    def on_group_size_changed(self, event):
-        """Aktualisiert die Gruppengröße und erstellt neue Gruppen.
+    def _lookup_name(self, student):
+        """Gibt die Namens-ID eines Schülers zurück.
 
-        :param event: Das auslösende Ereignis.
-        :type event: wx.Event
+        :param student: Der Schüler (Zahl oder Name).
+        :type student: str
+        :rtype: int
+        :raises ValueError: Wenn der Schüler nie vorkam.
+        """
+        name_id = self.groups.name_id(student)
+        if name_id is None:
+            raise ValueError(f"Schüler nicht gefunden: {student}")
+        return name_id
+
+    def round_order(self, round_number):
+        """Berechnet die Mischung, mit der :meth:`create_groups` eine Runde beginnt.
+
+        Die Mischung hängt nur von ``rng.seed`` und der Rundennummer ab und kostet
+        O(Schüler), unabhängig davon, wie viele Runden davor erzeugt wurden. Die
+        endgültigen Gruppen berücksichtigen zusätzlich die Paar-Historie der Runden
+        davor; mit gleichem Startwert und ``strategy="greedy"`` ergeben sich daher
+        immer dieselben Runden.
+
+        :param round_number: Die Rundennummer.
+        :type round_number: int
+        :rtype: list
         """
-        group_size = self.spin_group_size.GetValue()
-        self.gc.group_size = group_size
-        self.gc.reset_groups()  # Gruppen zurücksetzen
+        return self.rng.permutation(round_number, len(self._student_list))
 
-        # Gruppen erstellen
-        self.gc.create_groups()
-        self.current_round = self.gc.get_round_count()
-        self.update_grid(self.gc.get_current_groups())
-        self.next_round_button.Enable()
-        self.prev_round_button.Disable()
+    def select_from_file(self, file_path, progress=None, cache=None):
+        """Lädt Namen aus einer CSV-Datei mit den konfigurierten Optionen für Delimiter und Header.
 
-        # Rundenanzeige aktualisieren
-        self.update_round_label()
+        Die Datei wird mit :func:`stream_roster` zeilenweise gelesen. Fehlerhafte Zeilen
+        stehen anschließend in ``self.roster.errors``.
 
-    def update_grid(self, groups):
-        """Aktualisiert die Tabelle mit den aktuellen Gruppen.
+        Ist :attr:`constraint_file` gesetzt oder sind Regelspalten konfiguriert
+        (:attr:`together_col`, :attr:`apart_col`, :attr:`balance_cols` als ``{merkmal: spalte}``),
+        wird :attr:`constraints` daraus neu aufgebaut. Mit Regelspalten wird ``cache`` nicht
+        verwendet, da der Zwischenspeicher nur die Namen enthält.
 
-        :param groups: Die aktuellen Gruppen.
-        :type groups: dict
+        :param file_path: Der Pfad zur CSV-Datei.
+        :type file_path: str
+        :param progress: Optionaler Rückruf ``progress(zeilen, zeilen_pro_sekunde)``.
+        :type progress: callable
+        :param cache: Optionaler Zwischenspeicher für bereits eingelesene Dateien.
+        :type cache: RosterCache
         """
-        self.grid.ClearGrid()
-        self.grid.SetRowLabelSize(0)
+        options = (self.delimiter, self.skip_header, self.first_name_col, self.last_name_col)
+        columns = [col for col in (self.together_col, self.apart_col) if col is not None]
+        columns += self.balance_cols.values()
+        if cache is not None and not columns:
+            self.roster = cache.get(file_path, *options, progress=progress)
+        else:
+            self.roster = stream_roster(file_path, *options, progress=progress, extra_cols=columns)
+        students = self.roster.students()
+        self._assign_students(students, self.groups.intern_roster(self.roster))
+
+        if columns or self.constraint_file:
+            constraints = Constraints.from_file(self.constraint_file, self.delimiter) \
+                if self.constraint_file else Constraints()
+            extra = self.roster.extra
+            constraints.add_columns(
+                students,
+                together=extra.get(self.together_col),
+                apart=extra.get(self.apart_col),
+                attributes={name: extra[col] for name, col in self.balance_cols.items()})
+            self.constraints = constraints
+
+    def visualize_groups(self):
+        """Gibt die aktuellen Gruppen aus."""
+        for round_num, groups in self.groups.items():
+            print(f"Runde {round_num}:")
+            for group_name, students in groups.items():
+                print(f"  Gruppe {round_num}{group_name}: {students}")
+            print()
 
-        if len(groups) > self.grid.GetNumberRows():
-            self.grid.AppendRows(len(groups) - self.grid.GetNumberRows())
+    def feasibility(self):
+        """Gibt die Schranken für wiederholungsfreie Runden der aktuellen Einstellungen zurück.
 
-        for row_idx, (group_name, students) in enumerate(groups.items()):
-            self.grid.SetCellValue(row_idx, 0, group_name)
-            self.grid.SetCellValue(row_idx, 1, ", ".join(map(str, students)))  # Schüler als Zahlen oder Namen darstellen
+        Nach dem ersten Aufruf für eine Schülerzahl und Gruppengröße kostet jeder weitere O(1)
+        (siehe :func:`round_bounds`).
 
-        self.grid.ForceRefresh()
+        :rtype: RoundBounds
+        """
+        return round_bounds(len(self._student_list), self.group_size)
 
-    def update_round_label(self):
-        """Aktualisiert die Rundenanzeige."""
-        self.round_label.SetLabel(f"Aktuelle Runde: {self.current_round}")
+    def can_repeat(self):
+        """Berechnet die maximale Anzahl an möglichen Gruppierungen ohne Wiederholung gleicher Paarungen.
 
-    def on_toggle_header_skip(self, event):
-        """Aktiviert oder deaktiviert das Überspringen des Headers.
+        Ab dieser Rundenzahl sind Wiederholungen garantiert; ob sie erreichbar ist, gibt
+        ``feasibility().exact`` an.
 
-        :param event: Das auslösende Ereignis.
-        :type event: wx.Event
+        :return: Die maximale Anzahl der möglichen Runden ohne Wiederholungen.
+        :rtype: int
         """
-        self.gc.skip_header = self.skip_header_checkbox.GetValue()
+        return self.feasibility().upper
 
 
 if __name__ == "__main__":
-    app = wx.App(False)
-    frame = GroupApp()
-    frame.Show()
-    app.MainLoop()
\ No newline at end of file
+    # Die GUI wird erst hier geladen, damit das Modul auch ohne wxPython importierbar ist
+    try:
+        from GroupCalculator.GroupApp import main
+    except ImportError:  # Direkter Aufruf aus dem Modulverzeichnis
+        from GroupApp import main
+    main()
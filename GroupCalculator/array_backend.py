@@ -0,0 +1,177 @@
+"""Array-basiertes Backend für sehr große Jahrgänge und viele Runden.
+
+Schüler werden als ``int32``-Indizes gehalten, eine Runde als 2-D-Array der Form
+``(Gruppenanzahl, Gruppengröße)`` plus einem Array der übrigen Schüler. Die Anzahl der
+Begegnungen je Paar wird in einem dreieckig gespeicherten ``uint32``-Zählarray per
+gebündelter Scatter-Addition fortgeschrieben.
+"""
+import numpy as np
+
+try:
+    from GroupCalculator.GroupCalculator import group_labels
+except ImportError:  # Direkter Aufruf aus dem Modulverzeichnis
+    from GroupCalculator import group_labels
+
+
+class ArrayBackend:
+    """Erzeugt Runden vektorisiert mit NumPy.
+
+    Im Gegensatz zu :meth:`GroupCalculator.create_groups` werden Wiederholungen nicht
+    vermieden, sondern nur gezählt (:meth:`pair_count`, :meth:`repeat_count`). Die
+    Zuordnung Name ↔ Index bleibt erhalten, sodass die gewohnte Dictionary-Ansicht
+    jederzeit mit :meth:`to_dict` erzeugt werden kann.
+
+    :param students: Die Schüler (Zahlen oder Namen); ihre Position ist der Index.
+    :type students: list
+    :param group_size: Die gewünschte Gruppengröße.
+    :type group_size: int
+    :param seed: Startwert des Zufallsgenerators.
+    :type seed: int
+    :raises ValueError: Wenn weniger Schüler als die Gruppengröße vorhanden sind.
+    """
+
+    def __init__(self, students, group_size, seed=None):
+        """Initialisiert das Backend mit leerer Rundenliste und leeren Paarzählern."""
+        if len(students) < group_size:
+            raise ValueError("Die Anzahl der Schüler muss größer oder gleich der Gruppengröße sein.")
+
+        self.names = list(students)
+        self.group_size = group_size
+        self.ids = np.arange(len(self.names), dtype=np.int32)
+        self.rng = np.random.default_rng(seed)
+        self.rounds = []
+        size = len(self.names)
+        # uint32: in kleinen Klassen treffen sich Paare fast jede Runde, uint16 liefe früh über
+        self.pair_counts = np.zeros(size * (size - 1) // 2, dtype=np.uint32)
+        self._index_of = None
+
+        # Paarpositionen innerhalb einer Gruppe (obere Dreiecksmatrix)
+        self._left, self._right = np.triu_indices(group_size, 1)
+
+    @classmethod
+    def from_calculator(cls, calculator, seed=None):
+        """Erzeugt ein Backend aus der Schülerliste und Gruppengröße eines GroupCalculator.
+
+        :param calculator: Die Quelle für Schülerliste und Gruppengröße.
+        :type calculator: GroupCalculator
+        :param seed: Startwert des Zufallsgenerators.
+        :type seed: int
+        :return: Das neue Backend.
+        :rtype: ArrayBackend
+        """
+        return cls(calculator.student_list, calculator.group_size, seed=seed)
+
+    @property
+    def num_groups(self):
+        """Anzahl der Gruppen pro Runde."""
+        return len(self.names) // self.group_size
+
+    def index_of(self, name):
+        """Gibt den Index eines Schülers zurück.
+
+        :param name: Der Name oder die Nummer des Schülers.
+        :return: Der Index in :attr:`names`.
+        :rtype: int
+        :raises KeyError: Wenn der Schüler unbekannt ist.
+        """
+        if self._index_of is None:
+            self._index_of = {name: index for index, name in enumerate(self.names)}
+        return self._index_of[name]
+
+    def _split(self, permutations):
+        """Zerlegt Permutationen (eine pro Zeile) in Gruppen und übrige Schüler."""
+        full = self.num_groups * self.group_size
+        groups = permutations[:, :full].reshape(len(permutations), self.num_groups, self.group_size)
+        return groups, permutations[:, full:]
+
+    def _pair_indices(self, groups, remainders):
+        """Liefert die Dreiecksindizes aller Paare der übergebenen Runden."""
+        left = [groups[:, :, self._left].ravel()]
+        right = [groups[:, :, self._right].ravel()]
+
+        # Übrige Schüler gehören reihum zu den Gruppen A, B, ... (wie in partition_round)
+        rest = remainders.shape[1]
+        if rest:
+            targets = np.arange(rest) % groups.shape[1]
+            left.append(np.repeat(remainders, groups.shape[2], axis=1).ravel())
+            right.append(groups[:, targets, :].ravel())
+            for k in range(rest):
+                for m in range(k + 1, rest):
+                    if targets[k] == targets[m]:
+                        left.append(remainders[:, k])
+                        right.append(remainders[:, m])
+
+        a = np.concatenate(left).astype(np.int64)
+        b = np.concatenate(right).astype(np.int64)
+        low, high = np.minimum(a, b), np.maximum(a, b)
+        return high * (high - 1) // 2 + low
+
+    def generate(self, rounds, batch_size=64):
+        """Erzeugt mehrere Runden und schreibt die Paarzähler gebündelt fort.
+
+        :param rounds: Die Anzahl der neuen Runden.
+        :type rounds: int
+        :param batch_size: Wie viele Runden gemeinsam gemischt und gezählt werden.
+        :type batch_size: int
+        :return: Die Indizes der neuen Runden in :attr:`rounds`.
+        :rtype: range
+        """
+        first = len(self.rounds)
+        while rounds > 0:
+            batch = min(rounds, batch_size)
+            permutations = self.rng.permuted(np.tile(self.ids, (batch, 1)), axis=1)
+            groups, remainders = self._split(permutations)
+            pairs, counts = np.unique(self._pair_indices(groups, remainders), return_counts=True)
+            self.pair_counts[pairs] += counts.astype(self.pair_counts.dtype)
+            self.rounds.extend(zip(groups, remainders))
+            rounds -= batch
+        return range(first, len(self.rounds))
+
+    def next_round(self):
+        """Erzeugt eine einzelne Runde.
+
+        :return: Das Tupel (Gruppen, übrige Schüler) als int32-Arrays.
+        :rtype: tuple
+        """
+        self.generate(1)
+        return self.rounds[-1]
+
+    def pair_count(self, i, j):
+        """Gibt zurück, wie oft die Schüler mit den Indizes i und j zusammen waren.
+
+        :rtype: int
+        """
+        if i > j:
+            i, j = j, i
+        return int(self.pair_counts[j * (j - 1) // 2 + i])
+
+    def repeat_count(self):
+        """Anzahl der Paarbegegnungen, die über die erste Begegnung hinausgehen.
+
+        :rtype: int
+        """
+        counts = self.pair_counts.astype(np.int64)
+        return int(np.sum(counts[counts > 1] - 1))
+
+    def to_dict(self, round_index):
+        """Erzeugt die Dictionary-Ansicht einer Runde wie in ``GroupCalculator.groups``.
+
+        :param round_index: Der nullbasierte Index der Runde in :attr:`rounds`.
+        :type round_index: int
+        :return: Ein Dictionary Kennung -> Liste der Schüler.
+        :rtype: dict
+        """
+        groups, remainder = self.rounds[round_index]
+        names = self.names
+        labels = group_labels(len(groups))
+        current_groups = {label: [names[i] for i in group.tolist()] for label, group in zip(labels, groups)}
+        for k, student in enumerate(remainder.tolist()):
+            current_groups[labels[k % len(labels)]].append(names[student])
+        return current_groups
+
+    def to_groups(self):
+        """Erzeugt die Dictionary-Ansicht aller Runden, nummeriert ab 1.
+
+        :rtype: dict
+        """
+        return {number: self.to_dict(number - 1) for number in range(1, len(self.rounds) + 1)}
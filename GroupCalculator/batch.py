@@ -0,0 +1,199 @@
+"""Stapelverarbeitung: Gruppenpläne für viele Klassenlisten parallel erzeugen.
+
+Jede CSV-Datei wird in einem eigenen Prozess mit einem eigenen Startwert für den
+Zufallsgenerator verarbeitet. Aufruf aus dem Projektverzeichnis::
+
+    python -m GroupCalculator.batch klassen/ -r 5 -g 3 -o plaene.json
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from GroupCalculator.GroupCalculator import GroupCalculator
+except ImportError:  # Direkter Aufruf aus dem Modulverzeichnis
+    from GroupCalculator import GroupCalculator
+
+
+def _bounded_int(value, minimum):
+    """Wandelt ein Kommandozeilenargument in eine ganze Zahl von mindestens ``minimum`` um."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"keine ganze Zahl: {value}") from None
+    if number < minimum:
+        raise argparse.ArgumentTypeError(f"muss mindestens {minimum} sein: {value}")
+    return number
+
+
+def positive_int(value):
+    """Argumenttyp für argparse: eine ganze Zahl größer als 0.
+
+    :param value: Das Argument.
+    :type value: str
+    :rtype: int
+    :raises argparse.ArgumentTypeError: Bei einem ungültigen Wert.
+    """
+    return _bounded_int(value, 1)
+
+
+def non_negative_int(value):
+    """Argumenttyp für argparse: eine ganze Zahl größer oder gleich 0.
+
+    :param value: Das Argument.
+    :type value: str
+    :rtype: int
+    :raises argparse.ArgumentTypeError: Bei einem ungültigen Wert.
+    """
+    return _bounded_int(value, 0)
+
+
+def collect_rosters(sources):
+    """Ermittelt alle Klassenlisten aus Dateien und Verzeichnissen.
+
+    Verzeichnisse werden nach ``*.csv`` durchsucht (nicht rekursiv).
+
+    :param sources: Pfade zu CSV-Dateien oder Verzeichnissen.
+    :type sources: list
+    :return: Sortierte Liste der CSV-Pfade.
+    :rtype: list
+    """
+    rosters = []
+    for source in sources:
+        if os.path.isdir(source):
+            rosters.extend(os.path.join(source, name) for name in os.listdir(source)
+                           if name.lower().endswith(".csv"))
+        else:
+            rosters.append(source)
+    return sorted(rosters)
+
+
+def run_roster(roster, rounds, group_size, seed, options=None):
+    """Erzeugt ``rounds`` Runden für eine einzelne Klassenliste.
+
+    :param roster: Pfad zur CSV-Datei.
+    :type roster: str
+    :param rounds: Die Anzahl der Runden.
+    :type rounds: int
+    :param group_size: Die Gruppengröße.
+    :type group_size: int
+    :param seed: Startwert des Zufallsgenerators für diese Klassenliste.
+    :type seed: int
+    :param options: CSV-Einstellungen (delimiter, skip_header, first_name_col, last_name_col).
+    :type options: dict
+    :return: Dictionary mit Pfad, Startwert, Schülerzahl, Höchstzahl wiederholungsfreier
+        Runden (None, wenn unbegrenzt) und Runden bzw. Fehlermeldung.
+    :rtype: dict
+    """
+    result = {"roster": roster, "seed": seed}
+    try:
+        if group_size < 1:
+            raise ValueError(f"Die Gruppengröße muss mindestens 1 sein: {group_size}")
+        if rounds < 0:
+            raise ValueError(f"Die Anzahl der Runden darf nicht negativ sein: {rounds}")
+        gc = GroupCalculator(group_size, group_size, seed=seed)
+        for name, value in (options or {}).items():
+            setattr(gc, name, value)
+        gc.select_from_file(roster)
+        if len(gc.student_list) < group_size:
+            raise ValueError("Die Anzahl der Schüler muss größer oder gleich der Gruppengröße sein.")
+
+        gc.num_students = len(gc.student_list)
+        gc.reset_groups()
+        for _ in range(rounds):
+            gc.create_groups()
+    except (OSError, ValueError, csv.Error) as error:
+        result["error"] = str(error)
+        return result
+
+    result["students"] = gc.num_students
+    max_rounds = gc.can_repeat()
+    result["max_rounds"] = None if max_rounds == math.inf else max_rounds  # JSON kennt kein Infinity
+    result["rounds"] = dict(gc.groups)
+    return result
+
+
+def run_batch(sources, rounds, group_size=3, seed=0, workers=None, options=None):
+    """Verarbeitet viele Klassenlisten parallel in einem Prozesspool.
+
+    Die i-te Klassenliste (in sortierter Reihenfolge) erhält den Startwert ``seed + i``,
+    damit die Ergebnisse unabhängig von der Prozessanzahl reproduzierbar sind.
+
+    :param sources: Pfade zu CSV-Dateien oder Verzeichnissen.
+    :type sources: list
+    :param rounds: Die Anzahl der Runden pro Klassenliste.
+    :type rounds: int
+    :param group_size: Die Gruppengröße.
+    :type group_size: int
+    :param seed: Basis-Startwert.
+    :type seed: int
+    :param workers: Anzahl der Prozesse, standardmäßig die Anzahl der CPU-Kerne.
+    :type workers: int
+    :param options: CSV-Einstellungen für alle Klassenlisten.
+    :type options: dict
+    :return: Die Ergebnisse von :func:`run_roster` in der Reihenfolge der Klassenlisten.
+    :rtype: list
+    """
+    rosters = collect_rosters(sources)
+    if not rosters:
+        return []
+
+    count = len(rosters)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, count // (4 * (workers or os.cpu_count() or 1)))
+        return list(executor.map(run_roster, rosters, [rounds] * count, [group_size] * count,
+                                 [seed + i for i in range(count)], [options] * count, chunksize=chunksize))
+
+
+def main(argv=None):
+    """Kommandozeilen-Einstieg für die Stapelverarbeitung.
+
+    :param argv: Argumente, standardmäßig ``sys.argv[1:]``.
+    :type argv: list
+    :return: 0 bei Erfolg, 1 falls mindestens eine Klassenliste fehlerhaft war.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Erzeugt Gruppenpläne für viele Klassenlisten parallel.")
+    parser.add_argument("sources", nargs="+", help="CSV-Dateien oder Verzeichnisse mit CSV-Dateien")
+    parser.add_argument("-r", "--rounds", type=non_negative_int, default=1, help="Anzahl der Runden pro Klassenliste")
+    parser.add_argument("-g", "--group-size", type=positive_int, default=3, help="Gruppengröße")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Basis-Startwert des Zufallsgenerators")
+    parser.add_argument("-w", "--workers", type=positive_int, default=None, help="Anzahl der Prozesse")
+    parser.add_argument("-d", "--delimiter", default=",", help="CSV-Trennzeichen")
+    parser.add_argument("--skip-header", action="store_true", help="Kopfzeile überspringen")
+    parser.add_argument("--first-name-col", type=int, default=0, help="Spalte für den Vornamen")
+    parser.add_argument("--last-name-col", type=int, default=1, help="Spalte für den Nachnamen")
+    parser.add_argument("-o", "--output", default="-", help="Ausgabedatei (JSON), '-' für die Standardausgabe")
+    args = parser.parse_args(argv)
+
+    options = {
+        "delimiter": args.delimiter,
+        "skip_header": args.skip_header,
+        "first_name_col": args.first_name_col,
+        "last_name_col": args.last_name_col,
+    }
+    results = run_batch(args.sources, args.rounds, args.group_size, args.seed, args.workers, options)
+
+    if args.output == "-":
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output, ensure_ascii=False, indent=2)
+
+    for result in results:
+        if result.get("max_rounds") is not None and result["max_rounds"] < args.rounds:
+            print(f"Hinweis: {result['roster']} erlaubt höchstens {result['max_rounds']} Runden "
+                  f"ohne Wiederholung", file=sys.stderr)
+    failed = [result for result in results if "error" in result]
+    for result in failed:
+        print(f"Fehler in {result['roster']}: {result['error']}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
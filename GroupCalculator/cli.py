@@ -0,0 +1,195 @@
+"""Kommandozeilenwerkzeug: Klassenliste rein, Runden als CSV, JSON oder NDJSON raus.
+
+Das Modul importiert weder wxPython noch NumPy und startet daher schnell genug für
+Cronjobs und Web-Backends. Jede Runde wird geschrieben, sobald sie erstellt ist.
+Aufruf aus dem Projektverzeichnis::
+
+    python -m GroupCalculator.cli klasse.csv -r 5 -g 3 -f ndjson
+    python -m GroupCalculator.cli --students 30 -r 10 -f csv -o runden.csv
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+try:
+    from GroupCalculator.GroupCalculator import Constraints, GroupCalculator
+    from GroupCalculator.batch import non_negative_int, positive_int
+except ImportError:  # Direkter Aufruf aus dem Modulverzeichnis
+    from GroupCalculator import Constraints, GroupCalculator
+    from batch import non_negative_int, positive_int
+
+FORMATS = ("csv", "json", "ndjson")
+
+
+class RoundWriter:
+    """Schreibt Runden einzeln im gewählten Format.
+
+    * ``csv``: eine Zeile pro Schüler mit den Spalten runde, gruppe, schueler
+    * ``ndjson``: ein JSON-Objekt pro Zeile und Runde
+    * ``json``: ein JSON-Array, dessen Elemente einzeln geschrieben werden
+
+    :param output: Der Ausgabestrom.
+    :type output: io.TextIOBase
+    :param fmt: Eines der Formate aus :data:`FORMATS`.
+    :type fmt: str
+    """
+
+    def __init__(self, output, fmt):
+        """Initialisiert den Writer und schreibt ggf. den Kopf."""
+        self.output = output
+        self.format = fmt
+        self.count = 0
+        if fmt == "csv":
+            self._csv = csv.writer(output)
+            self._csv.writerow(["runde", "gruppe", "schueler"])
+        elif fmt == "json":
+            output.write("[")
+
+    def write(self, round_number, groups):
+        """Schreibt eine Runde und leert den Puffer.
+
+        :param round_number: Die Nummer der Runde.
+        :type round_number: int
+        :param groups: Die Gruppen der Runde (Kennung -> Schüler).
+        :type groups: dict
+        """
+        if self.format == "csv":
+            self._csv.writerows([round_number, label, student]
+                                for label, students in groups.items() for student in students)
+        else:
+            record = json.dumps({"round": round_number, "groups": groups}, ensure_ascii=False)
+            if self.format == "json":
+                record = ("," if self.count else "") + "\n  " + record
+            else:
+                record += "\n"
+            self.output.write(record)
+        self.count += 1
+        self.output.flush()
+
+    def close(self):
+        """Schließt das JSON-Array ab."""
+        if self.format == "json":
+            self.output.write("\n]\n" if self.count else "]\n")
+        self.output.flush()
+
+
+def build_parser():
+    """Erzeugt den Parser für die Kommandozeilenargumente.
+
+    :rtype: argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(description="Erstellt Gruppenrunden ohne grafische Oberfläche.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("roster", nargs="?", help="CSV-Datei mit der Klassenliste")
+    source.add_argument("-n", "--students", type=positive_int, help="Schüler als Zahlen 1 bis N statt einer CSV-Datei")
+    parser.add_argument("-r", "--rounds", type=non_negative_int, default=1, help="Anzahl der Runden")
+    parser.add_argument("-g", "--group-size", type=positive_int, default=3, help="Gruppengröße")
+    parser.add_argument("-f", "--format", choices=FORMATS, default="ndjson", help="Ausgabeformat")
+    parser.add_argument("-o", "--output", default="-", help="Ausgabedatei, '-' für die Standardausgabe")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="Startwert des Zufallsgenerators")
+    parser.add_argument("--strategy", choices=("greedy", "optimize"), default="greedy",
+                        help="Verfahren für create_groups")
+    parser.add_argument("--time-budget", type=float, default=0.05, help="Zeit pro Runde für --strategy optimize")
+    parser.add_argument("--schedule", action="store_true",
+                        help="Alle Runden vorab aus einer bekannten Konstruktion erzeugen (falls vorhanden)")
+    parser.add_argument("-d", "--delimiter", default=",", help="CSV-Trennzeichen")
+    parser.add_argument("--skip-header", action="store_true", help="Kopfzeile überspringen")
+    parser.add_argument("--first-name-col", type=int, default=0, help="Spalte für den Vornamen")
+    parser.add_argument("--last-name-col", type=int, default=1, help="Spalte für den Nachnamen")
+    parser.add_argument("--constraints", help="Regeldatei (getrennt/zusammen/merkmal je Zeile)")
+    parser.add_argument("--together-col", type=int, help="Spalte: gleiche Markierung bleibt zusammen")
+    parser.add_argument("--apart-col", type=int, help="Spalte: gleiche Markierung wird getrennt")
+    parser.add_argument("--balance-col", action="append", default=[], metavar="NAME=SPALTE",
+                        help="Merkmal aus einer Spalte gleichmäßig verteilen (mehrfach möglich)")
+    return parser
+
+
+def parse_balance_cols(values):
+    """Wandelt ``NAME=SPALTE``-Angaben in ein Dictionary um.
+
+    :param values: Die Angaben von ``--balance-col``.
+    :type values: list
+    :rtype: dict
+    :raises ValueError: Bei einer ungültigen Angabe.
+    """
+    columns = {}
+    for value in values:
+        name, _, column = value.rpartition("=")
+        if not name or not column.isdigit():
+            raise ValueError(f"Ungültige Merkmalsspalte: {value}")
+        columns[name] = int(column)
+    return columns
+
+
+def run(args, output):
+    """Erstellt die Runden und schreibt sie nacheinander in ``output``.
+
+    :param args: Die geparsten Argumente.
+    :type args: argparse.Namespace
+    :param output: Der Ausgabestrom.
+    :type output: io.TextIOBase
+    :raises ValueError: Wenn weniger Schüler als die Gruppengröße vorhanden sind.
+    """
+    if args.students is not None:
+        gc = GroupCalculator(args.students, args.group_size, seed=args.seed)
+        if args.constraints:
+            gc.constraints = Constraints.from_file(args.constraints, args.delimiter)
+    else:
+        gc = GroupCalculator(args.group_size, args.group_size, seed=args.seed)
+        gc.delimiter = args.delimiter
+        gc.skip_header = args.skip_header
+        gc.first_name_col = args.first_name_col
+        gc.last_name_col = args.last_name_col
+        gc.constraint_file = args.constraints
+        gc.together_col = args.together_col
+        gc.apart_col = args.apart_col
+        gc.balance_cols = parse_balance_cols(args.balance_col)
+        gc.select_from_file(args.roster)
+        if len(gc.student_list) < args.group_size:
+            raise ValueError("Die Anzahl der Schüler muss größer oder gleich der Gruppengröße sein.")
+        gc.num_students = len(gc.student_list)
+        for line_number, message in gc.roster.errors:
+            print(f"{args.roster}:{line_number}: {message}", file=sys.stderr)
+    gc.reset_groups()
+
+    writer = RoundWriter(output, args.format)
+    if args.schedule:
+        gc.create_schedule(args.rounds)
+        for round_number, groups in gc.groups.items():
+            writer.write(round_number, groups)
+    else:
+        for _ in range(args.rounds):
+            gc.create_groups(strategy=args.strategy, time_budget=args.time_budget)
+            writer.write(gc.get_round_count(), gc.get_current_groups())
+    writer.close()
+
+
+def main(argv=None):
+    """Einstiegspunkt der Kommandozeile.
+
+    :param argv: Argumente, standardmäßig ``sys.argv[1:]``.
+    :type argv: list
+    :return: Der Exit-Code.
+    :rtype: int
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        if args.output == "-":
+            run(args, sys.stdout)
+        else:
+            with open(args.output, "w", newline="", encoding="utf-8") as output:
+                run(args, output)
+    except BrokenPipeError:
+        # Empfänger (z.B. ``head``) hat die Pipe geschlossen: still beenden
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as error:
+        print(f"Fehler: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
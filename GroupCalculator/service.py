@@ -0,0 +1,650 @@
+"""Lokaler HTTP/JSON-Dienst: viele Gruppensitzungen in einem Prozess.
+
+Jede Sitzung (Schülerliste, Startwert, Runden) hat eine ID und wird wie in der GUI
+über ein :class:`SessionStore`-Protokoll gespeichert. Im Speicher bleiben höchstens
+``max_sessions`` Sitzungen; die am längsten unbenutzten werden geschlossen und beim
+nächsten Zugriff aus ihrem Protokoll fortgesetzt. Eingelesene Klassenlisten teilen
+sich alle Sitzungen über einen LRU-Zwischenspeicher. Große Sitzungen und die
+Optimierung laufen in einem Thread-Pool, damit die Ereignisschleife ansprechbar bleibt.
+
+Aufruf aus dem Projektverzeichnis::
+
+    python -m GroupCalculator.service --port 8765 --roster-dir klassenlisten
+
+Klassenlisten (``"roster"``) werden nur aus dem mit ``--roster-dir`` freigegebenen
+Verzeichnis gelesen; Pfade sind relativ zu diesem Verzeichnis.
+
+Schnittstelle (Anfragen und Antworten als JSON)::
+
+    POST   /sessions                      {"students": [...] | "num_students": n | "roster": "pfad.csv",
+                                           "group_size": 3, "seed": 1, "id": "optional"}
+    GET    /sessions/<id>
+    DELETE /sessions/<id>
+    POST   /sessions/<id>/rounds           {"strategy": "greedy", "time_budget": 0.05}
+    GET    /sessions/<id>/rounds/<runde>
+    GET    /sessions/<id>/students/<schüler>
+    GET    /stats
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import re
+import secrets
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlsplit
+
+try:
+    from GroupCalculator.GroupCalculator import GroupCalculator, RosterCache, SessionStore
+except ImportError:  # Direkter Aufruf aus dem Modulverzeichnis
+    from GroupCalculator import GroupCalculator, RosterCache, SessionStore
+
+_SESSION_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    """Ein Fehler mit HTTP-Statuscode für die Antwort.
+
+    :param status: Der Statuscode.
+    :type status: int
+    :param message: Die Fehlermeldung.
+    :type message: str
+    """
+
+    def __init__(self, status, message):
+        """Initialisiert den Fehler."""
+        super().__init__(message)
+        self.status = status
+
+
+class SharedRosters:
+    """LRU-Zwischenspeicher für eingelesene Klassenlisten, gemeinsam für alle Sitzungen.
+
+    Der Schlüssel enthält Pfad, Änderungszeit, Größe und CSV-Optionen (siehe
+    :meth:`RosterCache.make_key`); eine geänderte Datei wird also neu eingelesen. Fehlt
+    eine Liste im Speicher, wird sie über den :class:`RosterCache` auf der Platte geladen.
+    :meth:`load` läuft im Thread-Pool; Zugriffe auf die LRU-Liste und die Zähler sind
+    daher durch eine Sperre geschützt, das Einlesen selbst läuft außerhalb.
+
+    :param maxsize: Die Anzahl der Klassenlisten im Speicher.
+    :type maxsize: int
+    :param disk_cache: Der Zwischenspeicher auf der Platte.
+    :type disk_cache: RosterCache
+    """
+
+    def __init__(self, maxsize=32, disk_cache=None):
+        """Initialisiert einen leeren Zwischenspeicher."""
+        self.maxsize = maxsize
+        self.disk_cache = disk_cache if disk_cache is not None else RosterCache()
+        self.hits = 0
+        self.misses = 0
+        self._rosters = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key):
+        """Gibt eine Klassenliste aus dem Speicher zurück und markiert sie als zuletzt benutzt.
+
+        :param key: Die Werte des Schlüssels aus :meth:`RosterCache.make_key`.
+        :type key: tuple
+        :return: Die Klassenliste oder None.
+        :rtype: Roster
+        """
+        with self._lock:
+            roster = self._rosters.get(key)
+            if roster is not None:
+                self._rosters.move_to_end(key)
+                self.hits += 1
+            return roster
+
+    def load(self, file_path, options):
+        """Liest eine Klassenliste (blockierend, für den Thread-Pool) und legt sie ab.
+
+        :param file_path: Der Pfad zur CSV-Datei.
+        :type file_path: str
+        :param options: delimiter, skip_header, first_name_col, last_name_col.
+        :type options: tuple
+        :return: Tupel aus Schlüssel und Klassenliste.
+        :rtype: tuple
+        """
+        key = tuple(RosterCache.make_key(file_path, *options).values())
+        roster = self.lookup(key)
+        if roster is None:
+            roster = self.disk_cache.get(file_path, *options)
+            with self._lock:
+                self.misses += 1
+                self._rosters[key] = roster
+                while len(self._rosters) > self.maxsize:
+                    self._rosters.popitem(last=False)
+        return key, roster
+
+    def __len__(self):
+        """Gibt die Anzahl der Klassenlisten im Speicher zurück."""
+        return len(self._rosters)
+
+
+class Session:
+    """Eine Sitzung im Speicher: GroupCalculator und Sperre für nacheinander ablaufende Zugriffe.
+
+    ``pins`` zählt die Anfragen, die die Sitzung gerade benutzen oder auf ihre Sperre
+    warten; solche Sitzungen werden nicht ausgelagert. ``closed`` wird gesetzt, wenn die
+    Sitzung gelöscht wurde, während andere Anfragen noch warteten.
+
+    :param session_id: Die ID.
+    :type session_id: str
+    :param calculator: Der GroupCalculator mit angeschlossenem Protokoll.
+    :type calculator: GroupCalculator
+    """
+
+    __slots__ = ("id", "calculator", "lock", "pins", "closed")
+
+    def __init__(self, session_id, calculator):
+        """Initialisiert die Sitzung."""
+        self.id = session_id
+        self.calculator = calculator
+        self.lock = asyncio.Lock()
+        self.pins = 0
+        self.closed = False
+
+
+class GroupService:
+    """Verwaltet die Sitzungen und beantwortet die JSON-Anfragen.
+
+    :param directory: Verzeichnis für die Sitzungsprotokolle.
+    :type directory: str
+    :param max_sessions: Höchstzahl der Sitzungen im Speicher.
+    :type max_sessions: int
+    :param rosters: Der gemeinsame Zwischenspeicher der Klassenlisten.
+    :type rosters: SharedRosters
+    :param executor: Thread-Pool für rechenintensive Aufrufe.
+    :type executor: concurrent.futures.Executor
+    :param inline_limit: Bis zu dieser Schülerzahl laufen Greedy-Runden direkt in der
+        Ereignisschleife (schneller als der Wechsel in den Thread-Pool).
+    :type inline_limit: int
+    :param roster_dir: Verzeichnis, aus dem Klassenlisten gelesen werden dürfen; ohne
+        Angabe werden Anfragen mit "roster" abgelehnt.
+    :type roster_dir: str
+    """
+
+    #: Größte angenommene Anfrage in Byte.
+    max_body = 16 * 1024 * 1024
+
+    def __init__(self, directory, max_sessions=256, rosters=None, executor=None, inline_limit=2000,
+                 roster_dir=None):
+        """Initialisiert den Dienst."""
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.roster_dir = os.path.realpath(roster_dir) if roster_dir is not None else None
+        self.max_sessions = max_sessions
+        self.rosters = rosters if rosters is not None else SharedRosters()
+        self.executor = executor if executor is not None else ThreadPoolExecutor()
+        self.inline_limit = inline_limit
+        self.sessions = OrderedDict()
+        self.counters = {"rounds": 0, "evictions": 0, "reloads": 0, "requests": 0}
+        self._loading = {}
+        self._reserved = set()
+
+    def path_for(self, session_id):
+        """Gibt den Pfad des Sitzungsprotokolls zurück.
+
+        :param session_id: Die ID.
+        :type session_id: str
+        :rtype: str
+        """
+        return os.path.join(self.directory, f"{session_id}.wxgs")
+
+    def roster_path(self, roster):
+        """Löst den Pfad einer Klassenliste innerhalb von :attr:`roster_dir` auf.
+
+        :param roster: Der Pfad relativ zu :attr:`roster_dir`.
+        :type roster: str
+        :return: Der absolute Pfad.
+        :rtype: str
+        :raises ValueError: Wenn kein Verzeichnis freigegeben ist oder der Pfad (auch über
+            ``..`` oder symbolische Links) aus ihm herausführt.
+        """
+        if self.roster_dir is None:
+            raise ValueError("Klassenlisten sind nicht freigegeben (Dienst ohne --roster-dir gestartet).")
+        if not isinstance(roster, str) or "\0" in roster:
+            raise ValueError("roster muss ein Pfad sein.")
+        path = os.path.realpath(os.path.join(self.roster_dir, roster))
+        if os.path.commonpath([self.roster_dir, path]) != self.roster_dir:
+            raise ValueError(f"Klassenliste außerhalb des freigegebenen Verzeichnisses: {roster}")
+        return path
+
+    async def _run(self, function, *args):
+        """Führt eine blockierende Funktion im Thread-Pool aus."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    async def session(self, session_id):
+        """Gibt eine Sitzung zurück und lädt sie bei Bedarf aus ihrem Protokoll.
+
+        :param session_id: Die ID.
+        :type session_id: str
+        :rtype: Session
+        :raises HTTPError: 404, wenn es die Sitzung nicht gibt.
+        """
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self.sessions.move_to_end(session_id)
+            return session
+
+        task = self._loading.get(session_id)
+        if task is None:
+            if not _SESSION_ID.fullmatch(session_id) or not os.path.exists(self.path_for(session_id)):
+                raise HTTPError(404, f"Sitzung nicht gefunden: {session_id}")
+            task = self._loading[session_id] = asyncio.ensure_future(self._reload(session_id))
+            task.add_done_callback(lambda done: self._loading.pop(session_id, None))
+        return await task
+
+    @asynccontextmanager
+    async def use(self, session_id):
+        """Stellt eine Sitzung exklusiv bereit (``async with service.use(id) as session``).
+
+        Die Sitzung ist vom Laden bis zum Ende des Blocks angeheftet und kann nicht
+        ausgelagert werden; innerhalb des Blocks wird ihre Sperre gehalten, auch für
+        reine Abfragen, da Runden im Thread-Pool entstehen.
+
+        :param session_id: Die ID.
+        :type session_id: str
+        :raises HTTPError: 404, wenn es die Sitzung nicht gibt.
+        """
+        while True:
+            session = await self.session(session_id)
+            # Zwischen Laden und Fortsetzen dieser Anfrage kann sie ausgelagert worden sein
+            if self.sessions.get(session_id) is session:
+                break
+        session.pins += 1
+        try:
+            async with session.lock:
+                if session.closed:
+                    raise HTTPError(404, f"Sitzung nicht gefunden: {session_id}")
+                yield session
+        finally:
+            session.pins -= 1
+            self._evict()
+
+    async def _reload(self, session_id):
+        """Setzt eine ausgelagerte Sitzung aus ihrem Protokoll fort.
+
+        :rtype: Session
+        """
+        calculator = await self._run(SessionStore(self.path_for(session_id)).resume)
+        self.counters["reloads"] += 1
+        return self._add(Session(session_id, calculator))
+
+    def _add(self, session):
+        """Nimmt eine Sitzung auf und lagert bei Bedarf die am längsten unbenutzten aus.
+
+        :rtype: Session
+        """
+        self.sessions[session.id] = session
+        self._evict(keep=session)
+        return session
+
+    def _evict(self, keep=None):
+        """Lagert die am längsten unbenutzten Sitzungen aus, bis ``max_sessions`` eingehalten ist.
+
+        Angeheftete Sitzungen (siehe :meth:`use`) werden übersprungen und beim Lösen
+        der letzten Anheftung erneut geprüft.
+
+        :param keep: Eine Sitzung, die im Speicher bleiben soll.
+        :type keep: Session
+        """
+        excess = len(self.sessions) - self.max_sessions
+        if excess <= 0:
+            return
+        for candidate in list(self.sessions.values()):
+            if excess <= 0:
+                break
+            if candidate is keep or candidate.pins:
+                continue
+            del self.sessions[candidate.id]
+            candidate.calculator.session_store.close()
+            self.counters["evictions"] += 1
+            excess -= 1
+
+    async def create_session(self, payload):
+        """Legt eine neue Sitzung an.
+
+        :param payload: "students" (Liste), "num_students" oder "roster" (CSV-Pfad mit
+            optional delimiter, skip_header, first_name_col, last_name_col) sowie
+            "group_size", "seed" und optional "id".
+        :type payload: dict
+        :rtype: dict
+        :raises ValueError: Bei ungültigen Angaben.
+        :raises HTTPError: 409, wenn die ID schon vergeben ist.
+        """
+        session_id = payload.get("id") or secrets.token_hex(8)
+        if not isinstance(session_id, str) or not _SESSION_ID.fullmatch(session_id):
+            raise ValueError("Ungültige Sitzungs-ID (erlaubt: A-Z, a-z, 0-9, _ und -, höchstens 64 Zeichen).")
+        if session_id in self.sessions or session_id in self._loading or session_id in self._reserved \
+                or os.path.exists(self.path_for(session_id)):
+            raise HTTPError(409, f"Sitzung existiert bereits: {session_id}")
+        # Die ID bleibt bis zur Aufnahme der Sitzung reserviert (parallele Anfragen mit derselben ID)
+        self._reserved.add(session_id)
+        try:
+            session = await self._create(session_id, payload)
+        finally:
+            self._reserved.discard(session_id)
+        return self.describe(session)
+
+    async def _create(self, session_id, payload):
+        """Baut eine neue Sitzung auf (siehe :meth:`create_session`).
+
+        :rtype: Session
+        """
+        group_size = payload.get("group_size", 3)
+        if not isinstance(group_size, int) or group_size < 1:
+            raise ValueError("group_size muss eine positive ganze Zahl sein.")
+
+        if "roster" in payload:
+            try:
+                options = (str(payload.get("delimiter", ",")), bool(payload.get("skip_header", False)),
+                           int(payload.get("first_name_col", 0)), int(payload.get("last_name_col", 1)))
+            except (TypeError, ValueError):
+                raise ValueError("Ungültige Spaltenangaben für roster.") from None
+            _, roster = await self._run(self.rosters.load, self.roster_path(payload["roster"]), options)
+            students = roster.students()
+        elif "students" in payload:
+            students = payload["students"]
+            if not isinstance(students, list) or not all(
+                    isinstance(student, (str, int)) and not isinstance(student, bool) for student in students):
+                raise ValueError("students muss eine Liste von Namen oder Nummern sein.")
+        elif "num_students" in payload:
+            num_students = payload["num_students"]
+            if not isinstance(num_students, int) or isinstance(num_students, bool):
+                raise ValueError("num_students muss eine ganze Zahl sein.")
+            students = list(range(1, num_students + 1))
+        else:
+            raise ValueError("Angabe von students, num_students oder roster erforderlich.")
+        if len(students) < group_size:
+            raise ValueError("Die Anzahl der Schüler muss größer oder gleich der Gruppengröße sein.")
+
+        def build():
+            calculator = GroupCalculator(group_size, group_size, seed=payload.get("seed"))
+            calculator.student_list = students
+            calculator.num_students = len(students)
+            calculator.round_counter = 0
+            calculator.start_session(self.path_for(session_id))
+            return calculator
+
+        calculator = build() if len(students) <= self.inline_limit else await self._run(build)
+        return self._add(Session(session_id, calculator))
+
+    def describe(self, session):
+        """Fasst eine Sitzung zusammen.
+
+        :rtype: dict
+        """
+        calculator = session.calculator
+        bounds = calculator.feasibility()
+        return {
+            "id": session.id,
+            "students": len(calculator.student_list),
+            "group_size": calculator.group_size,
+            "seed": calculator.rng.seed,
+            "rounds": calculator.get_round_count(),
+            "max_rounds": None if bounds.upper == math.inf else bounds.upper,
+            "exact": bounds.exact,
+        }
+
+    async def next_round(self, session_id, payload):
+        """Erstellt die nächste Runde einer Sitzung.
+
+        :param session_id: Die ID.
+        :type session_id: str
+        :param payload: Optional "strategy" und "time_budget" wie bei ``create_groups``.
+        :type payload: dict
+        :rtype: dict
+        """
+        strategy = payload.get("strategy", "greedy")
+        time_budget = float(payload.get("time_budget", 0.05))
+        async with self.use(session_id) as session:
+            calculator = session.calculator
+            if strategy == "greedy" and len(calculator.student_list) <= self.inline_limit:
+                calculator.create_groups(strategy, time_budget)
+            else:
+                await self._run(calculator.create_groups, strategy, time_budget)
+            self.counters["rounds"] += 1
+            return {"round": calculator.get_round_count(), "groups": calculator.get_current_groups(),
+                    "repeats": calculator.last_repeat_count}
+
+    async def get_round(self, session_id, number):
+        """Gibt eine gespeicherte Runde zurück.
+
+        :rtype: dict
+        :raises HTTPError: 404, wenn es die Runde nicht gibt.
+        """
+        async with self.use(session_id) as session:
+            groups = session.calculator.groups.get(number)
+        if groups is None:
+            raise HTTPError(404, f"Runde nicht gefunden: {number}")
+        return {"round": number, "groups": groups}
+
+    async def find_student(self, session_id, student):
+        """Gibt die Gruppen und Partner eines Schülers zurück.
+
+        :rtype: dict
+        """
+        async with self.use(session_id) as session:
+            calculator = session.calculator
+            if calculator.groups.name_id(student) is None and student.isdigit():
+                student = int(student)  # Schüler als Zahlen
+            try:
+                placements = calculator.find_student(student)
+            except ValueError as error:
+                raise HTTPError(404, str(error))
+            return {"student": student, "placements": placements, "partners": calculator.partners(student)}
+
+    async def delete_session(self, session_id):
+        """Beendet eine Sitzung und löscht ihr Protokoll.
+
+        :rtype: dict
+        """
+        async with self.use(session_id) as session:
+            self.sessions.pop(session_id, None)
+            session.closed = True
+            session.calculator.session_store.close()
+            for path in (self.path_for(session_id), self.path_for(session_id) + ".pairs"):
+                if os.path.exists(path):
+                    os.remove(path)
+        return {"id": session_id, "deleted": True}
+
+    def stats(self):
+        """Gibt Kennzahlen des Dienstes zurück.
+
+        :rtype: dict
+        """
+        return dict(self.counters, sessions=len(self.sessions), rosters=len(self.rosters),
+                    roster_hits=self.rosters.hits, roster_misses=self.rosters.misses)
+
+    async def handle(self, method, target, body):
+        """Beantwortet eine Anfrage.
+
+        :param method: Die HTTP-Methode.
+        :type method: str
+        :param target: Der angefragte Pfad.
+        :type target: str
+        :param body: Der Rumpf der Anfrage (JSON oder leer).
+        :type body: bytes
+        :return: Tupel aus Statuscode und JSON-fähiger Antwort.
+        :rtype: tuple
+        """
+        self.counters["requests"] += 1
+        parts = [unquote(part) for part in urlsplit(target).path.strip("/").split("/")]
+        try:
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise ValueError("Im Rumpf wird ein JSON-Objekt erwartet.")
+            return await self._route(method, parts, payload)
+        except HTTPError as error:
+            return error.status, {"error": str(error)}
+        except (ValueError, OSError) as error:
+            return 400, {"error": str(error)}
+        except Exception as error:  # Der Dienst läuft für alle anderen Sitzungen weiter
+            print(f"Fehler bei {method} {target}: {error!r}", file=sys.stderr)
+            return 500, {"error": "Interner Fehler"}
+
+    async def _route(self, method, parts, payload):
+        """Ordnet eine Anfrage der passenden Methode zu.
+
+        :rtype: tuple
+        """
+        if parts == ["stats"] and method == "GET":
+            return 200, self.stats()
+        if parts[0] != "sessions":
+            raise HTTPError(404, "Unbekannter Pfad")
+        if len(parts) == 1:
+            if method != "POST":
+                raise HTTPError(405, "Erlaubt: POST")
+            return 201, await self.create_session(payload)
+
+        session_id = parts[1]
+        if len(parts) == 2:
+            if method == "GET":
+                async with self.use(session_id) as session:
+                    return 200, self.describe(session)
+            if method == "DELETE":
+                return 200, await self.delete_session(session_id)
+            raise HTTPError(405, "Erlaubt: GET, DELETE")
+        if parts[2] == "rounds" and len(parts) == 3:
+            if method != "POST":
+                raise HTTPError(405, "Erlaubt: POST")
+            return 201, await self.next_round(session_id, payload)
+        if parts[2] == "rounds" and len(parts) == 4 and method == "GET":
+            if not parts[3].isdigit():
+                raise ValueError(f"Ungültige Rundennummer: {parts[3]}")
+            return 200, await self.get_round(session_id, int(parts[3]))
+        if parts[2] == "students" and len(parts) == 4 and method == "GET":
+            return 200, await self.find_student(session_id, parts[3])
+        raise HTTPError(404, "Unbekannter Pfad")
+
+    async def client(self, reader, writer):
+        """Bedient eine Verbindung (HTTP/1.1 mit Keep-Alive).
+
+        :param reader: Der Eingabestrom.
+        :type reader: asyncio.StreamReader
+        :param writer: Der Ausgabestrom.
+        :type writer: asyncio.StreamWriter
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    self._respond(writer, 400, {"error": "Ungültige Anfrage"}, False)
+                    break
+                if length > self.max_body:
+                    self._respond(writer, 413, {"error": "Anfrage zu groß"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" or (version == "HTTP/1.1" and connection != "close")
+                status, response = await self.handle(method, target, body)
+                self._respond(writer, status, response, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _respond(writer, status, response, keep_alive):
+        """Schreibt eine JSON-Antwort.
+
+        :param writer: Der Ausgabestrom.
+        :type writer: asyncio.StreamWriter
+        :param status: Der Statuscode.
+        :type status: int
+        :param response: Die Antwort.
+        :type response: dict
+        :param keep_alive: Ob die Verbindung offen bleibt.
+        :type keep_alive: bool
+        """
+        data = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        connection = "keep-alive" if keep_alive else "close"
+        writer.write(f"HTTP/1.1 {status} {_REASONS[status]}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                     f"Content-Length: {len(data)}\r\nConnection: {connection}\r\n\r\n".encode("latin-1") + data)
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        """Startet den Server.
+
+        :param host: Die Adresse.
+        :type host: str
+        :param port: Der Port (0 = beliebiger freier Port).
+        :type port: int
+        :rtype: asyncio.Server
+        """
+        return await asyncio.start_server(self.client, host, port)
+
+    def close(self):
+        """Schließt alle Sitzungsprotokolle und den Thread-Pool."""
+        for session in self.sessions.values():
+            session.calculator.session_store.close()
+        self.sessions.clear()
+        self.executor.shutdown(wait=False)
+
+
+def main(argv=None):
+    """Kommandozeilen-Einstieg des Dienstes.
+
+    :param argv: Argumente, standardmäßig ``sys.argv[1:]``.
+    :type argv: list
+    :return: Der Exit-Code.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Stellt die Gruppenbildung als lokalen HTTP/JSON-Dienst bereit.")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse")
+    parser.add_argument("--port", type=int, default=8765, help="Port")
+    parser.add_argument("--directory", default=os.path.join(RosterCache().directory, "sitzungen"),
+                        help="Verzeichnis für die Sitzungsprotokolle")
+    parser.add_argument("--max-sessions", type=int, default=256, help="Sitzungen im Speicher")
+    parser.add_argument("--rosters", type=int, default=32, help="Klassenlisten im Speicher")
+    parser.add_argument("--roster-dir", default=None,
+                        help="Verzeichnis, aus dem Klassenlisten gelesen werden dürfen (sonst keine)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Threads für rechenintensive Aufrufe")
+    args = parser.parse_args(argv)
+
+    service = GroupService(args.directory, args.max_sessions, SharedRosters(args.rosters),
+                           ThreadPoolExecutor(args.workers), roster_dir=args.roster_dir)
+
+    async def run():
+        server = await service.serve(args.host, args.port)
+        print(f"Dienst läuft auf http://{args.host}:{server.sockets[0].getsockname()[1]}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Hintergrund-Thread der Oberfläche, unabhängig von wxPython.
+
+Die GUI übergibt beim Erzeugen ``wx.CallAfter`` als Zustellfunktion; so bleibt das
+Modul ohne wx importier- und testbar.
+"""
+import threading
+
+
+class JobCancelled(Exception):
+    """Wird in einer Hintergrundberechnung ausgelöst, wenn sie durch eine neuere ersetzt wurde."""
+
+
+class BackgroundWorker:
+    """Führt Berechnungen der GUI nacheinander in einem Hintergrund-Thread aus.
+
+    Es gibt genau einen wartenden Auftrag: ein neuer Auftrag ersetzt einen noch nicht
+    begonnenen und markiert den laufenden als abgebrochen. So werden schnelle Folgen von
+    Ereignissen (z.B. gedrückt gehaltene Spin-Pfeile) zu einer Berechnung zusammengefasst.
+    Ergebnisse und Fehler werden über ``call_after`` im GUI-Thread zugestellt, aber nur,
+    wenn der Auftrag dann noch der aktuelle ist.
+
+    Der Abbruch ist kooperativ: nur ein Auftrag, der ``cancelled()`` abfragt, endet
+    vorzeitig. Ein laufendes ``create_groups`` prüft das nicht; es rechnet zu Ende und
+    speichert seine Runde, nur die Zustellung an die GUI entfällt.
+
+    :param call_after: Stellt ``callback(*args)`` im GUI-Thread zu (``wx.CallAfter``).
+    :type call_after: callable
+    """
+
+    def __init__(self, call_after):
+        """Startet den Hintergrund-Thread."""
+        self.call_after = call_after
+        self.generation = 0
+        self._pending = None
+        self._stopped = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="GroupWorker", daemon=True)
+        self._thread.start()
+
+    def submit(self, job, on_done, on_error=None):
+        """Plant einen Auftrag ein.
+
+        :param job: Funktion ``job(cancelled)``; ``cancelled()`` liefert True, sobald ein
+            neuerer Auftrag eingeplant wurde. Der Auftrag darf dann :class:`JobCancelled` auslösen.
+        :type job: callable
+        :param on_done: Wird im GUI-Thread mit dem Ergebnis aufgerufen.
+        :type on_done: callable
+        :param on_error: Wird im GUI-Thread mit der Ausnahme aufgerufen.
+        :type on_error: callable
+        :return: Die Nummer des Auftrags.
+        :rtype: int
+        """
+        with self._condition:
+            self.generation += 1
+            self._pending = (self.generation, job, on_done, on_error)
+            self._condition.notify()
+            return self.generation
+
+    def is_current(self, generation):
+        """Prüft, ob der Auftrag ``generation`` noch der zuletzt eingeplante ist."""
+        return generation == self.generation
+
+    def stop(self, timeout=5.0):
+        """Beendet den Hintergrund-Thread nach dem laufenden Auftrag.
+
+        :param timeout: Wie lange höchstens auf den laufenden Auftrag gewartet wird (Sekunden).
+        :type timeout: float
+        """
+        with self._condition:
+            self._stopped = True
+            self.generation += 1
+            self._condition.notify()
+        self._thread.join(timeout)
+
+    def _run(self):
+        """Arbeitsschleife des Hintergrund-Threads."""
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                generation, job, on_done, on_error = self._pending
+                self._pending = None
+
+            try:
+                result = job(lambda: not self.is_current(generation))
+            except JobCancelled:
+                continue
+            except Exception as error:  # Fehler der Berechnung im GUI-Thread anzeigen
+                if on_error is not None:
+                    self.call_after(self._deliver, generation, on_error, error)
+                continue
+            self.call_after(self._deliver, generation, on_done, result)
+
+    def _deliver(self, generation, callback, value):
+        """Stellt ein Ergebnis im GUI-Thread zu, sofern der Auftrag noch aktuell ist."""
+        if self.is_current(generation):
+            callback(value)
@@ -0,0 +1,371 @@
+"""Benchmark-Suite: Laufzeiten der Hot Paths mit Vergleich gegen eine gespeicherte Basislinie.
+
+Gemessen werden ``create_groups`` (Schülerzahl × Gruppengröße × Runden),
+``select_from_file`` (CSV-Größe), ``can_repeat`` (erster und wiederholter Aufruf)
+und ``GroupApp.update_grid`` (nur wenn wxPython mit Anzeige verfügbar ist). Jeder Fall
+wird mehrfach mit festem Startwert ausgeführt, gewertet wird die schnellste Messung.
+
+Aufruf aus dem Projektverzeichnis::
+
+    python -m benchmarks.suite                                    # Profil "quick"
+    python -m benchmarks.suite --profile full -o ergebnisse.json
+    python -m benchmarks.suite --profile scaling                  # Zeit pro Runde bis 1 Mio. Schüler
+    python -m benchmarks.suite --baseline benchmarks/baseline.json
+    python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from GroupCalculator import GroupCalculator as core
+from GroupCalculator.GroupCalculator import GroupCalculator
+
+#: Messprofile; ``max_work`` begrenzt Schüler × Runden pro Fall, ``only`` wählt Fälle vor.
+PROFILES = {
+    "quick": {
+        "students": [10, 100, 1_000, 10_000],
+        "group_sizes": [2, 3, 5],
+        "rounds": [1, 10],
+        "csv_rows": [1_000, 10_000],
+        "max_work": 200_000,
+    },
+    "full": {
+        "students": [10, 100, 1_000, 10_000, 100_000, 1_000_000],
+        "group_sizes": [2, 3, 5],
+        "rounds": [1, 10, 50],
+        "csv_rows": [1_000, 100_000, 1_000_000],
+        "max_work": 10_000_000,
+    },
+    # Skalierung von create_groups mit der Schülerzahl (µs/Einheit = µs pro Schüler und Runde)
+    "scaling": {
+        "students": [10, 100, 1_000, 10_000, 100_000, 1_000_000],
+        "group_sizes": [3],
+        "rounds": [5],
+        "csv_rows": [],
+        "max_work": 5_000_000,
+        "only": ["create_groups"],
+    },
+}
+
+#: Unterschiede unterhalb dieser Dauer (Sekunden) gelten nie als Regression.
+NOISE_FLOOR = 50e-6
+
+
+def best_of(repeat, setup, run):
+    """Führt eine Messung mehrfach aus und gibt alle Laufzeiten zurück.
+
+    :param repeat: Die Anzahl der Wiederholungen.
+    :type repeat: int
+    :param setup: Erzeugt vor jeder Messung den Zustand (nicht gemessen).
+    :type setup: callable
+    :param run: Die gemessene Funktion, erhält das Ergebnis von ``setup``.
+    :type run: callable
+    :return: Die Laufzeiten in Sekunden.
+    :rtype: list
+    """
+    runs = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def bench_create_groups(students, group_size, rounds, repeat):
+    """Misst ``rounds`` Aufrufe von ``create_groups`` auf einer frischen Sitzung.
+
+    :rtype: list
+    """
+    def setup():
+        gc = GroupCalculator(students, group_size, seed=0)
+        gc.reset_groups()
+        return gc
+
+    def run(gc):
+        for _ in range(rounds):
+            gc.create_groups()
+
+    return best_of(repeat, setup, run)
+
+
+def write_roster(path, rows):
+    """Schreibt eine reproduzierbare CSV-Datei mit ``rows`` Zeilen.
+
+    :param path: Der Zielpfad.
+    :type path: str
+    :param rows: Die Anzahl der Zeilen.
+    :type rows: int
+    """
+    with open(path, "w", encoding="utf-8") as roster:
+        roster.writelines(f"Vorname{i},Nachname{i % 997},{i % 30}\n" for i in range(rows))
+
+
+def bench_select_from_file(path, repeat):
+    """Misst ``select_from_file`` ohne Zwischenspeicher.
+
+    :rtype: list
+    """
+    return best_of(repeat, lambda: GroupCalculator(1, 1), lambda gc: gc.select_from_file(path))
+
+
+def bench_can_repeat(students, group_size, repeat, warm_calls=1000):
+    """Misst ``can_repeat`` beim ersten Aufruf und gemittelt über wiederholte Aufrufe.
+
+    :return: Tupel aus Laufzeiten (erster Aufruf) und Laufzeiten pro wiederholtem Aufruf.
+    :rtype: tuple
+    """
+    gc = GroupCalculator(students, group_size, seed=0)
+
+    def cold(state):
+        core._ROUND_BOUNDS.clear()
+        gc.can_repeat()
+
+    def warm(state):
+        for _ in range(warm_calls):
+            gc.can_repeat()
+
+    cold_runs = best_of(repeat, lambda: None, cold)
+    warm_runs = [seconds / warm_calls for seconds in best_of(repeat, lambda: None, warm)]
+    return cold_runs, warm_runs
+
+
+def bench_update_grid(students_list, repeat):
+    """Misst ``GroupApp.update_grid``-Äquivalent (Tabelle setzen und neu zeichnen).
+
+    :return: Liste von (Schülerzahl, Laufzeiten) oder None ohne wxPython/Anzeige.
+    :rtype: list
+    """
+    try:
+        import wx
+        import wx.grid
+        from GroupCalculator.GroupApp import GroupTable
+        app = wx.App(False)
+    except Exception:  # wxPython fehlt oder es gibt keine Anzeige
+        return None
+
+    frame = wx.Frame(None)
+    grid = wx.grid.Grid(frame)
+    table = GroupTable()
+    grid.SetTable(table, takeOwnership=True)
+    results = []
+    for students in students_list:
+        gc = GroupCalculator(students, 3, seed=0)
+        gc.create_groups()
+
+        def run(state):
+            table.set_round(gc.groups.round(gc.round_counter), gc.groups.names)
+            grid.ForceRefresh()
+            for row in range(min(30, table.GetNumberRows())):  # sichtbare Zeilen
+                table.GetValue(row, 1)
+
+        results.append((students, best_of(repeat, lambda: None, run)))
+    frame.Destroy()
+    app.Destroy()
+    return results
+
+
+def record(name, params, runs, units=None):
+    """Erzeugt einen Ergebnis-Eintrag.
+
+    :param name: Der Name des Falls.
+    :type name: str
+    :param params: Die Parameter des Falls.
+    :type params: dict
+    :param runs: Die Laufzeiten in Sekunden.
+    :type runs: list
+    :param units: Optionale Anzahl verarbeiteter Einheiten für ``us_per_unit``.
+    :type units: int
+    :rtype: dict
+    """
+    seconds = min(runs)
+    result = {"name": name, "params": params, "seconds": seconds, "runs": runs}
+    if units:
+        result["us_per_unit"] = seconds * 1e6 / units
+    return result
+
+
+def run_suite(profile="quick", repeat=3, only=None, progress=None):
+    """Führt alle Fälle eines Profils aus.
+
+    :param profile: Der Name des Profils aus :data:`PROFILES`.
+    :type profile: str
+    :param repeat: Messungen pro Fall.
+    :type repeat: int
+    :param only: Optional nur Fälle mit diesen Namen.
+    :type only: list
+    :param progress: Optionaler Rückruf ``progress(eintrag)`` nach jedem Fall.
+    :type progress: callable
+    :return: Dictionary mit "meta" und "results".
+    :rtype: dict
+    """
+    config = PROFILES[profile]
+    only = only or config.get("only")
+    results = []
+
+    def add(entry):
+        results.append(entry)
+        if progress is not None:
+            progress(entry)
+
+    def wanted(name):
+        return not only or name in only
+
+    if wanted("create_groups"):
+        for students in config["students"]:
+            for group_size in config["group_sizes"]:
+                for rounds in config["rounds"]:
+                    if students < group_size or students * rounds > config["max_work"]:
+                        continue
+                    runs = bench_create_groups(students, group_size, rounds, repeat)
+                    params = {"students": students, "group_size": group_size, "rounds": rounds}
+                    add(record("create_groups", params, runs, students * rounds))
+
+    if wanted("select_from_file"):
+        with tempfile.TemporaryDirectory() as directory:
+            for rows in config["csv_rows"]:
+                path = os.path.join(directory, f"klasse_{rows}.csv")
+                write_roster(path, rows)
+                add(record("select_from_file", {"rows": rows}, bench_select_from_file(path, repeat), rows))
+
+    if wanted("can_repeat"):
+        for students in config["students"]:
+            for group_size in config["group_sizes"]:
+                if students < group_size:
+                    continue
+                cold, warm = bench_can_repeat(students, group_size, repeat)
+                params = {"students": students, "group_size": group_size}
+                add(record("can_repeat_cold", params, cold))
+                add(record("can_repeat_warm", params, warm))
+
+    if wanted("update_grid"):
+        grid_results = bench_update_grid(config["students"], repeat)
+        for students, runs in grid_results or ():
+            add(record("update_grid", {"students": students}, runs))
+
+    meta = {
+        "profile": profile,
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    return {"meta": meta, "results": results}
+
+
+def result_key(result):
+    """Eindeutiger Schlüssel eines Falls für den Vergleich.
+
+    :rtype: str
+    """
+    return result["name"] + json.dumps(result["params"], sort_keys=True)
+
+
+def compare(current, baseline, tolerance=0.25):
+    """Vergleicht Ergebnisse mit einer Basislinie.
+
+    Ein Fall gilt als Regression, wenn er mehr als ``tolerance`` (relativ) und mehr als
+    :data:`NOISE_FLOOR` (absolut) langsamer ist.
+
+    :param current: Die aktuellen Ergebnisse (wie von :func:`run_suite`).
+    :type current: dict
+    :param baseline: Die Basislinie im selben Format.
+    :type baseline: dict
+    :param tolerance: Erlaubte relative Verlangsamung.
+    :type tolerance: float
+    :return: Liste von (Schlüssel, alt, neu, Verhältnis, Status); Status ist
+        "regression", "schneller", "ok" oder "neu".
+    :rtype: list
+    """
+    previous = {result_key(result): result["seconds"] for result in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        key = result_key(result)
+        new = result["seconds"]
+        old = previous.get(key)
+        if old is None:
+            rows.append((key, None, new, None, "neu"))
+            continue
+        ratio = new / old if old > 0 else float("inf")
+        if ratio > 1 + tolerance and new - old > NOISE_FLOOR:
+            status = "regression"
+        elif ratio < 1 / (1 + tolerance) and old - new > NOISE_FLOOR:
+            status = "schneller"
+        else:
+            status = "ok"
+        rows.append((key, old, new, ratio, status))
+    return rows
+
+
+def format_seconds(seconds):
+    """Formatiert eine Dauer mit passender Einheit (s, ms oder µs).
+
+    :rtype: str
+    """
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.3f} µs"
+
+
+def format_entry(entry):
+    """Formatiert einen Ergebnis-Eintrag als Tabellenzeile.
+
+    :rtype: str
+    """
+    params = " ".join(f"{name}={value}" for name, value in entry["params"].items())
+    per_unit = f"{entry['us_per_unit']:>9.3f} µs/Einheit" if "us_per_unit" in entry else ""
+    return f"{entry['name']:<18} {params:<40} {format_seconds(entry['seconds']):>12} {per_unit}"
+
+
+def main(argv=None):
+    """Kommandozeilen-Einstieg der Benchmark-Suite.
+
+    :param argv: Argumente, standardmäßig ``sys.argv[1:]``.
+    :type argv: list
+    :return: 1, wenn gegen die Basislinie eine Regression gefunden wurde, sonst 0.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description="Misst die Hot Paths des GroupCalculator.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick", help="Messprofil")
+    parser.add_argument("--repeat", type=int, default=3, help="Messungen pro Fall (gewertet wird die schnellste)")
+    parser.add_argument("--only", action="append", help="Nur diesen Fall messen (mehrfach möglich)")
+    parser.add_argument("-o", "--output", help="Ergebnisse als JSON in diese Datei schreiben")
+    parser.add_argument("--baseline", help="Mit dieser Basislinie (JSON) vergleichen")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Erlaubte relative Verlangsamung")
+    parser.add_argument("--save-baseline", help="Ergebnisse als neue Basislinie speichern")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.profile, args.repeat, args.only, progress=lambda entry: print(format_entry(entry)))
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as output:
+                json.dump(results, output, indent=1)
+                output.write("\n")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    rows = compare(results, baseline, args.tolerance)
+    print()
+    print(f"Vergleich mit {args.baseline} (Toleranz {args.tolerance:.0%}):")
+    for key, old, new, ratio, status in rows:
+        if status == "neu":
+            print(f"  {status:<10} {key}")
+        else:
+            print(f"  {status:<10} {key}: {format_seconds(old)} -> {format_seconds(new)} ({ratio:.2f}x)")
+    regressions = [row for row in rows if row[4] == "regression"]
+    print(f"{len(regressions)} Regression(en)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
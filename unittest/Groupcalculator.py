@@ -1,8 +1,27 @@
 import unittest
+import asyncio
+import contextlib
+import json
 import os
+import queue
+import struct
+import subprocess
+import sys
 import tempfile
+import threading
+import zlib
+from array import array
 from collections import defaultdict
-from GroupCalculator.GroupCalculator import GroupCalculator  # Ersetze 'your_module' durch den Namen deines Moduls
+from GroupCalculator.GroupCalculator import (Constraints, GroupCalculator, PairHistory, RosterCache, RoundRandom, SessionStore,  # Ersetze 'your_module' durch den Namen deines Moduls
+                                             group_index, group_label, group_labels, partition_round, resolvable_design,
+                                             round_bounds, stream_roster)
+from GroupCalculator import GroupCalculator as core
+from GroupCalculator.array_backend import ArrayBackend
+from GroupCalculator import batch
+from GroupCalculator.batch import run_batch, run_roster
+from GroupCalculator.service import GroupService, SharedRosters
+from GroupCalculator.worker import BackgroundWorker
+from GroupCalculator import cli
 
 
 class TestGroupCalculator(unittest.TestCase):
@@ -31,12 +50,157 @@ class TestGroupCalculator(unittest.TestCase):
             all_students_in_groups.update(group)
         self.assertEqual(all_students_in_groups, set(self.gc.student_list))
 
+    def test_group_labels(self):
+        """Testet die unbegrenzten Gruppenkennungen."""
+        self.assertEqual(group_label(0), "A")
+        self.assertEqual(group_label(25), "Z")
+        self.assertEqual(group_label(26), "AA")
+        self.assertEqual(group_label(27), "AB")
+        self.assertEqual(group_label(26 + 26 * 26), "AAA")
+        self.assertEqual([group_index(group_label(index)) for index in range(2000)], list(range(2000)))
+        with self.assertRaises(ValueError):
+            group_index("a1")
+
+    def test_group_labels_threads(self):
+        """Testet den Zwischenspeicher der Kennungen bei gleichzeitigen Aufrufen."""
+        core._LABELS = []
+        threads = [threading.Thread(target=lambda size=size: [group_labels(size + i) for i in range(200)])
+                   for size in range(0, 800, 100)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(group_labels(1000), [group_label(index) for index in range(1000)])
+
+    def test_partition_round(self):
+        """Testet das Zerlegen in zusammenhängende Abschnitte mit Restverteilung."""
+        groups = partition_round(list(range(1, 12)), 3)
+        self.assertEqual(list(groups), ["A", "B", "C"])
+        self.assertEqual(groups["A"], [1, 2, 3, 10])
+        self.assertEqual(groups["B"], [4, 5, 6, 11])
+        self.assertEqual(groups["C"], [7, 8, 9])
+
+    def test_create_groups_many_groups(self):
+        """Testet, dass auch mehr als 26 Gruppen gültige Kennungen erhalten."""
+        gc = GroupCalculator(100, 2)
+        gc.create_groups()
+        groups = gc.get_current_groups()
+        self.assertEqual(len(groups), 50)
+        self.assertIn("AX", groups)
+        self.assertTrue(all(label.isalpha() and label.isupper() for label in groups))
+
+    def test_pair_history(self):
+        """Testet das Dreiecks-Bitset der Paar-Historie."""
+        history = PairHistory(5)
+        self.assertFalse(history.has_met(1, 3))
+        self.assertFalse(history.mark(3, 1))
+        self.assertTrue(history.has_met(1, 3))
+        self.assertIn((3, 1), history)
+        self.assertEqual(history.mark_group([0, 1, 3]), 1)
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history.conflicts(0, [1, 2, 3]), 2)
+        history.clear()
+        self.assertEqual(len(history), 0)
+
+    def test_create_groups_without_repeats(self):
+        """Testet, dass sich Paare über mehrere Runden nicht wiederholen."""
+        gc = GroupCalculator(300, 3)
+        gc.reset_groups()
+        seen = set()
+        for _ in range(10):
+            gc.create_groups()
+            self.assertEqual(gc.last_repeat_count, 0)
+            for group in gc.get_current_groups().values():
+                for i, a in enumerate(group):
+                    for b in group[i + 1:]:
+                        pair = frozenset((a, b))
+                        self.assertNotIn(pair, seen)
+                        seen.add(pair)
+
+    def test_create_groups_optimize(self):
+        """Testet den Optimierungsmodus und dessen Kennzahlen."""
+        gc = GroupCalculator(20, 4)
+        gc.reset_groups()
+        for _ in range(6):
+            gc.create_groups(strategy="optimize", time_budget=0.01)
+            members = sorted(s for group in gc.get_current_groups().values() for s in group)
+            self.assertEqual(members, list(range(1, 21)))
+            self.assertEqual(gc.optimizer_stats["repeats"], gc.last_repeat_count)
+            self.assertIn("iterations_per_second", gc.optimizer_stats)
+
+        with self.assertRaises(ValueError):
+            gc.create_groups(strategy="unbekannt")
+
+    def test_incremental_changes(self):
+        """Testet das Anpassen der aktuellen Runde ohne komplettes Neumischen."""
+        self.gc.reset_groups()
+        self.gc.create_groups()
+        before = {label: list(group) for label, group in self.gc.get_current_groups().items()}
+
+        self.gc.set_num_students(13)
+        groups = self.gc.get_current_groups()
+        self.assertEqual(len(groups), 4)
+        self.assertEqual(sorted(s for group in groups.values() for s in group), list(range(1, 14)))
+        for label, group in before.items():
+            self.assertEqual(groups[label][:len(group)], group)
+
+        self.gc.remove_students([13, 12, 11, 10])
+        groups = self.gc.get_current_groups()
+        self.assertEqual(sorted(s for group in groups.values() for s in group), list(range(1, 10)))
+        self.assertEqual(sorted(map(len, groups.values())), [3, 3, 3])
+
+        self.gc.set_group_size(4)
+        self.assertEqual(sorted(map(len, self.gc.get_current_groups().values())), [4, 5])
+        self.assertEqual(len(self.gc.previous_combinations.bits), (9 * 8 // 2 + 7) // 8)
+
+    def test_pair_history_resize(self):
+        """Testet das Verkleinern und Vergrößern der Paar-Historie."""
+        history = PairHistory(6)
+        history.mark_group([0, 1, 5])
+        history.mark(2, 3)
+        history.resize(5)
+        self.assertEqual(len(history), 2)
+        history.resize(6)
+        self.assertFalse(history.has_met(0, 5))
+        self.assertTrue(history.has_met(0, 1))
+        history.move(2, 4)
+        self.assertTrue(history.has_met(4, 3))
+
+    def test_resolvable_designs(self):
+        """Testet, dass die Konstruktionen jedes Paar genau einmal zusammenbringen."""
+        for num_students, group_size in [(10, 2), (15, 3), (27, 3), (16, 4), (25, 5), (64, 8)]:
+            name, rounds = resolvable_design(num_students, group_size)
+            pairs = set()
+            for current_round in rounds:
+                self.assertEqual(sorted(sum(current_round, [])), list(range(num_students)))
+                for group in current_round:
+                    self.assertEqual(len(group), group_size)
+                    for i, a in enumerate(group):
+                        for b in group[i + 1:]:
+                            self.assertNotIn((min(a, b), max(a, b)), pairs, name)
+                            pairs.add((min(a, b), max(a, b)))
+            self.assertEqual(len(pairs), num_students * (num_students - 1) // 2)
+        self.assertIsNone(resolvable_design(10, 3))
+
+    def test_create_schedule(self):
+        """Testet das Erstellen aller Runden in einem Aufruf."""
+        gc = GroupCalculator(15, 3)
+        gc.reset_groups()
+        self.assertEqual(gc.create_schedule(), "kirkman")
+        self.assertEqual(len(gc.groups), 7)
+        self.assertEqual(len(gc.previous_combinations), 105)
+
+        self.gc.reset_groups()
+        self.assertEqual(self.gc.create_schedule(rounds=3), "heuristic")
+        self.assertEqual(self.gc.get_round_count(), 3)
+
     def test_reset_groups(self):
         """Testet das Zurücksetzen der Gruppen."""
         self.gc.create_groups()
         self.gc.reset_groups()
         self.assertEqual(len(self.gc.groups), 0)
         self.assertEqual(self.gc.round_counter, 0)
+        self.assertEqual(len(self.gc.previous_combinations), 0)
 
     def test_load_from_csv(self):
         """Testet das Laden von Schülern aus einer CSV-Datei."""
@@ -59,16 +223,700 @@ class TestGroupCalculator(unittest.TestCase):
         # Lösche die temporäre Datei
         os.remove(temp_file_path)
 
+    def test_stream_roster(self):
+        """Testet das zeilenweise Einlesen mit Spaltenauswahl und Fehlerbericht."""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', newline='') as temp_file:
+            temp_file.write("Klasse;Vorname;Nachname;Geburtstag\n")
+            temp_file.write("5a;Max;Mustermann;2014-01-01\n")
+            temp_file.write("5a;Kurz\n")
+            temp_file.write("\n")
+            temp_file.write("5b;Max;Mustermann;2014-02-02\n")
+            temp_file.write("5b;Erika;Musterfrau;2014-03-03\n")
+            temp_file_path = temp_file.name
+
+        calls = []
+        roster = stream_roster(temp_file_path, delimiter=";", skip_header=True, first_name_col=1,
+                               last_name_col=2, chunk_size=2, progress=lambda rows, rate: calls.append(rows))
+        os.remove(temp_file_path)
+
+        self.assertEqual(roster.students(), ["Max Mustermann", "Max Mustermann", "Erika Musterfrau"])
+        self.assertEqual(roster.names, ["Max Mustermann", "Erika Musterfrau"])
+        self.assertEqual(list(roster.ids), [0, 0, 1])
+        self.assertEqual(roster.error_count, 1)
+        self.assertEqual(roster.errors[0][0], 3)
+        self.assertEqual(calls, [2, 4, 5])
+
+    def test_stream_roster_invalid_bytes(self):
+        """Testet, dass ungültige UTF-8-Bytes das Einlesen nicht abbrechen."""
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "klasse.csv")
+            with open(csv_path, "wb") as roster_file:
+                roster_file.write(b"Max,Mustermann\nJ\xf6rg,M\xfcller\nErika,Musterfrau\n")
+            roster = stream_roster(csv_path)
+        self.assertEqual(roster.students(), ["Max Mustermann", "J\ufffdrg M\ufffdller", "Erika Musterfrau"])
+        self.assertEqual(roster.errors, [(2, "Ungültige Zeichen (kein UTF-8) ersetzt")])
+
+    def test_roster_cache(self):
+        """Testet das Zwischenspeichern und Invalidieren eingelesener Schülerlisten."""
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "klasse.csv")
+            with open(csv_path, "w", encoding="utf-8") as roster_file:
+                roster_file.write("Max,Mustermann\nErika,Musterfrau\nMax,Mustermann\n")
+
+            cache = RosterCache(os.path.join(directory, "cache"))
+            key = cache.make_key(csv_path, ",", False, 0, 1)
+            self.assertIsNone(cache.load(key))
+
+            self.gc.select_from_file(csv_path, cache=cache)
+            cached = cache.load(key)
+            self.assertIsNotNone(cached)
+            self.assertEqual(cached.students(), self.gc.student_list)
+            self.assertEqual(cached.names, ["Max Mustermann", "Erika Musterfrau"])
+
+            # Andere Optionen oder eine geänderte Datei erzeugen keinen Treffer
+            self.assertIsNone(cache.load(cache.make_key(csv_path, ",", True, 0, 1)))
+            with open(csv_path, "a", encoding="utf-8") as roster_file:
+                roster_file.write("Lisa,Neu\n")
+            self.gc.select_from_file(csv_path, cache=cache)
+            self.assertEqual(len(self.gc.student_list), 4)
+
+            # Die Namenstabelle wird übernommen; mit gespeicherten Runden bleiben alte Namen erhalten
+            for gc in (self.gc, GroupCalculator(10, 3)):
+                gc.select_from_file(csv_path, cache=cache)
+                self.assertEqual([gc.groups.names[i] for i in gc._name_ids], gc.student_list)
+                self.assertEqual(gc.groups.name_id("Lisa Neu"), 2)
+            self.gc.create_groups()
+            old_round = self.gc.groups[self.gc.round_counter]
+            self.gc.student_list = [5, "Max Mustermann"]
+            self.gc.select_from_file(csv_path, cache=cache)
+            self.assertEqual([self.gc.groups.names[i] for i in self.gc._name_ids], self.gc.student_list)
+            self.assertEqual(self.gc.groups[self.gc.round_counter], old_round)
+            self.assertEqual(self.gc.groups.intern("Lisa Neu"), self.gc._name_ids[-1])
+
+    def test_session_store(self):
+        """Testet das Speichern und Fortsetzen einer Sitzung inklusive Paar-Historie."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sitzung.wxgs")
+            self.gc.reset_groups()
+            store = self.gc.start_session(path)
+            store.checkpoint_interval = 2
+            for _ in range(5):
+                self.gc.create_groups()
+            store.close()
+
+            # Ein abgebrochener letzter Datensatz wird beim Fortsetzen verworfen
+            with open(path, "ab") as log_file:
+                log_file.write(b"\x05\x00\x00")
+
+            resumed = SessionStore(path).resume()
+            self.assertEqual(dict(resumed.groups), dict(self.gc.groups))
+            self.assertEqual(resumed.get_round_count(), 5)
+            self.assertEqual(resumed.rng.seed, self.gc.rng.seed)
+            self.assertEqual(resumed.previous_combinations.bits, self.gc.previous_combinations.bits)
+
+            resumed.create_groups()
+            resumed.session_store.close()
+            again = SessionStore(path).resume()
+            again.session_store.close()
+            self.assertEqual(again.get_round_count(), 6)
+            self.assertEqual(dict(again.groups), dict(resumed.groups))
+
+    def test_session_store_roster_changes(self):
+        """Testet das Fortsetzen nach Hinzufügen und Entfernen von Schülern während der Sitzung."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sitzung.wxgs")
+            gc = GroupCalculator(10, 3)
+            gc.start_session(path)
+            gc.set_num_students(12)
+            gc.create_groups()
+            resumed = SessionStore(path).resume()
+            resumed.session_store.close()
+            self.assertEqual(resumed.student_list, gc.student_list)
+            self.assertEqual(dict(resumed.groups), dict(gc.groups))
+
+            gc.session_store.checkpoint_interval = 2
+            gc.create_groups()
+            gc.remove_students([1, 5])
+            gc.add_students(["Neu"])
+            gc.set_group_size(4)
+            gc.create_groups()
+            gc.remove_students([12])
+            gc.create_groups()
+            gc.session_store.close()
+
+            resumed = SessionStore(path).resume()
+            self.assertEqual(resumed.student_list, gc.student_list)
+            self.assertEqual(resumed.group_size, 4)
+            self.assertEqual(resumed.get_round_count(), gc.get_round_count())
+            self.assertEqual(dict(resumed.groups), dict(gc.groups))
+            self.assertEqual(resumed.previous_combinations.bits, gc.previous_combinations.bits)
+
+            resumed.remove_students(["Neu"])
+            resumed.session_store.close()
+            again = SessionStore(path).resume()
+            again.session_store.close()
+            self.assertEqual(again.get_current_groups(), resumed.get_current_groups())
+
+    def test_rebalance_pair_history(self):
+        """Testet, dass die Paar-Historie nach Änderungen der Klasse genau den gespeicherten Runden entspricht."""
+        def assert_history_matches(gc):
+            position = {name: index for index, name in enumerate(gc.student_list)}
+            expected = set()
+            for groups in gc.groups.values():
+                for group in groups.values():
+                    members = sorted(position[name] for name in group if name in position)
+                    expected.update((a, b) for i, a in enumerate(members) for b in members[i + 1:])
+            history = gc.previous_combinations
+            count = len(gc.student_list)
+            actual = {(a, b) for a in range(count) for b in range(a + 1, count) if history.has_met(a, b)}
+            self.assertEqual(actual, expected)
+
+        gc = GroupCalculator(12, 3)
+        gc.set_group_size(4)
+        assert_history_matches(gc)
+        gc.create_groups()
+        gc.add_students(["Neu 1", "Neu 2"])
+        assert_history_matches(gc)
+        gc.remove_students([1, 5, "Neu 1"])
+        assert_history_matches(gc)
+        gc.set_group_size(2)
+        assert_history_matches(gc)
+        gc.set_group_size(5)
+        assert_history_matches(gc)
+        gc.create_groups()
+        assert_history_matches(gc)
+
+        constrained = GroupCalculator(12, 3)
+        constrained.create_groups()
+        names = constrained.student_list
+        kept, dissolved = constrained._current_index_groups[:3], constrained._current_index_groups[3]
+        for student, targets in zip(dissolved, ((1, 2), (0, 2), (0, 1))):
+            for target in targets:
+                constrained.constraints.keep_apart(names[student], names[kept[target][0]])
+        constrained.set_group_size(4)
+        assert_history_matches(constrained)
+        current = constrained._current_index_groups
+        self.assertEqual([group[-1] for group in current], dissolved)
+        self.assertEqual(constrained.last_constraint_violations, 0)
+
+    def test_session_store_damaged(self):
+        """Testet, dass beschädigte Protokolle einheitlich als ValueError gemeldet werden."""
+        def write_log(path, header, record=b""):
+            header = json.dumps(header).encode("utf-8")
+            with open(path, "wb") as log_file:
+                log_file.write(struct.pack("<4sII", SessionStore.MAGIC, SessionStore.VERSION, len(header)))
+                log_file.write(header + record + (struct.pack("<I", zlib.crc32(record)) if record else b""))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sitzung.wxgs")
+            write_log(path, {"group_size": 2})
+            with self.assertRaises(ValueError):
+                SessionStore(path).resume()
+            write_log(path, [1, 2])
+            with self.assertRaises(ValueError):
+                SessionStore(path).resume()
+            record = struct.pack("<III", 1, 1, 2) + array("H", [2]).tobytes() + array("i", [0, 7]).tobytes()
+            write_log(path, {"group_size": 2, "students": [1, 2, 3]}, record)
+            with self.assertRaises(ValueError):
+                SessionStore(path).resume()
+
+    def test_constraints(self):
+        """Testet Getrennt-, Zusammen- und Merkmalsregeln über mehrere Runden."""
+        gc = GroupCalculator(60, 4)
+        constraints = Constraints()
+        constraints.keep_apart(1, 2, 3)
+        constraints.keep_together(20, 21, 22)
+        constraints.balance("Klasse", {student: "5a" if student <= 15 else "5b" for student in range(1, 61)})
+        gc.constraints = constraints
+
+        for strategy in ("greedy", "optimize", "greedy"):
+            gc.create_groups(strategy=strategy, time_budget=0.01)
+            self.assertEqual(gc.last_constraint_violations, 0)
+            location = {member: label for label, group in gc.get_current_groups().items() for member in group}
+            self.assertEqual(len({location[1], location[2], location[3]}), 3)
+            self.assertEqual(len({location[20], location[21], location[22]}), 1)
+            for group in gc.get_current_groups().values():
+                self.assertEqual(len(group), 4)
+                self.assertEqual(sum(member <= 15 for member in group), 1)
+
+        constraints.keep_together(*range(10, 15))
+        with self.assertRaises(ValueError):
+            gc.create_groups()
+
+    def test_constraint_index_cache(self):
+        """Testet, dass neue Regel-Objekte nie einen veralteten Index erhalten."""
+        gc = GroupCalculator(12, 3)
+        first = Constraints()
+        first.keep_apart(1, 2)
+        gc.constraints = first
+        self.assertIs(gc._indexed_constraints(), gc._indexed_constraints())
+        second = Constraints()
+        second.keep_apart(3, 4)
+        gc.constraints = second
+        self.assertEqual(sorted(gc._indexed_constraints().apart), [2, 3])
+
+    def test_constraints_from_csv(self):
+        """Testet das Laden von Regeln aus zusätzlichen Spalten und einer Regeldatei."""
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "klasse.csv")
+            with open(csv_path, "w", encoding="utf-8") as roster_file:
+                for number in range(12):
+                    together = "t" if number in (0, 1) else ""
+                    roster_file.write(f"S,{number},{together},{'5a' if number % 3 == 0 else '5b'}\n")
+            rule_path = os.path.join(directory, "regeln.csv")
+            with open(rule_path, "w", encoding="utf-8") as rule_file:
+                rule_file.write("# Regeln\ngetrennt,S 2,S 3\n\nzusammen,S 4,S 5\n")
+
+            self.gc.together_col = 2
+            self.gc.balance_cols = {"Klasse": 3}
+            self.gc.constraint_file = rule_path
+            self.gc.select_from_file(csv_path)
+            self.assertEqual(self.gc.roster.extra[3][:3], ["5a", "5b", "5b"])
+            self.assertEqual(self.gc.constraints.together, [["S 4", "S 5"], ["S 0", "S 1"]])
+            self.assertEqual(self.gc.constraints.apart["S 2"], {"S 3"})
+
+            self.gc.create_groups()
+            self.assertEqual(self.gc.last_constraint_violations, 0)
+
+            with open(rule_path, "w", encoding="utf-8") as rule_file:
+                rule_file.write("vielleicht,S 2,S 3\n")
+            with self.assertRaises(ValueError):
+                self.gc.select_from_file(csv_path)
+
+    def test_round_store(self):
+        """Testet die kompakte Rundenspeicherung und die Ansicht nach Änderungen der Schülerliste."""
+        gc = GroupCalculator(1000, 4, seed=3)
+        gc.reset_groups()
+        for _ in range(20):
+            gc.create_groups()
+        self.assertLess(gc.groups.nbytes() / (20 * 1000), 6)
+        self.assertEqual(len(gc.groups.names), 1000)
+        self.assertFalse(hasattr(gc.groups.round(1), "__dict__"))
+
+        first_round = gc.groups[1]
+        gc.remove_students([1, 2, 3])
+        gc.add_students([1001])
+        self.assertEqual(gc.groups[1], first_round)
+        current = [member for group in gc.get_current_groups().values() for member in group]
+        self.assertEqual(sorted(current), sorted(gc.student_list))
+        self.assertEqual(set(gc.groups), set(range(1, 21)))
+
+    def test_student_index(self):
+        """Testet die Abfragen über den umgekehrten Index gegen eine vollständige Suche."""
+        gc = GroupCalculator(30, 4, seed=8)
+        gc.reset_groups()
+        gc.create_groups()
+        gc.find_student(1)  # Index aufbauen, danach wird er fortgeschrieben
+        for _ in range(4):
+            gc.create_groups()
+        gc.add_students([31])
+
+        for student in (1, 17, 31):
+            expected = [(number, label) for number, groups in gc.groups.items()
+                        for label, group in groups.items() if student in group]
+            self.assertEqual(gc.find_student(student), expected)
+            partners = defaultdict(int)
+            for groups in gc.groups.values():
+                for group in groups.values():
+                    if student in group:
+                        for other in group:
+                            if other != student:
+                                partners[other] += 1
+            self.assertEqual(gc.partners(student), dict(partners))
+        self.assertEqual(gc.group_in_round(31), gc.find_student(31)[-1][1])
+        self.assertIsNone(gc.group_in_round(31, 1))
+        with self.assertRaises(ValueError):
+            gc.find_student("Unbekannt")
+
+    def test_student_index_threads(self):
+        """Testet den Aufbau des Index, während ein anderer Thread Runden speichert."""
+        gc = GroupCalculator(2000, 4)
+        gc.reset_groups()
+        writer = threading.Thread(target=lambda: [gc.create_groups() for _ in range(30)])
+        writer.start()
+        while writer.is_alive():
+            gc.groups._index = None
+            gc.find_student(1)
+        writer.join()
+
+        built = gc.groups.index
+        gc.groups._index = None
+        fresh = gc.groups.index
+        self.assertEqual(built.rounds, fresh.rounds)
+        self.assertEqual(built.partners, fresh.partners)
+
+    def test_instrumentation(self):
+        """Testet Zeiten, Zähler und Speichermessung sowie das restlose Abschalten."""
+        gc = GroupCalculator(60, 3, seed=1)
+        gc.reset_groups()
+        gc.create_groups()
+        self.assertNotIn("create_groups", vars(gc))  # ohne Messung keine Hüllen
+
+        instrumentation = gc.enable_instrumentation(profile=True, memory=True)
+        for _ in range(3):
+            gc.create_groups()
+        gc.can_repeat()
+        report = instrumentation.report()
+        self.assertEqual(report["timings"]["create_groups"]["calls"], 3)
+        self.assertEqual(report["timings"]["_store_round"]["calls"], 3)
+        self.assertEqual(report["timings"]["feasibility"]["calls"], 1)
+        self.assertEqual(report["counters"]["rounds"], 3)
+        self.assertEqual(report["counters"]["students_placed"], 180)
+        self.assertGreater(report["memory_peaks"]["create_groups"], 0)
+        self.assertIn("create_groups", instrumentation.profile_stats())
+
+        self.assertIs(gc.disable_instrumentation(), instrumentation)
+        self.assertFalse(set(vars(gc)) & set(instrumentation.METHODS))
+        gc.create_groups()
+        self.assertEqual(instrumentation.report()["counters"]["rounds"], 3)
+
+    def test_seeded_rounds(self):
+        """Testet reproduzierbare Runden und den direkten Zugriff auf die Mischung einer Runde."""
+        first, second = GroupCalculator(30, 3, seed=42), GroupCalculator(30, 3, seed=42)
+        for gc in (first, second):
+            gc.reset_groups()
+            for _ in range(4):
+                gc.create_groups()
+        self.assertEqual(dict(first.groups), dict(second.groups))
+
+        # Die Mischung einer Runde hängt nicht von den Runden davor ab
+        self.assertEqual(first.round_order(3), RoundRandom(42).permutation(3, 30))
+        self.assertNotEqual(first.round_order(3), first.round_order(4))
+        self.assertNotEqual(RoundRandom(1).permutation(1, 30), RoundRandom(2).permutation(1, 30))
+
+        # Ohne Historie entspricht die erste Runde genau der Mischung
+        fresh = GroupCalculator(9, 3, seed="klasse-5a")
+        fresh.reset_groups()
+        fresh.create_groups()
+        order = fresh.round_order(1)
+        self.assertEqual(fresh.groups[1]["A"], [fresh.student_list[i] for i in order[:3]])
+
     def test_can_repeat(self):
         """Testet die Berechnung der maximalen Anzahl möglicher Runden ohne Wiederholungen."""
         max_rounds = self.gc.can_repeat()
         self.assertGreater(max_rounds, 0)
 
+    def test_round_bounds(self):
+        """Testet die Schranken für wiederholungsfreie Runden inklusive Rest und Ausnahmen."""
+        self.assertEqual(round_bounds(15, 3), (7, 7, "kirkman", True))
+        self.assertEqual(round_bounds(16, 4), (5, 5, "affine", True))
+        self.assertEqual(round_bounds(8, 2), (7, 7, "round-robin", True))
+        self.assertEqual(round_bounds(6, 3).upper, 1)   # 3er-Gruppe bräuchte 3 von 2 Gruppen
+        self.assertEqual(round_bounds(12, 3).upper, 4)  # kein NKTS(12)
+        self.assertEqual(round_bounds(10, 3).upper, 3)  # Rest: eine Vierergruppe pro Runde
+        self.assertFalse(round_bounds(10, 3).exact)
+        self.assertIs(round_bounds(10, 3), round_bounds(10, 3))
+        self.assertEqual(self.gc.can_repeat(), 3)
+        self.assertEqual(round_bounds(20, 4)[:3], (5, 6, None))  # zyklische Konstruktion
+
+        # Die untere Schranke der zyklischen Konstruktion ist erreichbar
+        for num_students, group_size in ((20, 4), (23, 4), (21, 3), (35, 5), (55, 5)):
+            num_groups = num_students // group_size
+            lower = round_bounds(num_students, group_size).lower
+            self.assertGreater(lower, 1)
+            met = set()
+            for r in range(lower):
+                groups = defaultdict(list)
+                for student in range(num_students):
+                    row, col = divmod(student, num_groups)
+                    groups[(col + row * r) % num_groups].append(student)
+                self.assertEqual(sorted(map(len, groups.values())),
+                                 sorted(map(len, partition_round(list(range(num_students)), group_size).values())))
+                for group in groups.values():
+                    pairs = {(a, b) for a in group for b in group if a < b}
+                    self.assertFalse(pairs & met)
+                    met |= pairs
+
+        # Die Schranke für Paare ist erreichbar, danach gibt es zwangsläufig Wiederholungen
+        gc = GroupCalculator(8, 2)
+        gc.reset_groups()
+        self.assertEqual(gc.create_schedule(), "round-robin")
+        self.assertEqual(gc.get_round_count(), gc.can_repeat())
+
     def test_invalid_group_size(self):
         """Testet die Initialisierung mit einer ungültigen Gruppengröße."""
         with self.assertRaises(ValueError):
             GroupCalculator(num_students=2, group_size=3)
 
 
+class TestArrayBackend(unittest.TestCase):
+    def test_generate_rounds(self):
+        """Testet Form und Vollständigkeit der vektorisiert erzeugten Runden."""
+        backend = ArrayBackend(list(range(1, 12)), 3, seed=7)
+        backend.generate(5, batch_size=2)
+        self.assertEqual(len(backend.rounds), 5)
+        groups, remainder = backend.rounds[0]
+        self.assertEqual(groups.shape, (3, 3))
+        self.assertEqual(remainder.shape, (2,))
+        self.assertEqual(str(groups.dtype), "int32")
+
+        view = backend.to_dict(0)
+        self.assertEqual(list(view), ["A", "B", "C"])
+        self.assertEqual(sorted(s for group in view.values() for s in group), list(range(1, 12)))
+
+    def test_pair_counts(self):
+        """Testet die Paarzähler gegen die Dictionary-Ansicht."""
+        backend = ArrayBackend(["a", "b", "c", "d", "e"], 2, seed=1)
+        backend.generate(20)
+        expected = defaultdict(int)
+        for round_groups in backend.to_groups().values():
+            for group in round_groups.values():
+                for i, x in enumerate(group):
+                    for y in group[i + 1:]:
+                        expected[frozenset((x, y))] += 1
+        for x in backend.names:
+            for y in backend.names:
+                if x < y:
+                    count = backend.pair_count(backend.index_of(x), backend.index_of(y))
+                    self.assertEqual(count, expected[frozenset((x, y))])
+
+
+    def test_pair_counts_overflow(self):
+        """Testet, dass die Paarzähler bei kleinen Klassen und sehr vielen Runden nicht überlaufen."""
+        backend = ArrayBackend(["a", "b", "c", "d"], 2, seed=1)
+        backend.pair_counts[:] = 65535
+        backend.generate(3)
+        self.assertEqual(int(backend.pair_counts.sum()), 6 * 65535 + 3 * 2)
+        self.assertEqual(backend.repeat_count(), 6 * 65534 + 3 * 2)
+
+
+class TestBatch(unittest.TestCase):
+    def test_run_batch(self):
+        """Testet die parallele Verarbeitung mehrerer Klassenlisten mit festen Startwerten."""
+        with tempfile.TemporaryDirectory() as directory:
+            for name, count in (("a.csv", 12), ("b.csv", 9), ("leer.csv", 1)):
+                with open(os.path.join(directory, name), "w", encoding="utf-8") as roster:
+                    roster.writelines(f"Vor{i},Nach{i}\n" for i in range(count))
+
+            results = run_batch([directory], rounds=3, group_size=3, seed=5, workers=2)
+            again = run_batch([directory], rounds=3, group_size=3, seed=5, workers=1)
+
+        self.assertEqual([os.path.basename(result["roster"]) for result in results], ["a.csv", "b.csv", "leer.csv"])
+        self.assertEqual(results[0]["students"], 12)
+        self.assertEqual(results[0]["max_rounds"], 4)
+        self.assertEqual(list(results[1]["rounds"]), [1, 2, 3])
+        self.assertIn("error", results[2])
+        self.assertEqual(results, again)
+
+    def test_run_roster_unbounded(self):
+        """Testet, dass unbegrenzt viele Runden als gültiges JSON (null) ausgegeben werden."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "klasse.csv")
+            with open(path, "w", encoding="utf-8") as roster:
+                roster.writelines(f"Vor{i},Nach{i}\n" for i in range(4))
+            result = run_roster(path, rounds=2, group_size=1, seed=1)
+        self.assertIsNone(result["max_rounds"])
+        self.assertIn('"max_rounds": null', json.dumps(result, allow_nan=False))
+
+    def test_invalid_arguments(self):
+        """Testet, dass ungültige Gruppengrößen und Rundenzahlen nicht die ganze Stapelverarbeitung abbrechen."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "klasse.csv")
+            with open(path, "w", encoding="utf-8") as roster:
+                roster.writelines(f"Vor{i},Nach{i}\n" for i in range(6))
+            for group_size, rounds in ((0, 1), (-2, 1), (3, -1)):
+                self.assertIn("error", run_roster(path, rounds, group_size, seed=1))
+            results = run_batch([path, path], rounds=1, group_size=0, workers=1)
+            self.assertEqual([("error" in result) for result in results], [True, True])
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stderr(devnull):
+                for argv in (["-g", "0", path], ["-r", "-1", path], ["-g", "x", path]):
+                    with self.assertRaises(SystemExit):
+                        batch.main(argv)
+
+
+class TestCli(unittest.TestCase):
+    def test_ndjson_rounds(self):
+        """Testet die Ausgabe mehrerer Runden als NDJSON."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "runden.ndjson")
+            self.assertEqual(cli.main(["-n", "10", "-r", "3", "-g", "3", "-s", "1", "-o", path]), 0)
+            with open(path, encoding="utf-8") as output:
+                rounds = [json.loads(line) for line in output]
+        self.assertEqual([record["round"] for record in rounds], [1, 2, 3])
+        self.assertEqual(sorted(s for group in rounds[0]["groups"].values() for s in group), list(range(1, 11)))
+
+    def test_csv_and_json_rounds(self):
+        """Testet die Ausgabe als CSV und als JSON-Array aus einer Klassenliste."""
+        with tempfile.TemporaryDirectory() as directory:
+            roster = os.path.join(directory, "klasse.csv")
+            with open(roster, "w", encoding="utf-8") as roster_file:
+                roster_file.writelines(f"Vor{i},Nach{i}\n" for i in range(6))
+            csv_path = os.path.join(directory, "runden.csv")
+            json_path = os.path.join(directory, "runden.json")
+            self.assertEqual(cli.main([roster, "-r", "2", "-g", "2", "-f", "csv", "-o", csv_path]), 0)
+            self.assertEqual(cli.main([roster, "-r", "2", "-g", "2", "-f", "json", "-o", json_path]), 0)
+            with open(csv_path, encoding="utf-8") as output:
+                rows = output.read().splitlines()
+            with open(json_path, encoding="utf-8") as output:
+                rounds = json.load(output)
+        self.assertEqual(rows[0], "runde,gruppe,schueler")
+        self.assertEqual(len(rows), 1 + 2 * 6)
+        self.assertEqual(len(rounds), 2)
+
+    def test_invalid_arguments(self):
+        """Testet, dass die Kommandozeile Gruppengröße 0 und negative Zahlen ablehnt."""
+        parser = cli.build_parser()
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stderr(devnull):
+            for argv in (["-n", "10", "-g", "0"], ["-n", "10", "-g", "-3"], ["-n", "10", "-r", "-1"], ["-n", "0"]):
+                with self.assertRaises(SystemExit):
+                    parser.parse_args(argv)
+        self.assertEqual(parser.parse_args(["-n", "10", "-r", "0", "-g", "1"]).rounds, 0)
+
+    def test_module_without_wx(self):
+        """Testet, dass Rechenmodul, Kommandozeile und Hintergrund-Thread wxPython nicht laden."""
+        code = "import sys, GroupCalculator.cli, GroupCalculator.worker; sys.exit('wx' in sys.modules)"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(subprocess.run([sys.executable, "-c", code], cwd=root).returncode, 0)
+
+
+class TestBackgroundWorker(unittest.TestCase):
+    def test_coalescing_and_cancellation(self):
+        """Testet das Zusammenfassen wartender Aufträge und den kooperativen Abbruch."""
+        delivered = queue.Queue()
+        worker = BackgroundWorker(lambda callback, *args: delivered.put((callback, args)))
+        started, release = threading.Event(), threading.Event()
+        ran, results = [], []
+
+        def first(cancelled):
+            started.set()
+            release.wait(5)
+            ran.append(1)
+            return cancelled()
+
+        def job(number):
+            def run(cancelled):
+                ran.append(number)
+                return number
+            return run
+
+        def failing(cancelled):
+            raise ValueError("kaputt")
+
+        try:
+            worker.submit(first, results.append)
+            self.assertTrue(started.wait(5))
+            worker.submit(job(2), results.append)
+            worker.submit(job(3), results.append)  # ersetzt den noch wartenden Auftrag 2
+            release.set()
+            for _ in range(2):
+                callback, args = delivered.get(timeout=5)
+                callback(*args)  # Zustellung im "GUI-Thread"
+            self.assertEqual(ran, [1, 3])
+            self.assertEqual(results, [3])  # Ergebnis des abgebrochenen Auftrags 1 entfällt
+
+            errors = []
+            worker.submit(failing, results.append, errors.append)
+            callback, args = delivered.get(timeout=5)
+            callback(*args)
+            self.assertEqual([str(error) for error in errors], ["kaputt"])
+        finally:
+            worker.stop()
+        self.assertFalse(worker._thread.is_alive())
+
+
+class TestService(unittest.TestCase):
+    def test_sessions(self):
+        """Testet Sitzungen, Auslagern auf die Platte und die gemeinsamen Klassenlisten."""
+        async def scenario(directory):
+            roster = os.path.join(directory, "klasse.csv")
+            with open(roster, "w", encoding="utf-8") as roster_file:
+                roster_file.writelines(f"Vor{i},Nach{i}\n" for i in range(9))
+            service = GroupService(os.path.join(directory, "sitzungen"), max_sessions=1,
+                                   rosters=SharedRosters(4, RosterCache(directory)), roster_dir=directory)
+            try:
+                status, first = await service.handle("POST", "/sessions", json.dumps(
+                    {"id": "a", "roster": "klasse.csv", "group_size": 3, "seed": 5}).encode())
+                self.assertEqual((status, first["students"], first["max_rounds"]), (201, 9, 4))
+                status, _ = await service.handle("POST", "/sessions", json.dumps({"roster": roster}).encode())
+                self.assertEqual(status, 201)
+                self.assertEqual((service.rosters.misses, service.rosters.hits), (1, 1))
+
+                # "a" wurde ausgelagert und wird aus dem Protokoll fortgesetzt
+                status, created = await service.handle("POST", "/sessions/a/rounds", b"")
+                self.assertEqual((status, created["round"]), (201, 1))
+                self.assertEqual(service.stats()["reloads"], 1)
+                await service.handle("POST", "/sessions", json.dumps({"num_students": 6, "group_size": 2}).encode())
+                status, stored = await service.handle("GET", "/sessions/a/rounds/1", b"")
+                self.assertEqual((status, stored["groups"]), (200, created["groups"]))
+
+                status, found = await service.handle("GET", "/sessions/a/students/Vor0%20Nach0", b"")
+                self.assertEqual((status, len(found["placements"]), len(found["partners"])), (200, 1, 2))
+                self.assertEqual((await service.handle("GET", "/sessions/x", b""))[0], 404)
+                self.assertEqual((await service.handle("POST", "/sessions", b"[1]"))[0], 400)
+                for payload in ({"roster": "/etc/passwd"}, {"roster": "../klasse.csv"}, {"roster": ["klasse.csv"]},
+                                {"students": [{"name": "x"}, [1], 2]}, {"num_students": {}}):
+                    status, error = await service.handle("POST", "/sessions", json.dumps(payload).encode())
+                    self.assertEqual(status, 400, error)
+                with self.assertRaises(ValueError):
+                    GroupService(os.path.join(directory, "sitzungen"), executor=service.executor).roster_path(roster)
+                self.assertEqual((await service.handle("POST", "/sessions", b'{"id": "a"}'))[0], 409)
+                self.assertEqual((await service.handle("DELETE", "/sessions/a", b""))[0], 200)
+                self.assertEqual((await service.handle("GET", "/sessions/a", b""))[0], 404)
+            finally:
+                service.close()
+
+        with tempfile.TemporaryDirectory() as directory:
+            asyncio.run(scenario(directory))
+
+    def test_concurrent_requests(self):
+        """Testet gleichzeitige Anfragen: doppelte IDs, wartende Runden und Auslagern."""
+        async def scenario(directory):
+            service = GroupService(directory, max_sessions=1, inline_limit=0)
+            try:
+                body = json.dumps({"id": "a", "num_students": 30}).encode()
+                statuses = [status for status, _ in await asyncio.gather(
+                    *(service.handle("POST", "/sessions", body) for _ in range(3)))]
+                self.assertEqual(sorted(statuses), [201, 409, 409])
+
+                # Runden in "a" warten auf die Sperre, während neue Sitzungen "a" verdrängen wollen
+                requests = [service.handle("POST", "/sessions/a/rounds", b"") for _ in range(5)]
+                requests += [service.handle("POST", "/sessions", b'{"num_students": 6}') for _ in range(3)]
+                requests += [service.handle("GET", "/sessions/a/rounds/1", b"")]
+                results = await asyncio.gather(*requests)
+                self.assertEqual(sorted(response["round"] for _, response in results[:5]), [1, 2, 3, 4, 5])
+                self.assertEqual([status for status, _ in results[5:8]], [201, 201, 201])
+                self.assertEqual(results[8][0], 200)
+                self.assertEqual(len(service.sessions), 1)
+
+                status, described = await service.handle("GET", "/sessions/a", b"")
+                self.assertEqual((status, described["rounds"]), (200, 5))
+            finally:
+                service.close()
+
+        with tempfile.TemporaryDirectory() as directory:
+            asyncio.run(scenario(directory))
+
+    def test_http(self):
+        """Testet Anfragen über eine echte Verbindung mit Keep-Alive."""
+        async def request(reader, writer, method, path, payload=None):
+            body = json.dumps(payload).encode() if payload is not None else b""
+            writer.write(f"{method} {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+            status = int((await reader.readline()).split()[1])
+            headers = {}
+            while (line := await reader.readline()) != b"\r\n":
+                name, _, value = line.decode().partition(":")
+                headers[name.lower()] = value.strip()
+            return status, json.loads(await reader.readexactly(int(headers["content-length"])))
+
+        async def scenario(directory):
+            service = GroupService(directory)
+            server = await service.serve(port=0)
+            try:
+                reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+                status, session = await request(reader, writer, "POST", "/sessions", {"num_students": 12, "seed": 1})
+                self.assertEqual(status, 201)
+                rounds = [await request(reader, writer, "POST", f"/sessions/{session['id']}/rounds") for _ in range(3)]
+                self.assertEqual([response["round"] for _, response in rounds], [1, 2, 3])
+                self.assertEqual((await request(reader, writer, "GET", "/stats"))[1]["rounds"], 3)
+                writer.close()
+            finally:
+                server.close()
+                await server.wait_closed()
+                service.close()
+
+        with tempfile.TemporaryDirectory() as directory:
+            asyncio.run(scenario(directory))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file